@@ -16,7 +16,7 @@ import arcade
 import math
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, cast, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 # Prevents circular import error by setting this variable False at runtime
 if TYPE_CHECKING:
@@ -40,6 +40,58 @@ ASSETS_BASE_PATH = Path(__file__).parent.parent.parent / "assets"
 IMAGES_BASE_PATH = ASSETS_BASE_PATH / "images"
 AUDIO_BASE_PATH = ASSETS_BASE_PATH / "audio"
 
+# Sounds of every sound file loaded so far, shared by all sprites that play the same sound
+SOUND_CACHE = {}
+
+
+def get_sound(sound_file: str) -> arcade.Sound:
+    """
+    Returns the sound of a sound file, loading the file only the first time it is used
+
+    :param sound_file: path of the sound file
+    :return: the sound
+    """
+    sound = SOUND_CACHE.get(sound_file)
+    if sound is None:
+        sound = SOUND_CACHE[sound_file] = arcade.Sound(sound_file)
+    return sound
+
+
+def load_background_music(music_file: str) -> arcade.Sound:
+    """
+    Returns a streaming sound of a music file that starts again by itself when it ends
+
+    :param music_file: path of the music file
+    :return: the music
+    """
+    music = arcade.Sound(music_file, streaming=True)
+
+    # arcade.Sound has no looping option, so set it on the underlying stream. The stream
+    # does not exist if sound support could not be initialized
+    if hasattr(music, "wav_file"):
+        music.wav_file.set_looping(True)
+    return music
+
+
+# Cosine and sine of every velocity angle used so far. The ball only ever travels at
+# a small range of angles (determined by where it hits the paddle), and the angles are
+# rounded to a tenth of a degree, so this stays small
+TRIG_CACHE = {}
+
+
+def get_cos_and_sin(angle: float) -> tuple:
+    """
+    Returns the cosine and sine of an angle, calculating them only once per angle
+
+    :param angle: angle in degrees
+    :return: (cos, sin) of the angle
+    """
+    angle = round(angle, 1)
+    trig = TRIG_CACHE.get(angle)
+    if trig is None:
+        trig = TRIG_CACHE[angle] = (math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+    return trig
+
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
@@ -53,6 +105,15 @@ class Ball(arcade.Sprite, ABC):
     Base class for all balls
     """
 
+    # arcade.Sprite doesn't define __slots__, so balls still get a __dict__, but the
+    # attributes read in the collision code are stored in slots
+    __slots__ = ("is_invincible", "boundary", "brick_list", "level", "velocity_angle", "ball_speed",
+                 "speed_increment", "speed_decrement")
+
+    # Image of the ball, loaded into a texture that is shared by all balls of the same type
+    image = ""
+    shared_texture: Optional[arcade.Texture] = None
+
     def __init__(self,
                  boundary: Boundary,
                  brick_list: arcade.SpriteList,
@@ -62,7 +123,8 @@ class Ball(arcade.Sprite, ABC):
         Creates a ball from an image
 
         :param boundary: boundary which the ball will collide with
-        :param brick_list: bricks which the ball will collide with
+        :param brick_list: bricks which the ball will collide with. The list should be created
+            with use_spatial_hash=True so that collision checks only test nearby bricks
         :param level: allows editing of level and window attributes
         """
         super().__init__(**kwargs)
@@ -84,39 +146,50 @@ class Ball(arcade.Sprite, ABC):
         self.speed_increment = self.speed_decrement = 50
         self.set_velocity()
 
-    @abstractmethod
     def initialize_texture(self):
         """
-        Override in subclasses to set the ball texture
+        Sets the ball texture from the image of the ball type. The texture is only
+        loaded when the first ball of that type is created
         """
-        pass
+        ball_type = type(self)
+
+        # Checking the class dictionary prevents sharing a parent's texture with a sub-class
+        if "shared_texture" not in vars(ball_type):
+            ball_type.shared_texture = arcade.load_texture(self.image)
+        self.texture = ball_type.shared_texture
 
     def set_velocity(self):
         """
         Calculates the velocity of the ball from ball_speed and velocity_angle
         """
         # Ensure the ball speed is within the limits
-        self.ball_speed = BALL_MAX_SPEED if self.ball_speed > BALL_MAX_SPEED else BALL_MIN_SPEED if \
-            self.ball_speed < BALL_MIN_SPEED else self.ball_speed
+        self.ball_speed = min(BALL_MAX_SPEED, max(BALL_MIN_SPEED, self.ball_speed))
 
-        self.change_x = self.ball_speed * math.cos(math.radians(self.velocity_angle))
-        self.change_y = self.ball_speed * math.sin(math.radians(self.velocity_angle))
+        cos, sin = get_cos_and_sin(self.velocity_angle)
+        self.change_x = self.ball_speed * cos
+        self.change_y = self.ball_speed * sin
 
     def change_velocity(self):
         """
         Changes the ball velocity based on where it has hit the paddle
         """
+        paddle = self.level.paddle
+
         # Get the x position where the ball has hit the paddle
-        difference = self.center_x - self.level.paddle.left
+        difference = self.center_x - paddle.left
 
-        width = self.level.paddle.width
+        width = paddle.width
         middle = 20  # This is considered to be the width of the middle part of the paddle
         lowest_angle = 25
         highest_angle = 70
         highest_speed = 40
 
+        # Edges of the middle part of the paddle
+        middle_left = (width - middle) / 2
+        middle_right = (width + middle) / 2
+
         # Hits the left side
-        if difference < width / 2 - middle / 2:
+        if difference < middle_left:
             angle = lowest_angle + difference
             angle = highest_angle if angle > highest_angle else angle
 
@@ -124,7 +197,7 @@ class Ball(arcade.Sprite, ABC):
             self.ball_speed += highest_speed - difference
 
         # Hits the middle
-        elif width / 2 - middle / 2 <= difference <= width / 2 + middle / 2:
+        elif difference <= middle_right:
 
             # If the ball is moving to the right, let it continue moving right
             if self.change_x > 0:
@@ -148,118 +221,131 @@ class Ball(arcade.Sprite, ABC):
 
         :param delta_time: elapsed time since last update
         """
-        # Update the x position of the ball and check for collisions
-        self.center_x += int(self.change_x * delta_time)
+        # Update the x position of the ball and check for collisions. The bricks are
+        # scanned once per axis and the hit list is only resolved if a brick was hit
+        self.center_x += self.change_x * delta_time
         self.collides_with_boundary_moving_horizontally()
-        self.collides_with_brick_moving_horizontally()
+        hit_list: List[Brick] = arcade.check_for_collision_with_list(self, self.brick_list)
+        if hit_list:
+            self.collides_with_brick_moving_horizontally(hit_list)
         self.collides_with_paddle_moving_horizontally()
 
         # Update the y position of the ball and check for collisions
-        self.center_y += int(self.change_y * delta_time)
+        self.center_y += self.change_y * delta_time
         self.collides_with_boundary_moving_vertically()
-        self.collides_with_brick_moving_vertically()
+        hit_list: List[Brick] = arcade.check_for_collision_with_list(self, self.brick_list)
+        if hit_list:
+            self.collides_with_brick_moving_vertically(hit_list)
         self.collides_with_paddle_moving_vertically()
 
     def collides_with_boundary_moving_horizontally(self):
         """
         Changes the x direction of the ball if it collides with boundary
         """
+        # The boundary geometry never changes, so only look it up once per check
+        boundary = self.boundary
+        inner_right = boundary.inner_right
+        inner_left = boundary.inner_left
+
         # Right boundary
-        if self.right > self.boundary.inner_right:
-            self.right = self.boundary.inner_right
+        if self.right > inner_right:
+            self.right = inner_right
             self.change_x *= -1
 
             # Only play sound when we are in a level
             if self.level is not None:
-                self.boundary.side_hit_sound.play(volume=NORMAL_VOLUME, pan=1)
+                boundary.side_hit_sound.play(volume=NORMAL_VOLUME, pan=1)
 
         # Left boundary
-        elif self.left < self.boundary.inner_left:
-            self.left = self.boundary.inner_left
+        elif self.left < inner_left:
+            self.left = inner_left
             self.change_x *= -1
 
             # Only play sound when we are in a level
             if self.level is not None:
-                self.boundary.side_hit_sound.play(volume=NORMAL_VOLUME, pan=-1)
+                boundary.side_hit_sound.play(volume=NORMAL_VOLUME, pan=-1)
 
     def collides_with_boundary_moving_vertically(self):
         """
         Changes the y direction of the ball if it collides with boundary
         """
+        # The boundary geometry never changes, so only look it up once per check
+        boundary = self.boundary
+        inner_top = boundary.inner_top
+        inner_bottom = boundary.inner_bottom
+
         # Top boundary
-        if self.top > self.boundary.inner_top:
-            self.top = self.boundary.inner_top
+        if self.top > inner_top:
+            self.top = inner_top
             self.change_y *= -1
 
             # Only play sound when we are in a level
             if self.level is not None:
-                self.boundary.top_hit_sound.play(volume=NORMAL_VOLUME)
+                boundary.top_hit_sound.play(volume=NORMAL_VOLUME)
 
         # Bottom boundary
         # Only bounce up if we are in debugging mode or in fullscreen mode
-        elif (DEBUGGING or self.boundary.is_fullscreen) and self.bottom < self.boundary.inner_bottom:
-            self.bottom = self.boundary.inner_bottom
+        elif (DEBUGGING or boundary.is_fullscreen) and self.bottom < inner_bottom:
+            self.bottom = inner_bottom
             self.change_y *= -1
 
             # Only play sound when we are in a level
             if self.level is not None:
-                self.boundary.bottom_hit_sound.play(volume=NORMAL_VOLUME)
+                boundary.bottom_hit_sound.play(volume=NORMAL_VOLUME)
 
         # If the ball goes below boundary, remove it from list
-        elif self.top < self.boundary.inner_bottom:
+        elif self.top < inner_bottom:
             self.remove_from_sprite_lists()
 
-    def collides_with_brick_moving_horizontally(self):
+    def collides_with_brick_moving_horizontally(self, hit_list: List[Brick]):
         """
         Changes the x direction of the ball if it collides with brick
-        """
-        hit_list = cast(List[Brick], self.collides_with_list(self.brick_list))
 
+        :param hit_list: bricks that the ball is currently colliding with
+        """
         # If the ball hits a brick, change its x direction only once
-        if hit_list:
-            brick = hit_list[0]
+        brick = hit_list[0]
 
-            # Prevents the ball from changing direction if it collides with safety barrier
-            # moving horizontally (if safety barrier is created at the same instant that the
-            # ball is going down - observed as a bug)
-            if not brick.is_safety_barrier:
-                # Check if ball hit the left or right side of brick
-                if self.change_x > 0:
-                    self.right = brick.left
-                else:
-                    self.left = brick.right
+        # Prevents the ball from changing direction if it collides with safety barrier
+        # moving horizontally (if safety barrier is created at the same instant that the
+        # ball is going down - observed as a bug)
+        if not brick.is_safety_barrier:
+            # Check if ball hit the left or right side of brick
+            if self.change_x > 0:
+                self.right = brick.left
+            else:
+                self.left = brick.right
 
-                # Change direction only once
-                self.change_x *= -1
+            # Change direction only once
+            self.change_x *= -1
 
-            # Only change the texture of the bricks if we are in a level
-            if self.level is not None:
-                for brick in hit_list:
-                    brick.change_properties()
+        # Only change the texture of the bricks if we are in a level
+        if self.level is not None:
+            for brick in hit_list:
+                brick.change_properties()
 
-    def collides_with_brick_moving_vertically(self):
+    def collides_with_brick_moving_vertically(self, hit_list: List[Brick]):
         """
         Changes the y direction of the ball if it collides with brick
-        """
-        hit_list = cast(List[Brick], self.collides_with_list(self.brick_list))
 
+        :param hit_list: bricks that the ball is currently colliding with
+        """
         # If the ball hits a brick, change its y direction only once
-        if hit_list:
-            brick = hit_list[0]
+        brick = hit_list[0]
 
-            # Check if ball hit the bottom or top side of brick
-            if self.change_y > 0:
-                self.top = brick.bottom
-            else:
-                self.bottom = brick.top
+        # Check if ball hit the bottom or top side of brick
+        if self.change_y > 0:
+            self.top = brick.bottom
+        else:
+            self.bottom = brick.top
 
-            # Change direction only once
-            self.change_y *= -1
+        # Change direction only once
+        self.change_y *= -1
 
-            # Only change the texture of the bricks if we are in a level
-            if self.level is not None:
-                for brick in hit_list:
-                    brick.change_properties()
+        # Only change the texture of the bricks if we are in a level
+        if self.level is not None:
+            for brick in hit_list:
+                brick.change_properties()
 
     def collides_with_paddle_moving_horizontally(self):
         """
@@ -267,35 +353,40 @@ class Ball(arcade.Sprite, ABC):
         """
         # Only check for collision with paddle if we are in a level
         if self.level is not None:
-            if self.collides_with_sprite(self.level.paddle):
-                self.level.paddle.hit_sound.play(volume=NORMAL_VOLUME)
+            paddle = self.level.paddle
+
+            if self.collides_with_sprite(paddle):
+                paddle.hit_sound.play(volume=NORMAL_VOLUME)
 
                 # Check if ball hit the left or right side of paddle. This part
                 # is a little tricky because both the ball and paddle can move
+                change_x = self.change_x
+                center_x = self.center_x
+                paddle_center_x = paddle.center_x
 
                 # Ball is moving to the left and hits the left side of paddle
                 # Checking "self.center_x < self.level.paddle.left" was found to have bugs
-                if self.change_x < 0 and self.center_x < self.level.paddle.center_x:
+                if change_x < 0 and center_x < paddle_center_x:
                     self.velocity_angle = 180 + 15
                     self.ball_speed += 100
                     self.set_velocity()
 
                 # Ball is moving to the right and hits the right side of paddle
-                elif self.change_x > 0 and self.center_x > self.level.paddle.center_x:
+                elif change_x > 0 and center_x > paddle_center_x:
                     self.velocity_angle = -15
                     self.ball_speed += 100
                     self.set_velocity()
 
                 # Ball is moving to the right and hits the left side of paddle
                 # No need to repeat checking the ball position
-                elif self.change_x > 0:
-                    self.right = self.level.paddle.left
-                    self.change_x *= -1
+                elif change_x > 0:
+                    self.right = paddle.left
+                    self.change_x = -change_x
 
                 # Ball is moving to the left and hits right side of paddle
-                elif self.change_x < 0:
-                    self.left = self.level.paddle.right
-                    self.change_x *= -1
+                elif change_x < 0:
+                    self.left = paddle.right
+                    self.change_x = -change_x
 
     def collides_with_paddle_moving_vertically(self):
         """
@@ -303,34 +394,37 @@ class Ball(arcade.Sprite, ABC):
         """
         # Only check for collision with paddle if we are in a level
         if self.level is not None:
-            if self.collides_with_sprite(self.level.paddle):
-                self.level.paddle.hit_sound.play(volume=NORMAL_VOLUME)
+            paddle = self.level.paddle
+
+            if self.collides_with_sprite(paddle):
+                paddle.hit_sound.play(volume=NORMAL_VOLUME)
 
                 # This part is also a little tricky because the ball could collide with
                 # the side of the paddle while moving vertically
+                change_y = self.change_y
+                paddle_top = paddle.top
+                is_moving_down_beside_paddle = change_y < 0 and self.center_y < paddle_top
 
                 # Ball is moving down and hits the left side of the paddle
-                if self.change_y < 0 and self.center_y < self.level.paddle.top and \
-                        self.center_x < self.level.paddle.left:
+                if is_moving_down_beside_paddle and self.center_x < paddle.left:
                     self.velocity_angle = 180 + 15
                     self.ball_speed += 100
                     self.set_velocity()
 
                 # Ball is moving down and hits the right side of the paddle
-                elif self.change_y < 0 and self.center_y < self.level.paddle.top and \
-                        self.center_x > self.level.paddle.right:
+                elif is_moving_down_beside_paddle and self.center_x > paddle.right:
                     self.velocity_angle = -15
                     self.ball_speed += 100
                     self.set_velocity()
 
                 # If the ball hits the bottom of the paddle, change its direction
-                elif self.change_y > 0:
-                    self.top = self.level.paddle.bottom
-                    self.change_y *= -1
+                elif change_y > 0:
+                    self.top = paddle.bottom
+                    self.change_y = -change_y
 
                 # If the ball hits the top side, change its properties
-                elif self.change_y < 0:
-                    self.bottom = self.level.paddle.top
+                elif change_y < 0:
+                    self.bottom = paddle_top
                     self.change_properties()
 
     def change_properties(self):
@@ -347,8 +441,7 @@ class Ball(arcade.Sprite, ABC):
 
         # Makes the ball magnetic or bounces it normally
         if self.level.paddle.is_magnetic:
-            magnetic_ball = ball.convert_to(MagneticInvinciBall) if ball.is_invincible else \
-                ball.convert_to(MagneticNormalBall)
+            magnetic_ball = ball.convert_to(MAGNETIC_BALL_TYPES[ball.is_invincible])
             self.level.paddle.magnetic_ball_list.append(magnetic_ball)
         else:
             ball.change_velocity()
@@ -399,21 +492,19 @@ class Ball(arcade.Sprite, ABC):
 
         :param action: 'increase' or 'decrease'
         """
-        # Make a copy of the current velocity to allow ball to move in the same direction
-        current_change_x = self.change_x
-        current_change_y = self.change_y
+        previous_speed = self.ball_speed
 
         if action == "increase":
             self.ball_speed += self.speed_increment
         elif action == "decrease":
             self.ball_speed -= self.speed_decrement
-        self.set_velocity()
+        self.ball_speed = min(BALL_MAX_SPEED, max(BALL_MIN_SPEED, self.ball_speed))
 
-        # Ensure the ball moves in the same direction as before
-        if (current_change_x < 0 and self.change_x > 0) or (current_change_x > 0 and self.change_x < 0):
-            self.change_x *= -1
-        if (current_change_y < 0 and self.change_y) > 0 or (current_change_y > 0 and self.change_y < 0):
-            self.change_y *= -1
+        # Scale the current velocity rather than recalculating it from velocity_angle. This
+        # ensures the ball moves in the same direction as before
+        ratio = self.ball_speed / previous_speed
+        self.change_x *= ratio
+        self.change_y *= ratio
 
 
 class NormalBall(Ball):
@@ -421,8 +512,7 @@ class NormalBall(Ball):
     Normal white ball
     """
 
-    def initialize_texture(self):
-        self.texture = arcade.load_texture(f"{IMAGES_BASE_PATH}/balls/normal_ball.png")
+    image = f"{IMAGES_BASE_PATH}/balls/normal_ball.png"
 
 
 class InvinciBall(Ball):
@@ -430,20 +520,25 @@ class InvinciBall(Ball):
     Ball that does not change direction when it hits a breakable brick
     """
 
+    image = f"{IMAGES_BASE_PATH}/balls/invincible_ball.png"
+
     def initialize_texture(self):
-        self.texture = arcade.load_texture(f"{IMAGES_BASE_PATH}/balls/invincible_ball.png")
+        super().initialize_texture()
         self.is_invincible = True
 
-    def collides_with_brick_moving_horizontally(self):
+    def collides_with_brick_moving_horizontally(self, hit_list: List[Brick]):
         """
         Only changes the x direction of the ball if it collides with unbreakable brick
+
+        :param hit_list: bricks that the ball is currently colliding with
         """
-        hit_list = cast(List[Brick], self.collides_with_list(self.brick_list))
+        is_in_level = self.level is not None
+        has_bounced = False
 
-        # If the ball hits unbreakable brick, change its x direction only once
         for brick in hit_list:
+            # If the ball hits unbreakable brick, change its x direction only once.
             # If it hits safety barrier moving horizontally, don't change direction
-            if not brick.is_breakable and not brick.is_safety_barrier:
+            if not has_bounced and not brick.is_breakable and not brick.is_safety_barrier:
                 # Check if ball hit the left or right side of brick
                 if self.change_x > 0:
                     self.right = brick.left
@@ -452,24 +547,26 @@ class InvinciBall(Ball):
 
                 # Change direction for both cases
                 self.change_x *= -1
-                break
+                has_bounced = True
 
-        # Only change the texture of the bricks if we are in a level
-        if self.level is not None:
-            for brick in hit_list:
+            # Only change the texture of the bricks if we are in a level
+            if is_in_level:
                 brick.change_properties()
 
-    def collides_with_brick_moving_vertically(self):
+    def collides_with_brick_moving_vertically(self, hit_list: List[Brick]):
         """
         Only changes the y direction of the ball if it collides with unbreakable brick
+
+        :param hit_list: bricks that the ball is currently colliding with
         """
-        hit_list = cast(List[Brick], self.collides_with_list(self.brick_list))
+        is_in_level = self.level is not None
+        has_bounced = False
 
-        # If the ball hits an unbreakable brick or the safety barrier,
-        # change its y direction only once
         for brick in hit_list:
-            # If it hits safety barrier moving vertically, change its direction
-            if not brick.is_breakable or brick.is_safety_barrier:
+            # If the ball hits an unbreakable brick or the safety barrier, change its
+            # y direction only once. If it hits safety barrier moving vertically, change
+            # its direction
+            if not has_bounced and (not brick.is_breakable or brick.is_safety_barrier):
                 # Check if ball hit the bottom or top side of brick
                 if self.change_y > 0:
                     self.top = brick.bottom
@@ -478,11 +575,10 @@ class InvinciBall(Ball):
 
                 # Change direction for both cases
                 self.change_y *= -1
-                break
+                has_bounced = True
 
-        # Only change the texture of the bricks if we are in a level
-        if self.level is not None:
-            for brick in hit_list:
+            # Only change the texture of the bricks if we are in a level
+            if is_in_level:
                 brick.change_properties()
 
 
@@ -500,21 +596,21 @@ class MagneticNormalBall(NormalBall):
         # may overhang). Also, DO NOT replace the code block below with "self.change_x =
         # self.level.paddle.change_x" as this also causes the unintended motion.
 
-        # Move the ball similar to the paddle
-        self.change_x = 0
-        if self.level.left_pressed and not self.level.right_pressed:
-            self.change_x = -self.level.paddle.paddle_speed
-        elif self.level.right_pressed and not self.level.left_pressed:
-            self.change_x = self.level.paddle.paddle_speed
+        paddle = self.level.paddle
+
+        # Move the ball similar to the paddle: -1 for left, 1 for right and 0 if both
+        # or neither are pressed
+        direction = self.level.right_pressed - self.level.left_pressed
 
         # Prevent the ball from sliding across the paddle when paddle collides with boundary
-        if self.level.paddle.left == self.boundary.inner_left and self.level.left_pressed or \
-                self.level.paddle.right == self.boundary.inner_right and self.level.right_pressed:
-            self.change_x = 0
+        is_blocked = direction < 0 and paddle.left <= self.boundary.inner_left or \
+            direction > 0 and paddle.right >= self.boundary.inner_right
+
+        self.change_x = 0 if is_blocked else direction * paddle.paddle_speed
 
         # Only update if the paddle/ball has velocity
         if self.change_x != 0:
-            self.center_x += int(self.change_x * delta_time)
+            self.center_x += self.change_x * delta_time
             self.collides_with_boundary_moving_horizontally()
 
 
@@ -523,11 +619,19 @@ class MagneticInvinciBall(MagneticNormalBall):
     Invincible version of magnetic normal ball
     """
 
+    image = f"{IMAGES_BASE_PATH}/balls/invincible_ball.png"
+
     def initialize_texture(self):
-        self.texture = arcade.load_texture(f"{IMAGES_BASE_PATH}/balls/invincible_ball.png")
+        super().initialize_texture()
         self.is_invincible = True
 
 
+# Type of ball that a ball converts to when it becomes magnetic or non-magnetic, keyed by
+# whether the ball is invincible
+NON_MAGNETIC_BALL_TYPES = {False: NormalBall, True: InvinciBall}
+MAGNETIC_BALL_TYPES = {False: MagneticNormalBall, True: MagneticInvinciBall}
+
+
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 #                                            PADDLES
@@ -540,6 +644,14 @@ class Paddle(arcade.Sprite, ABC):
     Base class for paddles
     """
 
+    __slots__ = ("level", "paddle_speed", "is_magnetic", "activate_shooter", "invincible_balls", "split_balls",
+                 "magnetic_ball_list")
+
+    # Image of the paddle, loaded into a texture that is shared by all paddles of the same type
+    image = ""
+    shared_texture: Optional[arcade.Texture] = None
+    hit_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/hit_paddle.wav")
+
     def __init__(self, level: Level, **kwargs):
         """
         Creates a paddle from an image
@@ -556,8 +668,6 @@ class Paddle(arcade.Sprite, ABC):
         self.center_y = self.level.boundary.inner_bottom + 20
         self.paddle_speed = PADDLE_SPEED
 
-        self.hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/hit_paddle.wav")
-
         self.is_magnetic = False
         self.activate_shooter = False
         self.invincible_balls = 0
@@ -565,12 +675,17 @@ class Paddle(arcade.Sprite, ABC):
 
         self.magnetic_ball_list: List[Ball] = []
 
-    @abstractmethod
     def initialize_texture(self):
         """
-        Override in subclasses to set the ball texture
+        Sets the paddle texture from the image of the paddle type. The texture is only
+        loaded when the first paddle of that type is created
         """
-        pass
+        paddle_type = type(self)
+
+        # Checking the class dictionary prevents sharing a parent's texture with a sub-class
+        if "shared_texture" not in vars(paddle_type):
+            paddle_type.shared_texture = arcade.load_texture(self.image)
+        self.texture = paddle_type.shared_texture
 
     def on_update(self, delta_time: float = 1 / 60):
         """
@@ -587,7 +702,7 @@ class Paddle(arcade.Sprite, ABC):
 
         # Only update and check for collision with boundary if the paddle has velocity
         if self.change_x != 0:
-            self.center_x += int(self.change_x * delta_time)
+            self.center_x += self.change_x * delta_time
             self.collides_with_boundary()
 
     def collides_with_boundary(self):
@@ -604,7 +719,7 @@ class Paddle(arcade.Sprite, ABC):
         Converts magnetic balls to non-magnetic balls which allows them to move
         """
         for ball in self.magnetic_ball_list:
-            new_ball = ball.convert_to(InvinciBall) if ball.is_invincible else ball.convert_to(NormalBall)
+            new_ball = ball.convert_to(NON_MAGNETIC_BALL_TYPES[ball.is_invincible])
             new_ball.change_velocity()
 
             # If possible, splits the ball into two
@@ -628,29 +743,23 @@ class Paddle(arcade.Sprite, ABC):
 
 
 class NormalPaddle(Paddle):
-    def initialize_texture(self):
-        self.texture = arcade.load_texture(f"{IMAGES_BASE_PATH}/paddles/normal_paddle.png")
+    image = f"{IMAGES_BASE_PATH}/paddles/normal_paddle.png"
 
 
 class LongPaddle(Paddle):
-    def initialize_texture(self):
-        self.texture = arcade.load_texture(f"{IMAGES_BASE_PATH}/paddles/long_paddle.png")
+    image = f"{IMAGES_BASE_PATH}/paddles/long_paddle.png"
 
 
 class ShortPaddle(Paddle):
-    def initialize_texture(self):
-        self.texture = arcade.load_texture(f"{IMAGES_BASE_PATH}/paddles/short_paddle.png")
+    image = f"{IMAGES_BASE_PATH}/paddles/short_paddle.png"
 
 
 class DemoPaddle(Paddle):
     """
-    Base class for demo paddles
+    Base class for demo paddles. The image of the specific paddle is obtained
+    based on the MRO of sub-class
     """
 
-    def initialize_texture(self):
-        # Initializes the specific paddle based on the MRO of sub-class
-        super().initialize_texture()
-
     def on_update(self, delta_time: float = 1 / 60):
         """
         Moves the paddle similar to the ball
@@ -680,6 +789,16 @@ class DemoShortPaddle(DemoPaddle, ShortPaddle):
     pass
 
 
+# Type of paddle that a paddle changes to when it is lengthened or shortened. Demo paddles
+# change to demo paddles
+LENGTHENED_PADDLE_TYPES = {ShortPaddle: NormalPaddle, NormalPaddle: LongPaddle, LongPaddle: LongPaddle,
+                           DemoShortPaddle: DemoNormalPaddle, DemoNormalPaddle: DemoLongPaddle,
+                           DemoLongPaddle: DemoLongPaddle}
+SHORTENED_PADDLE_TYPES = {LongPaddle: NormalPaddle, NormalPaddle: ShortPaddle, ShortPaddle: ShortPaddle,
+                          DemoLongPaddle: DemoNormalPaddle, DemoNormalPaddle: DemoShortPaddle,
+                          DemoShortPaddle: DemoShortPaddle}
+
+
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 
 #                                             BRICKS
@@ -692,6 +811,19 @@ class Brick(arcade.Sprite, ABC):
     Base class for all bricks
     """
 
+    __slots__ = ("level", "has_been_hit", "is_safety_barrier", "icon")
+
+    # Image files that will be converted to textures. Set once per brick type so that the
+    # textures are shared by all bricks with the same images
+    images = ()
+    texture_lists = {}
+    hit_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/hit_brick.wav")
+
+    # Properties of the brick type, overridden by sub-classes
+    is_breakable = True
+    score = 0
+    letter = ""
+
     def __init__(self, level: Level = None, **kwargs):
         """
         Initialize brick attributes
@@ -701,37 +833,23 @@ class Brick(arcade.Sprite, ABC):
         super().__init__(**kwargs)
         self.level = level
 
-        self.is_breakable = True
-        self.has_been_hit = False  # Used to ensure a brick is not hit more than once in one go
+        self.has_been_hit = False  # Used to ensure a brick is not hit more than once in one go, see Level
         self.is_safety_barrier = False  # For collision detection btn safety barrier and invincible ball
 
-        self.score = 0
-        self.letter = ""
         self.icon: Optional[Icon] = None
-        self.hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/hit_brick.wav")
 
-        self.images = []  # List of image files that will be converted to textures
-        self.initialize_textures()  # Sub-classes possibly override other attributes,
-        # hence must be last in __init__ call
+        self.initialize_textures()
 
-    @abstractmethod
     def initialize_textures(self):
         """
-        Override to populate the images list with the icon-image files. This parent
-        method converts those images to textures and sets the initial texture
+        Converts the images of the brick type to textures and sets the initial texture.
+        The texture list is only created for the first brick with those images
         """
-        self.textures = [arcade.load_texture(image) for image in self.images]
-        self.set_texture(self.cur_texture_index)
+        if self.images not in Brick.texture_lists:
+            Brick.texture_lists[self.images] = [arcade.load_texture(image) for image in self.images]
 
-    def update(self):
-        """
-        Prevents a brick from being hit more than once in one go. This would change the
-        texture more than once, increase the score more than once, etc.
-        """
-        # If the brick has been hit and is currently not being hit, allow it to be hit again
-        if self.has_been_hit and not self.collides_with_list(self.level.ball_list) and \
-                not self.collides_with_list(self.level.bullet_list):
-            self.has_been_hit = False
+        self.textures = Brick.texture_lists[self.images]
+        self.set_texture(self.cur_texture_index)
 
     def change_properties(self):
         """
@@ -772,113 +890,81 @@ class Brick(arcade.Sprite, ABC):
 
 
 class RedBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/red_brick.png"]
-        super().initialize_textures()
-        self.score = 100
+    images = (f"{IMAGES_BASE_PATH}/bricks/red_brick.png",)
+    score = 100
 
 
 class BlueBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/blue_brick.png"]
-        super().initialize_textures()
-        self.score = 100
+    images = (f"{IMAGES_BASE_PATH}/bricks/blue_brick.png",)
+    score = 100
 
 
 class GreenBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/green_brick.png"]
-        super().initialize_textures()
-        self.score = 100
+    images = (f"{IMAGES_BASE_PATH}/bricks/green_brick.png",)
+    score = 100
 
 
 class AquaBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/aqua_brick.png"]
-        super().initialize_textures()
-        self.score = 100
+    images = (f"{IMAGES_BASE_PATH}/bricks/aqua_brick.png",)
+    score = 100
 
 
 class GreyBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/grey_brick.png"]
-        super().initialize_textures()
-        self.score = 100
+    images = (f"{IMAGES_BASE_PATH}/bricks/grey_brick.png",)
+    score = 100
 
 
 class RedLineBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/red_brick_with_line.png"]
-        super().initialize_textures()
-        self.score = 150
+    images = (f"{IMAGES_BASE_PATH}/bricks/red_brick_with_line.png",)
+    score = 150
 
 
 class BlueLineBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/blue_brick_with_line.png"]
-        super().initialize_textures()
-        self.score = 150
+    images = (f"{IMAGES_BASE_PATH}/bricks/blue_brick_with_line.png",)
+    score = 150
 
 
 class GreenLineBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/green_brick_with_line.png"]
-        super().initialize_textures()
-        self.score = 150
+    images = (f"{IMAGES_BASE_PATH}/bricks/green_brick_with_line.png",)
+    score = 150
 
 
 class AquaLineBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/aqua_brick_with_line.png"]
-        super().initialize_textures()
-        self.score = 150
+    images = (f"{IMAGES_BASE_PATH}/bricks/aqua_brick_with_line.png",)
+    score = 150
 
 
 class GreyLineBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/grey_brick_with_line.png"]
-        super().initialize_textures()
-        self.score = 150
+    images = (f"{IMAGES_BASE_PATH}/bricks/grey_brick_with_line.png",)
+    score = 150
 
 
 class PinkBrick2(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/pink_brick_1.png",
-                       f"{IMAGES_BASE_PATH}/bricks/pink_brick_2.png"]
-
-        # Shorten the image list for sub-classes
-        if isinstance(self, PinkBrick1):
-            self.images = self.images[1:]
-
-        super().initialize_textures()
-        self.score = 200
+    images = (f"{IMAGES_BASE_PATH}/bricks/pink_brick_1.png",
+              f"{IMAGES_BASE_PATH}/bricks/pink_brick_2.png")
+    score = 200
 
 
 class PinkBrick1(PinkBrick2):
     """
     A pink brick with only one image
     """
-    pass
 
+    images = PinkBrick2.images[1:]
 
-class RedBlueBrick2(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/red_blue_brick_1.png",
-                       f"{IMAGES_BASE_PATH}/bricks/red_blue_brick_2.png"]
 
-        # Shorten the image list for sub-classes
-        if isinstance(self, RedBlueBrick1):
-            self.images = self.images[1:]
-
-        super().initialize_textures()
-        self.score = 200
+class RedBlueBrick2(Brick):
+    images = (f"{IMAGES_BASE_PATH}/bricks/red_blue_brick_1.png",
+              f"{IMAGES_BASE_PATH}/bricks/red_blue_brick_2.png")
+    score = 200
 
 
 class RedBlueBrick1(RedBlueBrick2):
     """
     A red blue brick with only one image
     """
-    pass
+
+    images = RedBlueBrick2.images[1:]
 
 
 class MultiColouredBrick4(Brick):
@@ -886,176 +972,134 @@ class MultiColouredBrick4(Brick):
     A multi-coloured brick with all 4 images
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/multi_coloured_brick_1.png",
-                       f"{IMAGES_BASE_PATH}/bricks/multi_coloured_brick_2.png",
-                       f"{IMAGES_BASE_PATH}/bricks/multi_coloured_brick_3.png",
-                       f"{IMAGES_BASE_PATH}/bricks/multi_coloured_brick_4.png"]
-
-        # Shorten the image list for sub-classes
-        if isinstance(self, MultiColouredBrick3):
-            self.images = self.images[1:]
-        elif isinstance(self, MultiColouredBrick2):
-            self.images = self.images[2:]
-        elif isinstance(self, MultiColouredBrick1):
-            self.images = self.images[3:]
-
-        super().initialize_textures()
-        self.score = 200
+    images = (f"{IMAGES_BASE_PATH}/bricks/multi_coloured_brick_1.png",
+              f"{IMAGES_BASE_PATH}/bricks/multi_coloured_brick_2.png",
+              f"{IMAGES_BASE_PATH}/bricks/multi_coloured_brick_3.png",
+              f"{IMAGES_BASE_PATH}/bricks/multi_coloured_brick_4.png")
+    score = 200
 
 
 class MultiColouredBrick3(MultiColouredBrick4):
     """
     A multi-coloured brick with only 3 images
     """
-    pass
+
+    images = MultiColouredBrick4.images[1:]
 
 
 class MultiColouredBrick2(MultiColouredBrick4):
     """
     A multi-coloured brick with only 2 images
     """
-    pass
+
+    images = MultiColouredBrick4.images[2:]
 
 
 class MultiColouredBrick1(MultiColouredBrick4):
     """
     A multi-coloured brick with only 1 image
     """
-    pass
+
+    images = MultiColouredBrick4.images[3:]
 
 
 class UKFlagBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/uk_flag_brick.png"]
-        super().initialize_textures()
-        self.score = 250
+    images = (f"{IMAGES_BASE_PATH}/bricks/uk_flag_brick.png",)
+    score = 250
 
 
 class KenyanFlagBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/kenyan_flag_brick.png"]
-        super().initialize_textures()
-        self.score = 250
+    images = (f"{IMAGES_BASE_PATH}/bricks/kenyan_flag_brick.png",)
+    score = 250
 
 
 class CupBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/cup_brick.png"]
-        super().initialize_textures()
-        self.score = 250
+    images = (f"{IMAGES_BASE_PATH}/bricks/cup_brick.png",)
+    score = 250
 
 
 class BBBBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/bbb_brick.png"]
-        super().initialize_textures()
-        self.score = 250
+    images = (f"{IMAGES_BASE_PATH}/bricks/bbb_brick.png",)
+    score = 250
 
 
 class FNMBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/fnm_brick.png"]
-        super().initialize_textures()
-        self.score = 250
+    images = (f"{IMAGES_BASE_PATH}/bricks/fnm_brick.png",)
+    score = 250
 
 
 class SmilingBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/smiling_brick.png"]
-        super().initialize_textures()
-        self.score = 250
+    images = (f"{IMAGES_BASE_PATH}/bricks/smiling_brick.png",)
+    score = 250
 
 
 class FrowningBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/frowning_brick.png"]
-        super().initialize_textures()
-        self.score = 250
+    images = (f"{IMAGES_BASE_PATH}/bricks/frowning_brick.png",)
+    score = 250
 
 
 class LeftPointingGreyBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/left_pointing_grey_brick.png"]
-        super().initialize_textures()
-        self.score = 250
+    images = (f"{IMAGES_BASE_PATH}/bricks/left_pointing_grey_brick.png",)
+    score = 250
 
 
 class RightPointingGreyBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/right_pointing_grey_brick.png"]
-        super().initialize_textures()
-        self.score = 250
+    images = (f"{IMAGES_BASE_PATH}/bricks/right_pointing_grey_brick.png",)
+    score = 250
 
 
 class NormalWallBrick(Brick):
     """
     Normal wall brick without right-side extension
     """
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/normal_wall_brick.png"]
-        super().initialize_textures()
-        self.score = 50
+
+    images = (f"{IMAGES_BASE_PATH}/bricks/normal_wall_brick.png",)
+    score = 50
 
 
 class RightWallBrick(Brick):
     """
     Wall brick that is a bit larger and extends to the right to create seamless images
     """
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/right_wall_brick.png"]
-        super().initialize_textures()
-        self.score = 50
+
+    images = (f"{IMAGES_BASE_PATH}/bricks/right_wall_brick.png",)
+    score = 50
 
 
 class UnbreakableBrick(Brick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/unbreakable_brick.png"]
-        super().initialize_textures()
-        self.hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/hit_unbreakable_brick.wav")
-        self.is_breakable = False
+    images = (f"{IMAGES_BASE_PATH}/bricks/unbreakable_brick.png",)
+    hit_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/hit_unbreakable_brick.wav")
+    is_breakable = False
 
 
 class BonusBrick(Brick):
-    def initialize_textures(self):
-        super().initialize_textures()
-        self.hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/hit_bonus_brick.wav")
-        self.score = 100
+    hit_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/hit_bonus_brick.wav")
+    score = 100
 
 
 class BonusBBrick(BonusBrick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/bonus_b_brick.png"]
-        super().initialize_textures()
-        self.letter = "B"
+    images = (f"{IMAGES_BASE_PATH}/bricks/bonus_b_brick.png",)
+    letter = "B"
 
 
 class BonusOBrick(BonusBrick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/bonus_o_brick.png"]
-        super().initialize_textures()
-        self.letter = "O"
+    images = (f"{IMAGES_BASE_PATH}/bricks/bonus_o_brick.png",)
+    letter = "O"
 
 
 class BonusNBrick(BonusBrick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/bonus_n_brick.png"]
-        super().initialize_textures()
-        self.letter = "N"
+    images = (f"{IMAGES_BASE_PATH}/bricks/bonus_n_brick.png",)
+    letter = "N"
 
 
 class BonusUBrick(BonusBrick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/bonus_u_brick.png"]
-        super().initialize_textures()
-        self.letter = "U"
+    images = (f"{IMAGES_BASE_PATH}/bricks/bonus_u_brick.png",)
+    letter = "U"
 
 
 class BonusSBrick(BonusBrick):
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/bricks/bonus_s_brick.png"]
-        super().initialize_textures()
-        self.letter = "S"
+    images = (f"{IMAGES_BASE_PATH}/bricks/bonus_s_brick.png",)
+    letter = "S"
 
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -1070,9 +1114,7 @@ class ParanoidIntroBrick(Brick):
     Used in the game intro view
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/boundaries/paranoid_intro_brick.png"]
-        super().initialize_textures()
+    images = (f"{IMAGES_BASE_PATH}/boundaries/paranoid_intro_brick.png",)
 
 
 class MenuBrick(Brick):
@@ -1080,9 +1122,7 @@ class MenuBrick(Brick):
     Used in the pause and main menu views
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/boundaries/menu_boundary.png"]
-        super().initialize_textures()
+    images = (f"{IMAGES_BASE_PATH}/boundaries/menu_boundary.png",)
 
 
 class LeaderBoardBrick(Brick):
@@ -1090,9 +1130,7 @@ class LeaderBoardBrick(Brick):
     Used in the high scores view
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/boundaries/leader_board_brick.png"]
-        super().initialize_textures()
+    images = (f"{IMAGES_BASE_PATH}/boundaries/leader_board_brick.png",)
 
 
 class HighScoresBrick(Brick):
@@ -1100,9 +1138,7 @@ class HighScoresBrick(Brick):
     Used in the high scores view
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/boundaries/high_scores_brick.png"]
-        super().initialize_textures()
+    images = (f"{IMAGES_BASE_PATH}/boundaries/high_scores_brick.png",)
 
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -1117,6 +1153,20 @@ class Icon(arcade.Sprite, ABC):
     Base class for all icons
     """
 
+    __slots__ = ("level", "frame_count", "next_animation_frame", "frame_sequence_index", "lowest_top")
+
+    # Image files that will be converted to textures, and the sound played when the icon is
+    # collected. Set once per icon type and shared by all icons of that type
+    images = ()
+    hit_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/collect_icon_tone.wav")
+
+    # Order in which the textures are shown in the animation, as indices into the images.
+    # Left empty, the images are shown in the order they are listed
+    frame_sequence = ()
+
+    # Number of frames each texture is shown for, overridden by sub-classes
+    frames_per_update = 5
+
     def __init__(self, level: Level = None, **kwargs):
         """
         Creates an icon from a list of images
@@ -1127,22 +1177,25 @@ class Icon(arcade.Sprite, ABC):
         self.level = level
 
         self.frame_count = 0
-        self.frames_per_update = 5
         self.change_y = -ICON_SPEED
-        self.hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/collect_icon_tone.wav")
 
-        self.images = []  # List of image files that will be converted to textures
-        self.initialize_textures()  # Sub-classes possibly override other attributes,
-        # hence must be last in __init__ call
+        # The playing field does not change during a level, so look up where icons leave it once
+        self.lowest_top = self.level.boundary.inner_bottom if self.level is not None else 0
+
+        self.initialize_textures()
+
+        # Frame count at which the next texture is shown
+        self.next_animation_frame = self.frames_per_update
+        self.frame_sequence_index = 0
 
-    @abstractmethod
     def initialize_textures(self):
         """
-        Override to populate the images list with the icon-image files. This parent
-        method converts those images to textures and sets the initial texture
+        Converts the images of the icon type to textures and sets the initial texture
         """
         self.textures = [arcade.load_texture(image) for image in self.images]
-        self.set_texture(self.cur_texture_index)
+        if not self.frame_sequence:
+            self.frame_sequence = tuple(range(len(self.textures)))
+        self.set_texture(self.frame_sequence[0])
 
     @abstractmethod
     def activate_icon_property(self):
@@ -1157,12 +1210,14 @@ class Icon(arcade.Sprite, ABC):
         """
         self.frame_count += 1
 
-        # Update the animation every x frames so that it is not too fast
-        if self.frame_count % self.frames_per_update == 0:
-            self.cur_texture_index += 1
-            if self.cur_texture_index >= len(self.textures):
-                self.cur_texture_index = 0
-            self.set_texture(self.cur_texture_index)
+        # Update the animation every x frames so that it is not too fast. Comparing with the
+        # next frame due avoids a modulo on every frame and works for any interval
+        if self.frame_count == self.next_animation_frame:
+            self.next_animation_frame += self.frames_per_update
+            self.frame_sequence_index += 1
+            if self.frame_sequence_index == len(self.frame_sequence):
+                self.frame_sequence_index = 0
+            self.set_texture(self.frame_sequence[self.frame_sequence_index])
 
     def on_update(self, delta_time: float = 1 / 60):
         """
@@ -1170,7 +1225,7 @@ class Icon(arcade.Sprite, ABC):
         """
         self.update_animation()
 
-        self.center_y += int(self.change_y * delta_time)
+        self.center_y += self.change_y * delta_time
 
         # Check for collision with paddle
         if self.collides_with_sprite(self.level.paddle):
@@ -1179,7 +1234,7 @@ class Icon(arcade.Sprite, ABC):
             self.remove_from_sprite_lists()
 
         # Remove the icon if it goes below the playing field
-        if self.top < self.level.boundary.inner_bottom:
+        if self.top < self.lowest_top:
             self.remove_from_sprite_lists()
 
 
@@ -1188,27 +1243,17 @@ class LengthenPaddleIcon(Icon):
     Increases the length of the paddle
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/icons/lengthen_paddle_icon_1.png",
-                       f"{IMAGES_BASE_PATH}/icons/lengthen_paddle_icon_2.png",
-                       f"{IMAGES_BASE_PATH}/icons/lengthen_paddle_icon_3.png",
-                       f"{IMAGES_BASE_PATH}/icons/lengthen_paddle_icon_4.png"]
-        super().initialize_textures()
-        self.hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/lengthen_icon_tone.wav")
+    images = (f"{IMAGES_BASE_PATH}/icons/lengthen_paddle_icon_1.png",
+              f"{IMAGES_BASE_PATH}/icons/lengthen_paddle_icon_2.png",
+              f"{IMAGES_BASE_PATH}/icons/lengthen_paddle_icon_3.png",
+              f"{IMAGES_BASE_PATH}/icons/lengthen_paddle_icon_4.png")
+    hit_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/lengthen_icon_tone.wav")
 
     def activate_icon_property(self):
         current_paddle = self.level.paddle
 
-        # For demo level
-        if self.level.is_demo_level:
-            self.level.paddle = DemoNormalPaddle(self.level) if isinstance(current_paddle, DemoShortPaddle) \
-                else DemoLongPaddle(self.level)
-
-        # Normal game play
-        else:
-            # If the current paddle is short, make it normal, else make it long
-            self.level.paddle = NormalPaddle(self.level) if isinstance(current_paddle, ShortPaddle) \
-                else LongPaddle(self.level)
+        # If the current paddle is short, make it normal, else make it long
+        self.level.paddle = LENGTHENED_PADDLE_TYPES[type(current_paddle)](self.level)
         self.level.paddle.copy_properties_from(current_paddle)
         self.level.paddle.collides_with_boundary()  # Reposition if the paddle collides with boundary
 
@@ -1222,34 +1267,23 @@ class ShortenPaddleIcon(Icon):
     Decreases the length of the paddle
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/icons/shorten_paddle_icon_1.png",
-                       f"{IMAGES_BASE_PATH}/icons/shorten_paddle_icon_2.png",
-                       f"{IMAGES_BASE_PATH}/icons/shorten_paddle_icon_3.png",
-                       f"{IMAGES_BASE_PATH}/icons/shorten_paddle_icon_4.png"]
-        super().initialize_textures()
-        self.hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/shorten_icon_tone.wav")
+    images = (f"{IMAGES_BASE_PATH}/icons/shorten_paddle_icon_1.png",
+              f"{IMAGES_BASE_PATH}/icons/shorten_paddle_icon_2.png",
+              f"{IMAGES_BASE_PATH}/icons/shorten_paddle_icon_3.png",
+              f"{IMAGES_BASE_PATH}/icons/shorten_paddle_icon_4.png")
+    hit_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/shorten_icon_tone.wav")
 
     def activate_icon_property(self):
         current_paddle = self.level.paddle
 
-        # For demo level
-        if self.level.is_demo_level:
-            self.level.paddle = DemoNormalPaddle(self.level) if isinstance(current_paddle, DemoLongPaddle) \
-                else DemoShortPaddle(self.level)
-
-        # Normal game play
-        else:
-            # If the current paddle is long, make it normal, else make it short
-            self.level.paddle = NormalPaddle(self.level) if isinstance(current_paddle, LongPaddle) \
-                else ShortPaddle(self.level)
+        # If the current paddle is long, make it normal, else make it short
+        self.level.paddle = SHORTENED_PADDLE_TYPES[type(current_paddle)](self.level)
         self.level.paddle.copy_properties_from(current_paddle)
 
         # If a ball is no longer on the paddle after it has shrunk, drop the ball
         for ball in self.level.paddle.magnetic_ball_list:
             if ball.center_x < self.level.paddle.left or ball.center_x > self.level.paddle.right:
-                new_ball = ball.convert_to(InvinciBall) if ball.is_invincible else \
-                    ball.convert_to(NormalBall)
+                new_ball = ball.convert_to(NON_MAGNETIC_BALL_TYPES[ball.is_invincible])
                 new_ball.ball_speed = 200
                 new_ball.velocity_angle = -90
                 new_ball.set_velocity()
@@ -1261,12 +1295,10 @@ class MagneticPaddleIcon(Icon):
     Makes the paddle magnetic
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/icons/magnetic_paddle_icon_1.png",
-                       f"{IMAGES_BASE_PATH}/icons/magnetic_paddle_icon_2.png",
-                       f"{IMAGES_BASE_PATH}/icons/magnetic_paddle_icon_3.png",
-                       f"{IMAGES_BASE_PATH}/icons/magnetic_paddle_icon_4.png"]
-        super().initialize_textures()
+    images = (f"{IMAGES_BASE_PATH}/icons/magnetic_paddle_icon_1.png",
+              f"{IMAGES_BASE_PATH}/icons/magnetic_paddle_icon_2.png",
+              f"{IMAGES_BASE_PATH}/icons/magnetic_paddle_icon_3.png",
+              f"{IMAGES_BASE_PATH}/icons/magnetic_paddle_icon_4.png")
 
     def activate_icon_property(self):
         # Don't set magnetism in a demo level
@@ -1279,16 +1311,11 @@ class BonusScoreIcon(Icon):
     Adds bonus score of 5000 points
     """
 
-    def __init__(self, level: Level = None, **kwargs):
-        super().__init__(level, **kwargs)
-        self.adding_bonus_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/adding_bonus_3.wav")
-
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/icons/bonus_score_icon_1.png",
-                       f"{IMAGES_BASE_PATH}/icons/bonus_score_icon_2.png"]
-        super().initialize_textures()
-        self.frames_per_update = 8
-        self.hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/bonus_score_icon_tone.wav")
+    images = (f"{IMAGES_BASE_PATH}/icons/bonus_score_icon_1.png",
+              f"{IMAGES_BASE_PATH}/icons/bonus_score_icon_2.png")
+    hit_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/bonus_score_icon_tone.wav")
+    adding_bonus_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/adding_bonus_3.wav")
+    frames_per_update = 8
 
     def activate_icon_property(self):
         self.level.window.score += 5000
@@ -1300,12 +1327,10 @@ class ShootingIcon(Icon):
     Gives the player ability to shoot the bricks
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/icons/shooting_icon_1.png",
-                       f"{IMAGES_BASE_PATH}/icons/shooting_icon_2.png"]
-        super().initialize_textures()
-        self.frames_per_update = 8
-        self.hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/shooting_icon_tone.wav")
+    images = (f"{IMAGES_BASE_PATH}/icons/shooting_icon_1.png",
+              f"{IMAGES_BASE_PATH}/icons/shooting_icon_2.png")
+    hit_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/shooting_icon_tone.wav")
+    frames_per_update = 8
 
     def activate_icon_property(self):
         self.level.paddle.activate_shooter = True
@@ -1316,13 +1341,11 @@ class SplitBallIcon(Icon):
     Splits the next three balls into two
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/icons/split_ball_icon_1.png",
-                       f"{IMAGES_BASE_PATH}/icons/split_ball_icon_2.png",
-                       f"{IMAGES_BASE_PATH}/icons/split_ball_icon_3.png",
-                       f"{IMAGES_BASE_PATH}/icons/split_ball_icon_4.png"]
-        super().initialize_textures()
-        self.frames_per_update = 10
+    images = (f"{IMAGES_BASE_PATH}/icons/split_ball_icon_1.png",
+              f"{IMAGES_BASE_PATH}/icons/split_ball_icon_2.png",
+              f"{IMAGES_BASE_PATH}/icons/split_ball_icon_3.png",
+              f"{IMAGES_BASE_PATH}/icons/split_ball_icon_4.png")
+    frames_per_update = 10
 
     def activate_icon_property(self):
         self.level.paddle.split_balls += 3
@@ -1333,12 +1356,10 @@ class BonusLifeIcon(Icon):
     Adds an extra life
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/icons/bonus_life_icon_1.png",
-                       f"{IMAGES_BASE_PATH}/icons/bonus_life_icon_2.png"]
-        super().initialize_textures()
-        self.frames_per_update = 10
-        self.hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/bonus_life_icon_tone.wav")
+    images = (f"{IMAGES_BASE_PATH}/icons/bonus_life_icon_1.png",
+              f"{IMAGES_BASE_PATH}/icons/bonus_life_icon_2.png")
+    hit_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/bonus_life_icon_tone.wav")
+    frames_per_update = 10
 
     def activate_icon_property(self):
         self.level.window.lives += 1
@@ -1349,19 +1370,14 @@ class SafetyBarrierIcon(Icon):
     Activates the safety barrier
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_1.png",
-                       f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_2.png",
-                       f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_3.png",
-                       f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_2.png",
-                       f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_1.png",
-                       f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_4.png",
-                       f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_5.png",
-                       f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_6.png",
-                       f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_5.png",
-                       f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_4.png"]
-        super().initialize_textures()
-        self.frames_per_update = 3
+    images = (f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_1.png",
+              f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_2.png",
+              f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_3.png",
+              f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_4.png",
+              f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_5.png",
+              f"{IMAGES_BASE_PATH}/icons/safety_barrier_icon_6.png")
+    frame_sequence = (0, 1, 2, 1, 0, 3, 4, 5, 4, 3)  # Sweep back and forth
+    frames_per_update = 3
 
     def activate_icon_property(self):
         self.level.brick_list.append(SafetyBarrier(self.level))
@@ -1372,13 +1388,11 @@ class AdvanceLevelIcon(Icon):
     Advances player to the next level
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/icons/advance_level_icon_1.png",
-                       f"{IMAGES_BASE_PATH}/icons/advance_level_icon_2.png",
-                       f"{IMAGES_BASE_PATH}/icons/advance_level_icon_3.png",
-                       f"{IMAGES_BASE_PATH}/icons/advance_level_icon_4.png"]
-        super().initialize_textures()
-        self.frames_per_update = 3
+    images = (f"{IMAGES_BASE_PATH}/icons/advance_level_icon_1.png",
+              f"{IMAGES_BASE_PATH}/icons/advance_level_icon_2.png",
+              f"{IMAGES_BASE_PATH}/icons/advance_level_icon_3.png",
+              f"{IMAGES_BASE_PATH}/icons/advance_level_icon_4.png")
+    frames_per_update = 3
 
     def activate_icon_property(self):
         # Don't advance level in a demo level
@@ -1391,12 +1405,10 @@ class SpeedUpBallsIcon(Icon):
     Increases the speed of all the balls. Also makes the paddle non-magnetic
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/icons/speed_up_ball_icon_1.png",
-                       f"{IMAGES_BASE_PATH}/icons/speed_up_ball_icon_2.png"]
-        super().initialize_textures()
-        self.frames_per_update = 10
-        self.hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/speed_up_icon_tone.wav")
+    images = (f"{IMAGES_BASE_PATH}/icons/speed_up_ball_icon_1.png",
+              f"{IMAGES_BASE_PATH}/icons/speed_up_ball_icon_2.png")
+    hit_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/speed_up_icon_tone.wav")
+    frames_per_update = 10
 
     def activate_icon_property(self):
         self.level.paddle.is_magnetic = False
@@ -1411,12 +1423,10 @@ class SlowDownBallsIcon(Icon):
     Decreases the speed of all the balls
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/icons/slow_down_ball_icon_1.png",
-                       f"{IMAGES_BASE_PATH}/icons/slow_down_ball_icon_2.png"]
-        super().initialize_textures()
-        self.frames_per_update = 10
-        self.hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/slow_down_icon_tone.wav")
+    images = (f"{IMAGES_BASE_PATH}/icons/slow_down_ball_icon_1.png",
+              f"{IMAGES_BASE_PATH}/icons/slow_down_ball_icon_2.png")
+    hit_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/slow_down_icon_tone.wav")
+    frames_per_update = 10
 
     def activate_icon_property(self):
         for ball in self.level.ball_list:
@@ -1428,14 +1438,12 @@ class InvinciBallIcon(Icon):
     Converts a normal ball to an invincible ball for three hits
     """
 
-    def initialize_textures(self):
-        self.images = [f"{IMAGES_BASE_PATH}/icons/invincible_ball_icon_1.png",
-                       f"{IMAGES_BASE_PATH}/icons/invincible_ball_icon_2.png",
-                       f"{IMAGES_BASE_PATH}/icons/invincible_ball_icon_3.png",
-                       f"{IMAGES_BASE_PATH}/icons/invincible_ball_icon_2.png"]
-        super().initialize_textures()
-        self.frames_per_update = 8
-        self.hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/invincible_ball_icon_tone.wav")
+    images = (f"{IMAGES_BASE_PATH}/icons/invincible_ball_icon_1.png",
+              f"{IMAGES_BASE_PATH}/icons/invincible_ball_icon_2.png",
+              f"{IMAGES_BASE_PATH}/icons/invincible_ball_icon_3.png")
+    frame_sequence = (0, 1, 2, 1)  # Sweep back and forth
+    hit_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/invincible_ball_icon_tone.wav")
+    frames_per_update = 8
 
     def activate_icon_property(self):
         self.level.paddle.invincible_balls += 3
@@ -1461,12 +1469,13 @@ class SafetyBarrier(Brick, arcade.SpriteSolidColor):
     Creates the safety barrier
     """
 
+    hit_sound = get_sound(f"{AUDIO_BASE_PATH}/sounds/hit_safety_barrier.wav")
+
     def __init__(self, level: Level, **kwargs):
         super().__init__(level=level, width=1080, height=2, color=arcade.color.WHITE, **kwargs)
 
         self.center_x = self.level.boundary.center_x
         self.center_y = self.level.boundary.inner_bottom + 7
-        self.hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/hit_safety_barrier.wav")
         self.is_safety_barrier = True
 
     def initialize_textures(self):
@@ -1478,25 +1487,91 @@ class Bullet(arcade.Sprite):
     Creates a bullet that can destroy bricks
     """
 
+    __slots__ = ("level", "highest_bottom")
+
     def __init__(self, level: Level, **kwargs):
-        super().__init__(f"{IMAGES_BASE_PATH}/icons/bullet.png", scale=0.7, **kwargs)
+        super().__init__(scale=0.7, **kwargs)
+        self.texture = arcade.load_texture(f"{IMAGES_BASE_PATH}/icons/bullet.png")
         self.level = level
 
+        self.change_y = BULLET_SPEED
+        self.highest_bottom = self.level.boundary.inner_top  # Where the bullet leaves the playing field
+        self.move_to_paddle()
+
+    def move_to_paddle(self):
+        """
+        Places the bullet on top of the paddle, ready to be fired
+        """
         self.center_x = self.level.paddle.center_x
         self.bottom = self.level.paddle.top
-        self.change_y = BULLET_SPEED
+
+    def remove_from_playing_field(self):
+        """
+        Removes the bullet from the level and keeps it in the level's spare bullets so that
+        it can be fired again instead of creating a new one
+        """
+        self.remove_from_sprite_lists()
+        self.level.spare_bullets.append(self)
 
     def on_update(self, delta_time: float = 1 / 60):
-        self.center_y += int(self.change_y * delta_time)
+        self.center_y += self.change_y * delta_time
 
         # Check for collision with bricks
-        hit_list = cast(List[Brick], self.collides_with_list(self.level.brick_list))
+        hit_list: List[Brick] = arcade.check_for_collision_with_list(self, self.level.brick_list)
 
         if hit_list:
-            self.remove_from_sprite_lists()
+            self.remove_from_playing_field()
             for brick in hit_list:
                 brick.change_properties()
 
         # If it goes outside the playing field, remove it
-        if self.bottom > self.level.boundary.inner_top:
-            self.remove_from_sprite_lists()
+        elif self.bottom > self.highest_bottom:
+            self.remove_from_playing_field()
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+#                                             PRELOADING
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def get_all_subclasses(cls: type) -> set:
+    """
+    Returns all the sub-classes of a class, including sub-classes of sub-classes
+
+    :param cls: the base class
+    :return: set of sub-classes
+    """
+    subclasses = set()
+    for subclass in cls.__subclasses__():
+        subclasses.add(subclass)
+        subclasses.update(get_all_subclasses(subclass))
+    return subclasses
+
+
+def preload_assets():
+    """
+    Loads the textures of all balls, paddles, bricks, icons and boundaries so that no images are
+    decoded while a view is being built or when an icon first appears. Also loads every sound effect
+    so that no sound file is decoded when a view is created
+    """
+    for sprite_type in get_all_subclasses(Ball) | get_all_subclasses(Paddle):
+        if sprite_type.image:
+            arcade.load_texture(sprite_type.image)
+
+    for sprite_type in get_all_subclasses(Brick) | get_all_subclasses(Icon):
+        for image in sprite_type.images:
+            arcade.load_texture(image)
+
+    arcade.load_texture(f"{IMAGES_BASE_PATH}/icons/bullet.png")
+
+    # Boundaries of the playing field, menus and dialogues, so that opening a view does not decode them
+    for image_file in sorted((IMAGES_BASE_PATH / "boundaries").glob("*.png")):
+        arcade.load_texture(f"{IMAGES_BASE_PATH}/boundaries/{image_file.name}")
+
+    # This includes the level intro voices and the sounds the views load when they are created.
+    # The path is built the same way as everywhere else so that it matches the cached key.
+    # Background music is streamed by each view and is not loaded here
+    for sound_file in sorted((AUDIO_BASE_PATH / "sounds").glob("*.wav")):
+        get_sound(f"{AUDIO_BASE_PATH}/sounds/{sound_file.name}")
@@ -0,0 +1,120 @@
+"""
+Stores the high scores in an SQLite database. Kept apart from levels so that it can be
+used without arcade, e.g. in tests
+"""
+
+from __future__ import annotations
+from pathlib import Path
+
+import sqlite3
+import time
+
+from collections import namedtuple
+
+ASSETS_BASE_PATH = Path(__file__).parent.parent.parent / "assets"
+HIGH_SCORES_FILE = ASSETS_BASE_PATH / "high_scores.txt"  # Only read to carry old high scores over
+HIGH_SCORES_DATABASE = ASSETS_BASE_PATH / "high_scores.db"
+
+Entry = namedtuple("Entry", "name level score")
+
+
+def read_old_high_scores(high_scores_file: Path):
+    """
+    Reads the entries of the old high scores file. Blank and malformed lines are skipped
+    so that one bad line does not stop the rest of the scores from being carried over
+
+    :param high_scores_file: path of the old high scores file
+    :return: a list of (name, level, score, datetime) tuples
+    """
+    entries = []
+    with open(high_scores_file) as old_file:
+        next(old_file, None)  # Skip the heading
+        for line in old_file:
+            # Split from the right since names written to the old file could contain commas
+            row = line.rstrip("\n").rsplit(",", 3)
+            if len(row) != 4:
+                continue
+
+            name, level, score, datetime = row
+            try:
+                entries.append((name, int(level), int(score), datetime))
+            except ValueError:
+                continue
+
+    return entries
+
+
+def get_default_high_scores():
+    """
+    Generates the default high scores
+
+    :return: a list of (name, level, score, datetime) tuples
+    """
+    entries = []
+    now = time.asctime()
+    for i in range(10, 0, -1):
+        if i % 2 == 0:  # even
+            entries.append(("Freddy", int(i/2), i*5000, now))
+        else:
+            entries.append(("BBB", int((i+1)/2), i*5000, now))
+    return entries
+
+
+def open_high_scores(database: Path = HIGH_SCORES_DATABASE, old_high_scores_file: Path = HIGH_SCORES_FILE):
+    """
+    Connects to the high scores database. If it has no scores yet, it is filled with the
+    entries of the old high scores file, or with the default high scores if there are none
+
+    :param database: path of the high scores database
+    :param old_high_scores_file: path of the old high scores file
+    :return: the connection to the high scores database
+    """
+    connection = sqlite3.connect(database)
+
+    # sqlite3 commits table creation straight away unless a transaction has been started, so
+    # begin one explicitly. If anything fails, nothing is kept and this runs again next time
+    try:
+        with connection:
+            connection.execute("BEGIN")
+            connection.execute("CREATE TABLE IF NOT EXISTS scores (name TEXT, level INTEGER, score INTEGER, "
+                               "datetime TEXT)")
+            connection.execute("CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC)")
+
+            # The table only has no scores when it has just been created
+            if connection.execute("SELECT 1 FROM scores LIMIT 1").fetchone() is None:
+                entries = read_old_high_scores(old_high_scores_file) if old_high_scores_file.is_file() else []
+
+                # Fall back to the defaults if there are no old scores that could be read
+                connection.executemany("INSERT INTO scores VALUES (?, ?, ?, ?)",
+                                       entries or get_default_high_scores())
+    except Exception:
+        connection.close()
+        raise
+
+    return connection
+
+
+def add_high_score(connection: sqlite3.Connection, name: str, level: int, score: int):
+    """
+    Adds a new entry to the high scores database
+
+    :param connection: connection to the high scores database
+    :param name: name entered by the player
+    :param level: level the player reached
+    :param score: score the player achieved
+    """
+    with connection:
+        # The datetime column is only used to see how often the game is played
+        connection.execute("INSERT INTO scores VALUES (?, ?, ?, ?)", (name, level, score, time.asctime()))
+
+
+def get_high_scores(connection: sqlite3.Connection):
+    """
+    Gets the 10 best scores from the high scores database. The index on the score
+    column means only those 10 rows are read
+
+    :param connection: connection to the high scores database
+    :return: a list of namedtuples which represent each entry
+    """
+    rows = connection.execute("SELECT name, level, score FROM scores ORDER BY score DESC LIMIT 10")
+    return [Entry(name, str(level), score) for name, level, score in rows]  # Level is displayed as text
@@ -9,14 +9,12 @@ from pathlib import Path
 
 import arcade
 import paranoid.assets as assets
+import paranoid.high_scores as high_scores
 import random
-import time
-import os
 
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Union, Optional
 from arcade.gui import UIInputBox, UIManager
-from collections import namedtuple
 
 # Prevents circular import error by setting this variable False at runtime
 if TYPE_CHECKING:
@@ -37,6 +35,10 @@ BRICK_HEIGHT = 25
 BRICK_MARGIN = 2
 COLUMNS = 14  # Number of columns on the playing field
 
+# Bricks never move, so the spatial hash cells are sized to one brick so that a
+# ball only ever checks the few bricks in the cells it overlaps
+BRICK_SPATIAL_HASH_CELL_SIZE = BRICK_WIDTH + BRICK_MARGIN
+
 PAUSE_TIME = 3
 TRANSITION_TIME = 1
 DEMO_LEVEL_TIME = 12
@@ -54,12 +56,11 @@ ASSETS_BASE_PATH = Path(__file__).parent.parent.parent / "assets"
 IMAGES_BASE_PATH = ASSETS_BASE_PATH / "images"
 AUDIO_BASE_PATH = ASSETS_BASE_PATH / "audio"
 FONTS_BASE_PATH = ASSETS_BASE_PATH / "fonts"
-HIGH_SCORES_FILE = ASSETS_BASE_PATH / "high_scores.txt"
 
 # Global Sounds
-ENTER_SOUND = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/press_enter.wav")
-SCROLL_SOUND = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/scroll_options.wav")
-WHOOSH_SOUND = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/whoosh_1.wav")
+ENTER_SOUND = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/press_enter.wav")
+SCROLL_SOUND = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/scroll_options.wav")
+WHOOSH_SOUND = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/whoosh_1.wav")
 
 # Fonts: path to font .ttf files
 BGOTHL = f"{FONTS_BASE_PATH}/bgothl"  # BankGothic Lt BT
@@ -167,44 +168,92 @@ HOW_TO_PLAY_NEXT_BACK = MENU_TEXT_HEADING.copy()
 HOW_TO_PLAY_NEXT_BACK.update(font_size=50)
 
 
-def create_high_scores():
+# High scores
+HIGH_SCORES_CONNECTION = high_scores.open_high_scores()
+HIGH_SCORES = high_scores.get_high_scores(HIGH_SCORES_CONNECTION)
+LOWEST_HIGH_SCORE = HIGH_SCORES[-1].score if HIGH_SCORES else 0  # Score to beat for a place in HIGH_SCORES
+
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+#                                               TEXT
+
+# +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+
+def render_text(text: str, style: dict) -> arcade.Texture:
     """
-    Generates the default high scores file
+    Renders text to a texture the same way arcade.draw_text does
+
+    :param text: the text to render
+    :param style: one of the text-styling dictionaries
+    :return: texture of the text
     """
-    with open(HIGH_SCORES_FILE, "w") as high_scores_file:
-        high_scores_file.write("name,level,score,datetime\n")
-        for i in range(10, 0, -1):
-            if i % 2 == 0:  # even
-                high_scores_file.write(f"Freddy,{int(i/2)},{i*5000},{time.asctime()}\n")
-            else:
-                high_scores_file.write(f"BBB,{int((i+1)/2)},{i*5000},{time.asctime()}\n")
+    name = f"{text}{style['color']}{style['font_size']}{style.get('width', 0)}{style.get('align', 'left')}" \
+           f"{style['font_name']}"
+    image = arcade.get_text_image(text, style["color"], style["font_size"], width=style.get("width", 0),
+                                  align=style.get("align", "left"), font_name=style["font_name"])
+    # The hit box is never used, so skip calculating it from the image
+    return arcade.Texture(name, image, hit_box_algorithm="None")
 
 
-def get_high_scores():
+class TextSprite(arcade.Sprite):
     """
-    Gets the 10 best scores from the high_scores file
-
-    :return: a list of namedtuples which represent each entry
+    Text that is kept as a sprite so that it is only rendered again when it changes, and
+    so that several pieces of text can be drawn together in one sprite list
     """
-    Entry = namedtuple("Entry", "name level score")
-    high_scores_list = []
 
-    # If HIGH_SCORES_FILE does not exist, create it TODO: Use sqlite db instead of flat file
-    if not os.path.isfile(HIGH_SCORES_FILE):
-        create_high_scores()
+    def __init__(self, text: str, start_x: float, start_y: float, style: dict):
+        """
+        Renders the text and positions it like arcade.draw_text
 
-    with open(HIGH_SCORES_FILE) as high_scores_file:
-        next(high_scores_file)  # Skip the heading
-        for line in high_scores_file:
-            # Ignore datetime column - only used to see how often game is played
-            row = line.split(",")
-            name, level, score = row[0], row[1], int(row[2])  # Save score as int
-            high_scores_list.append(Entry(name, level, score))
+        :param text: the text to display
+        :param start_x: x coordinate the text is anchored to
+        :param start_y: y coordinate the text is anchored to
+        :param style: one of the text-styling dictionaries
+        """
+        super().__init__()
+        self.start_x = start_x
+        self.start_y = start_y
+        self.text = None
+        self.style = None
+        self.update_text(text, style)
 
-    return sorted(high_scores_list, key=lambda entry: entry.score, reverse=True)[:10]
+    def update_text(self, text: str, style: dict = None):
+        """
+        Renders the text again, only if it or its style has changed
 
+        :param text: the text to display
+        :param style: new text-styling dictionary. Defaults to the current style
+        """
+        style = self.style if style is None else style
+        if text == self.text and style is self.style:
+            return
+
+        self.text = text
+        self.style = style
+        self.texture = render_text(text, style)
+
+        # Setting the texture does not update the size stored in the sprite lists when the
+        # texture is already in their atlas, which would draw the text at its old size
+        for sprite_list in self.sprite_lists:
+            sprite_list.update_size(self)
+
+        anchor_x = style.get("anchor_x", "left")
+        if anchor_x == "left":
+            self.center_x = self.start_x + self.width / 2
+        elif anchor_x == "center":
+            self.center_x = self.start_x
+        else:
+            self.center_x = self.start_x - self.width / 2
 
-HIGH_SCORES = get_high_scores()
+        anchor_y = style.get("anchor_y", "baseline")
+        if anchor_y == "top":
+            self.center_y = self.start_y - self.height / 2
+        elif anchor_y == "center":
+            self.center_y = self.start_y
+        else:
+            self.center_y = self.start_y + self.height / 2
 
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -219,6 +268,11 @@ class Boundary(ABC):
     Base class for boundaries
     """
 
+    # Sounds are shared by all boundaries since every level and fullscreen view creates one
+    top_hit_sound = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/hit_top_boundary.wav")
+    side_hit_sound = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/hit_side_boundary.wav")
+    bottom_hit_sound = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/hit_bottom_boundary.wav")
+
     def __init__(self):
         # Boundary constants
         self.center_x = SCREEN_PADDING + BOUNDARY_THICKNESS + PLAYING_FIELD_WIDTH / 2
@@ -230,11 +284,6 @@ class Boundary(ABC):
 
         self.is_fullscreen = False
 
-        # Sounds
-        self.top_hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/hit_top_boundary.wav")
-        self.side_hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/hit_side_boundary.wav")
-        self.bottom_hit_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/hit_bottom_boundary.wav")
-
         self.border_list = arcade.SpriteList(is_static=True)
         self.populate_border_list()  # May override other attributes, hence is last in __init__
 
@@ -260,23 +309,21 @@ class PlayingFieldBoundary(Boundary):
         # have passed it
 
         # Left and right borders
-        for side in ["left", "right"]:
-            border = arcade.Sprite(f"{IMAGES_BASE_PATH}/boundaries/playing_field_{side}_vertical_border.png",
-                                   center_y=self.center_y)
-            if side == "left":
-                border.right = self.inner_left
-            else:
-                border.left = self.inner_right
-            self.border_list.append(border)
-
-        # Top and bottom borders
-        for i in range(2):
-            border = arcade.Sprite(f"{IMAGES_BASE_PATH}/boundaries/playing_field_horizontal_border.png",
-                                   center_x=self.center_x)
-            if i == 0:
-                border.bottom = self.inner_top
-            else:
-                border.top = self.inner_bottom
+        left_border = arcade.Sprite(f"{IMAGES_BASE_PATH}/boundaries/playing_field_left_vertical_border.png",
+                                    center_y=self.center_y)
+        left_border.right = self.inner_left
+        right_border = arcade.Sprite(f"{IMAGES_BASE_PATH}/boundaries/playing_field_right_vertical_border.png",
+                                     center_y=self.center_y)
+        right_border.left = self.inner_right
+
+        # Top and bottom borders share the same image
+        horizontal_border_image = f"{IMAGES_BASE_PATH}/boundaries/playing_field_horizontal_border.png"
+        top_border = arcade.Sprite(horizontal_border_image, center_x=self.center_x)
+        top_border.bottom = self.inner_top
+        bottom_border = arcade.Sprite(horizontal_border_image, center_x=self.center_x)
+        bottom_border.top = self.inner_bottom
+
+        for border in (left_border, right_border, top_border, bottom_border):
             self.border_list.append(border)
 
         # Add a black rectangle at the top to hide the bullets due to larger size
@@ -329,6 +376,38 @@ class DisplayInfoBlock:
         self.text_1 = ""
         self.text_2 = ""
 
+        # Text is kept as sprites, grouped by when it is drawn, so that each group only
+        # needs one draw call and text is only rendered again when it changes
+        self.score_text = TextSprite("0", self.start_x, self.start_y, DISPLAY_BLOCK_NUMBERS)
+        self.level_number_text = TextSprite("0", self.start_x, self.start_y - 150, DISPLAY_BLOCK_NUMBERS)
+        self.lives_text = TextSprite("0", self.start_x, self.start_y - 300, DISPLAY_BLOCK_NUMBERS)
+        self.number_text_list = arcade.SpriteList()
+        for text in (self.level_number_text, self.lives_text):
+            self.number_text_list.append(text)
+        self.displayed_numbers = None  # Score, level number and lives currently shown
+
+        # The score counts up every frame while points are added. A sprite list keeps every texture
+        # it has had in its atlas and rebuilds all of them when a new one is added, so the score
+        # gets a list of its own which is replaced whenever the score changes
+        self.score_text_list = arcade.SpriteList()
+        self.score_text_list.append(self.score_text)
+
+        self.bonus_score_text = TextSprite("0", self.start_x, self.start_y - 450, DISPLAY_BLOCK_NUMBERS)
+        self.displayed_bonus_score = None
+
+        self.bonus_letter_list = arcade.SpriteList()
+        for index, letter in enumerate("BONUS"):
+            self.bonus_letter_list.append(TextSprite(letter, self.start_x - 220 + index * 50, self.start_y - 430,
+                                                     BONUS_NOT_COLLECTED))
+        self.displayed_bonus_collection_order = ""
+
+        self.key_text = TextSprite("SPACE", self.block.center_x, 134, DISPLAY_BLOCK_TEXT_KEY)
+        self.action_text = TextSprite("to start", self.block.center_x, 84, DISPLAY_BLOCK_TEXT)
+        self.instructions_text_list = arcade.SpriteList()
+        for text in (TextSprite("Press", self.block.center_x, 184, DISPLAY_BLOCK_TEXT), self.key_text,
+                     self.action_text):
+            self.instructions_text_list.append(text)
+
     def draw(self):
         """
         Adds additional text info
@@ -339,27 +418,39 @@ class DisplayInfoBlock:
         if self.level.window.display_score < self.level.window.score:
             self.level.window.display_score += 5
 
-        # Draws text info on the display block
-        arcade.draw_text(f"{self.level.window.display_score:,d}", self.start_x, self.start_y,
-                         **DISPLAY_BLOCK_NUMBERS)
-        arcade.draw_text(f"{self.level.window.level_number:,d}", self.start_x, self.start_y - 150,
-                         **DISPLAY_BLOCK_NUMBERS)
-        arcade.draw_text(f"{self.level.window.lives:,d}", self.start_x, self.start_y - 300,
-                         **DISPLAY_BLOCK_NUMBERS)
+        # Draws text info on the display block. The numbers are only formatted when one changes
+        numbers = (self.level.window.display_score, self.level.window.level_number, self.level.window.lives)
+        if numbers != self.displayed_numbers:
+            if self.displayed_numbers is None or numbers[0] != self.displayed_numbers[0]:
+                self.score_text.remove_from_sprite_lists()
+                self.score_text.update_text(f"{self.level.window.display_score:,d}")
+                self.score_text_list = arcade.SpriteList()
+                self.score_text_list.append(self.score_text)
+            self.displayed_numbers = numbers
+            self.level_number_text.update_text(f"{self.level.window.level_number:,d}")
+            self.lives_text.update_text(f"{self.level.window.lives:,d}")
+        self.score_text_list.draw()
+        self.number_text_list.draw()
 
         # Only draw bonus score at the end of the level, otherwise draw the bonus letters
         if self.level.level_complete and self.level.elapsed_time > PAUSE_TIME:
-            arcade.draw_text(f"{self.level.bonus_score:,d}", self.start_x, self.start_y - 450,
-                             **DISPLAY_BLOCK_NUMBERS)
+            if self.level.bonus_score != self.displayed_bonus_score:
+                self.displayed_bonus_score = self.level.bonus_score
+                self.bonus_score_text.update_text(f"{self.level.bonus_score:,d}")
+            self.bonus_score_text.draw()
         else:
-            for index, letter in enumerate("BONUS"):
-                if letter in self.level.bonus_collection_order:
-                    style = BONUS_COLLECTED
-                else:
-                    style = BONUS_NOT_COLLECTED
+            # Letters only change style when one is collected
+            if self.level.bonus_collection_order != self.displayed_bonus_collection_order:
+                self.displayed_bonus_collection_order = self.level.bonus_collection_order
 
-                arcade.draw_text(letter, self.start_x - 220 + index * 50, self.start_y - 430,
-                                 **style)
+                for letter_text in self.bonus_letter_list:
+                    if letter_text.text in self.level.bonus_collection_order:
+                        style = BONUS_COLLECTED
+                    else:
+                        style = BONUS_NOT_COLLECTED
+
+                    letter_text.update_text(letter_text.text, style)
+            self.bonus_letter_list.draw()
 
         # Draws the playing instructions
         if not self.level.level_complete and not self.level.game_over:
@@ -374,9 +465,9 @@ class DisplayInfoBlock:
             else:
                 self.text_1 = "ESC"
                 self.text_2 = "to pause"
-            arcade.draw_text("Press", self.block.center_x, 184, **DISPLAY_BLOCK_TEXT)
-            arcade.draw_text(self.text_1, self.block.center_x, 134, **DISPLAY_BLOCK_TEXT_KEY)
-            arcade.draw_text(self.text_2, self.block.center_x, 84, **DISPLAY_BLOCK_TEXT)
+            self.key_text.update_text(self.text_1)
+            self.action_text.update_text(self.text_2)
+            self.instructions_text_list.draw()
 
 
 class DemoDisplayInfoBlock:
@@ -391,14 +482,15 @@ class DemoDisplayInfoBlock:
         self.block_list.append(arcade.Sprite(f"{IMAGES_BASE_PATH}/boundaries/demo_display_info_block.png",
                                              center_x=SCREEN_WIDTH - SCREEN_PADDING - 180,
                                              center_y=SCREEN_HEIGHT / 2))
+        self.demo_text = TextSprite("Demo", PLAYING_FIELD_WIDTH / 2 + SCREEN_PADDING + BOUNDARY_THICKNESS,
+                                    200, DEMO_TEXT)
 
     def draw(self):
         """
         Draws the display block
         """
         self.block_list.draw()
-        arcade.draw_text("Demo", PLAYING_FIELD_WIDTH / 2 + SCREEN_PADDING + BOUNDARY_THICKNESS,
-                         200, **DEMO_TEXT)
+        self.demo_text.draw()
 
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -464,23 +556,46 @@ class Level(arcade.View, ABC):
     Base class for all levels
     """
 
+    # Override in each level with the bricks in their positions on the playing field, which is
+    # how the bricks will appear in the level, and the icons that will appear in the level.
+    # They are tuples so that they are built once and shared by every instance of the level
+    grid = ()
+    icons = ()
+
     def __init__(self, window: ParanoidGame, is_demo_level=False):
         super().__init__()
         self.window = window
         self.is_demo_level = is_demo_level
 
         # Sprite lists
-        self.brick_list = arcade.SpriteList(use_spatial_hash=True)  # Setting is_static causes bugs in multi-bricks
+        # Setting is_static causes bugs in multi-bricks
+        self.brick_list = arcade.SpriteList(use_spatial_hash=True, spatial_hash_cell_size=BRICK_SPATIAL_HASH_CELL_SIZE)
         self.breakable_brick_list = arcade.SpriteList()  # Only used to check if level is complete
         self.ball_list = arcade.SpriteList()
         self.icon_list = arcade.SpriteList()
         self.bullet_list = arcade.SpriteList()
+        self.spare_bullets = []  # Bullets that have been removed, reused when the paddle shoots
 
         # Sprites and textures
         self.boundary = PlayingFieldBoundary()
         self.display_info = DisplayInfoBlock(level=self)
         self.level_info_boundary = arcade.load_texture(f"{IMAGES_BASE_PATH}/boundaries/level_info_boundary.png")
         self.paddle = assets.NormalPaddle(level=self)
+        self.pause_menu_view = None  # Created on the first pause and reused after that
+
+        # The game over and level complete messages never change, so each one is built once
+        # together with its own level info boundary and drawn as a single sprite list
+        self.game_over_info_list = arcade.SpriteList()
+        self.level_complete_info_list = arcade.SpriteList()
+        for info_list in (self.game_over_info_list, self.level_complete_info_list):
+            info_list.append(arcade.Sprite(f"{IMAGES_BASE_PATH}/boundaries/level_info_boundary.png",
+                                           center_x=self.boundary.center_x, center_y=self.boundary.center_y))
+        self.game_over_info_list.append(TextSprite("Game Over", self.boundary.center_x, self.boundary.center_y,
+                                                   LEVEL_INFO_TEXT))
+        self.level_complete_info_list.append(TextSprite("Level", self.boundary.center_x,
+                                                        self.boundary.center_y + 30, LEVEL_INFO_TEXT))
+        self.level_complete_info_list.append(TextSprite("Complete", self.boundary.center_x,
+                                                        self.boundary.center_y - 30, LEVEL_INFO_TEXT))
         self.ball_list.append(assets.NormalBall(self.boundary, self.brick_list, level=self))
 
         # Level attributes
@@ -503,16 +618,16 @@ class Level(arcade.View, ABC):
         self.window.level_number += 1
 
         # Sounds
-        self.lost_a_life_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/lose_life.wav")
-        self.game_over_voice = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/game_over_voice.wav")
-        self.level_complete_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/level_complete_sound.wav")
-        self.level_complete_voice = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/level_complete_voice.wav")
-        self.adding_bonus_sound_1 = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/adding_bonus_1.wav")
-        self.adding_bonus_sound_2 = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/adding_bonus_2.wav")
-        self.adding_bonus_sound_3 = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/adding_bonus_3.wav")
-        self.shoot_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/shoot_bullet_sound.wav")
-        self.background_music = arcade.Sound(f"{AUDIO_BASE_PATH}/background_music/level_{self.window.level_number}"
-                                             f"_music.mp3", streaming=True)
+        self.lost_a_life_sound = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/lose_life.wav")
+        self.game_over_voice = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/game_over_voice.wav")
+        self.level_complete_sound = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/level_complete_sound.wav")
+        self.level_complete_voice = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/level_complete_voice.wav")
+        self.adding_bonus_sound_1 = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/adding_bonus_1.wav")
+        self.adding_bonus_sound_2 = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/adding_bonus_2.wav")
+        self.adding_bonus_sound_3 = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/adding_bonus_3.wav")
+        self.shoot_sound = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/shoot_bullet_sound.wav")
+        self.background_music = assets.load_background_music(f"{AUDIO_BASE_PATH}/background_music/level_"
+                                                             f"{self.window.level_number}_music.mp3")
 
         # Overwrite certain attributes if we are in a demo level
         if self.is_demo_level:
@@ -521,49 +636,33 @@ class Level(arcade.View, ABC):
             self.game_is_active = True
 
         # Level setup stuff
-        self.grid = []
-        self.icons = []
-        self.populate_grid_and_icons()
         self.initialize_bricks_and_icons()
 
-    @abstractmethod
-    def populate_grid_and_icons(self):
-        """
-        Override to populate the grid with bricks in the desired positions. This is
-        how the bricks will appear in each level. Also populate the list of icons
-        that will appear in the level.
-
-        self.grid = ...
-        self.icons = ...
-        """
-        pass
-
     def initialize_bricks_and_icons(self):
         """
         Positions the bricks on the correct x, y coordinates based on the grid.
         Also adds icons randomly to some of the bricks
         """
+        # Positioning starts at top left of playing field. The playing field does not
+        # change while the grid is read, so work out the first position and spacing once
+        first_center_y = self.boundary.inner_top - BRICK_MARGIN - BRICK_HEIGHT / 2
+        first_left = self.boundary.inner_left + BRICK_MARGIN
+        row_spacing = BRICK_MARGIN + BRICK_HEIGHT
+        column_spacing = BRICK_MARGIN + BRICK_WIDTH
+
         # Each row is a list of brick classes that can be called to instantiate the brick
         for row_number, row in enumerate(self.grid):
+            center_y = first_center_y - row_spacing * row_number
+
             for column_number, BrickType in enumerate(row):
 
                 # None refers to an empty cell
                 if BrickType is not None:
-
-                    # Positioning starts at top left of playing field
-                    # Horizontal positioning is done using .left attribute below
-                    # center_x = self.boundary.inner_left + BRICK_MARGIN + BRICK_WIDTH / 2 + \
-                    #            (BRICK_MARGIN + BRICK_WIDTH) * column_number
-
-                    center_y = self.boundary.inner_top - BRICK_MARGIN - BRICK_HEIGHT / 2 - \
-                               (BRICK_MARGIN + BRICK_HEIGHT) * row_number
-
                     brick = BrickType(center_y=center_y, level=self)
 
                     # Switched to positioning using left of the brick in order to create seamless
                     # images with wall bricks
-                    brick.left = self.boundary.inner_left + BRICK_MARGIN + (BRICK_MARGIN + BRICK_WIDTH) \
-                                 * column_number
+                    brick.left = first_left + column_spacing * column_number
 
                     # Will be used to check if level is complete
                     if brick.is_breakable:
@@ -571,10 +670,12 @@ class Level(arcade.View, ABC):
 
                     self.brick_list.append(brick)
 
-        random_bricks = random.sample(list(self.breakable_brick_list), k=len(self.icons))
+        # Sample indices rather than copying the whole sprite list to sample from it
+        random_indices = random.sample(range(len(self.breakable_brick_list)), k=len(self.icons))
 
         # Random icon assignment to the bricks
-        for brick, IconType in zip(random_bricks, self.icons):
+        for index, IconType in zip(random_indices, self.icons):
+            brick = self.breakable_brick_list[index]
             brick.icon = IconType(level=self)
             brick.icon.position = brick.position
 
@@ -613,6 +714,23 @@ class Level(arcade.View, ABC):
         self.background_music.stop()
         self.lost_a_life_sound.play(volume=NORMAL_VOLUME)
 
+    def update_hit_bricks(self):
+        """
+        Prevents a brick from being hit more than once in one go. This would change the
+        texture more than once, increase the score more than once, etc.
+        """
+        # Find the bricks currently being hit by querying the brick spatial hash once for each
+        # ball and bullet, rather than checking every brick against every ball and bullet
+        bricks_being_hit = set()
+        for sprite_list in (self.ball_list, self.bullet_list):
+            for sprite in sprite_list:
+                bricks_being_hit.update(arcade.check_for_collision_with_list(sprite, self.brick_list))
+
+        # If a brick has been hit and is currently not being hit, allow it to be hit again
+        for brick in self.brick_list:
+            if brick.has_been_hit and brick not in bricks_being_hit:
+                brick.has_been_hit = False
+
     def on_show(self):
         arcade.set_background_color(arcade.color.BLACK)
 
@@ -642,22 +760,13 @@ class Level(arcade.View, ABC):
             self.window.show_view(MainMenuView(self.window))
             WHOOSH_SOUND.play(volume=NORMAL_VOLUME)
 
-        # Loop the background music
-        if self.background_music.get_stream_position() == 0:
-            # Background music stops if level is complete, lost a life or game over.
-            # This prevents immediate restart of the background music.
-            # Also prevents restart of music when exiting demo level.
-            if not self.lost_a_life and not self.game_over and not self.level_complete and \
-                    not self.is_demo_level:
-                self.background_music.play(volume=LOW_VOLUME)
-
         # Only update if the game is in active mode
         if self.game_is_active:
             self.ball_list.on_update()  # MUST update before paddle, see MagnetNormalBall
             self.paddle.on_update()
             self.icon_list.on_update()
             self.bullet_list.on_update()
-            self.brick_list.update()
+            self.update_hit_bricks()
 
             # If all breakable bricks are broken, level is complete
             if not self.breakable_brick_list:
@@ -682,7 +791,7 @@ class Level(arcade.View, ABC):
         elif self.game_over and self.elapsed_time > PAUSE_TIME * 2 + TRANSITION_TIME and \
                 self.window.display_score == self.window.score:
             # Check if we can get into the high scores list
-            if self.window.score > HIGH_SCORES[-1].score:
+            if self.window.score > LOWEST_HIGH_SCORE:
                 self.window.show_view(NameEntryView(self.window))
             else:
                 self.window.show_view(HighScoreView(self.window))
@@ -717,10 +826,7 @@ class Level(arcade.View, ABC):
 
         # Pause for a while before displaying the game over message
         if self.game_over and self.elapsed_time > PAUSE_TIME + TRANSITION_TIME:
-            arcade.draw_scaled_texture_rectangle(self.boundary.center_x, self.boundary.center_y,
-                                                 self.level_info_boundary)
-            arcade.draw_text("Game Over", self.boundary.center_x, self.boundary.center_y,
-                             **LEVEL_INFO_TEXT)
+            self.game_over_info_list.draw()
 
             # Only play game over voice once
             if not self.game_over_voice_played:
@@ -729,12 +835,7 @@ class Level(arcade.View, ABC):
 
         # Pause for a while before displaying the level complete message and adding bonus
         elif self.level_complete and self.elapsed_time > PAUSE_TIME:
-            arcade.draw_scaled_texture_rectangle(self.boundary.center_x, self.boundary.center_y,
-                                                 self.level_info_boundary)
-            arcade.draw_text("Level", self.boundary.center_x, self.boundary.center_y + 30,
-                             **LEVEL_INFO_TEXT)
-            arcade.draw_text("Complete", self.boundary.center_x, self.boundary.center_y - 30,
-                             **LEVEL_INFO_TEXT)
+            self.level_complete_info_list.draw()
 
             # Add the bonus score only once
             if not self.bonus_added:
@@ -774,13 +875,18 @@ class Level(arcade.View, ABC):
                     if self.paddle.is_magnetic:
                         self.paddle.release_magnetic_balls()
                     if self.paddle.activate_shooter:
-                        self.bullet_list.append(assets.Bullet(self))
+                        bullet = self.spare_bullets.pop() if self.spare_bullets else assets.Bullet(self)
+                        bullet.move_to_paddle()
+                        self.bullet_list.append(bullet)
                         self.shoot_sound.play(volume=NORMAL_VOLUME)
 
             # Escape
             elif symbol == arcade.key.ESCAPE:
                 if not self.game_over and not self.level_complete:
-                    self.window.show_view(PauseMenuView(self))
+                    if self.pause_menu_view is None:
+                        self.pause_menu_view = PauseMenuView(self)
+                    self.pause_menu_view.selected = 0  # Every pause starts on 'Continue'
+                    self.window.show_view(self.pause_menu_view)
                     WHOOSH_SOUND.play(volume=NORMAL_VOLUME)
 
                     # Prevent paddle from moving after un-pausing if left or right key was pressed
@@ -796,691 +902,666 @@ class Level(arcade.View, ABC):
 
 
 class Level1(Level):
-    def populate_grid_and_icons(self):
-        # Although it may be easier to use loops and list comprehensions, I decided to create
-        # each grid manually for easier visualization of the levels
-
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, KNYA, UK__, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, UK__, KNYA, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_],
-                     [BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE],
-                     [GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_],
-                     [AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, PINK, PINK, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA]]
-
-        self.icons = [MAGNET, SHORTEN, SAFETY, LENGTHEN, SPEED]
-        # self.icons += [SCORE, SHOOT, SPLIT, LIFE, ADVANCE, SLOW, INVINCIBLE]  # All icons
+    # Although it may be easier to use loops and list comprehensions, I decided to create
+    # each grid manually for easier visualization of the levels
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, KNYA, UK__, None, None, None, None, None, None),
+            (None, None, None, None, None, None, UK__, KNYA, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_),
+            (BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE),
+            (GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_),
+            (AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, PINK, PINK, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA))
+
+    icons = (MAGNET, SHORTEN, SAFETY, LENGTHEN, SPEED)
+    # icons += (SCORE, SHOOT, SPLIT, LIFE, ADVANCE, SLOW, INVINCIBLE)  # All icons
 
 
 class Level2(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, None],
-                     [None, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, None],
-                     [None, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, None],
-                     [None, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, AQUL, AQUL, AQUL, AQUL, AQUL, AQUL, AQUL, AQUL, AQUL, AQUL, AQUL, AQUL, None],
-                     [None, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, None],
-                     [None, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, None],
-                     [None, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, None]]
-
-        self.icons = [SPEED, SPLIT, SPLIT, SHOOT, SLOW, SCORE, LIFE]
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, None),
+            (None, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, None),
+            (None, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, GRN_, None),
+            (None, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, AQUL, AQUL, AQUL, AQUL, AQUL, AQUL, AQUL, AQUL, AQUL, AQUL, AQUL, AQUL, None),
+            (None, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, None),
+            (None, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, None),
+            (None, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, None))
+
+    icons = (SPEED, SPLIT, SPLIT, SHOOT, SLOW, SCORE, LIFE)
 
 
 class Level3(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL],
-                     [None, HAPY, None, HAPY, None, HAPY, None, HAPY, None, HAPY, None, HAPY, None, HAPY],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL],
-                     [SAD_, None, SAD_, None, SAD_, None, SAD_, None, SAD_, None, SAD_, None, SAD_, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL],
-                     [None, HAPY, None, HAPY, None, HAPY, None, HAPY, None, HAPY, None, HAPY, None, HAPY],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, PINK, PINK, None, None, None, None, None, None]]
-
-        self.icons = [SHOOT, LIFE, INVINCIBLE, SCORE, LENGTHEN]
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL),
+            (None, HAPY, None, HAPY, None, HAPY, None, HAPY, None, HAPY, None, HAPY, None, HAPY),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL, BLUL),
+            (SAD_, None, SAD_, None, SAD_, None, SAD_, None, SAD_, None, SAD_, None, SAD_, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL),
+            (None, HAPY, None, HAPY, None, HAPY, None, HAPY, None, HAPY, None, HAPY, None, HAPY),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, PINK, PINK, None, None, None, None, None, None))
+
+    icons = (SHOOT, LIFE, INVINCIBLE, SCORE, LENGTHEN)
 
 
 class Level4(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None],
-                     [None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None]]
-
-        self.icons = [SAFETY, SHORTEN, MAGNET, SPLIT, LENGTHEN, SHOOT, SCORE]
+    grid = ((None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, AQUL, GRNL, None, None, None, REDL, BLUL, None),
+            (None, BLUL, REDL, None, None, None, GRNL, AQUL, None, None, None, REDL, BLUL, None))
+
+    icons = (SAFETY, SHORTEN, MAGNET, SPLIT, LENGTHEN, SHOOT, SCORE)
 
 
 class Level5(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[BLUE, BLUE, BLUE, BLUE, BLUE, None, None, None, None, BLUE, BLUE, BLUE, BLUE, BLUE],
-                     [BLUE, RED_, RED_, RED_, None, None, None, None, None, None, RED_, RED_, RED_, BLUE],
-                     [BLUE, GRN_, GRN_, None, None, None, None, None, None, None, None, GRN_, GRN_, BLUE],
-                     [BLUE, RED_, None, None, None, None, None, None, None, None, None, None, RED_, BLUE],
-                     [BLUE, None, None, None, None, None, MUL4, None, None, None, None, None, None, BLUE],
-                     [None, None, None, None, None, None, None, MUL4, None, None, None, None, None, None],
-                     [BLUE, None, None, None, None, None, None, None, None, None, None, None, None, BLUE],
-                     [BLUE, RED_, None, None, None, None, None, None, None, None, None, None, RED_, BLUE],
-                     [BLUE, GRN_, GRN_, None, None, None, None, None, None, None, None, GRN_, GRN_, BLUE],
-                     [BLUE, RED_, RED_, RED_, None, None, None, None, None, None, RED_, RED_, RED_, BLUE],
-                     [BLUE, BLUE, BLUE, BLUE, BLUE, None, None, None, None, BLUE, BLUE, BLUE, BLUE, BLUE]]
-
-        self.icons = [MAGNET, SCORE, MAGNET, SCORE, SHOOT, LIFE]
+    grid = ((BLUE, BLUE, BLUE, BLUE, BLUE, None, None, None, None, BLUE, BLUE, BLUE, BLUE, BLUE),
+            (BLUE, RED_, RED_, RED_, None, None, None, None, None, None, RED_, RED_, RED_, BLUE),
+            (BLUE, GRN_, GRN_, None, None, None, None, None, None, None, None, GRN_, GRN_, BLUE),
+            (BLUE, RED_, None, None, None, None, None, None, None, None, None, None, RED_, BLUE),
+            (BLUE, None, None, None, None, None, MUL4, None, None, None, None, None, None, BLUE),
+            (None, None, None, None, None, None, None, MUL4, None, None, None, None, None, None),
+            (BLUE, None, None, None, None, None, None, None, None, None, None, None, None, BLUE),
+            (BLUE, RED_, None, None, None, None, None, None, None, None, None, None, RED_, BLUE),
+            (BLUE, GRN_, GRN_, None, None, None, None, None, None, None, None, GRN_, GRN_, BLUE),
+            (BLUE, RED_, RED_, RED_, None, None, None, None, None, None, RED_, RED_, RED_, BLUE),
+            (BLUE, BLUE, BLUE, BLUE, BLUE, None, None, None, None, BLUE, BLUE, BLUE, BLUE, BLUE))
+
+    icons = (MAGNET, SCORE, MAGNET, SCORE, SHOOT, LIFE)
 
 
 class Level6(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, REDL, None, None, None, None, None, None, BLUL, None, None, None],
-                     [None, None, REDL, RGRY, REDL, None, None, None, None, BLUL, LGRY, BLUL, None, None],
-                     [None, REDL, None, MUL4, None, REDL, None, None, BLUL, None, MUL4, None, BLUL, None],
-                     [None, None, REDL, None, REDL, None, None, None, None, BLUL, None, BLUL, None, None],
-                     [None, None, None, REDL, None, None, BLUL, REDL, None, None, BLUL, None, None, None],
-                     [None, None, None, None, None, BLUL, BBB_, CUP_, REDL, None, None, None, None, None],
-                     [None, None, None, None, None, REDL, CUP_, FNM_, BLUL, None, None, None, None, None],
-                     [None, None, None, BLUL, None, None, REDL, BLUL, None, None, REDL, None, None, None],
-                     [None, None, BLUL, None, BLUL, None, None, None, None, REDL, None, REDL, None, None],
-                     [None, BLUL, None, MUL4, None, BLUL, None, None, REDL, None, MUL4, None, REDL, None],
-                     [None, None, BLUL, RGRY, BLUL, None, None, None, None, REDL, LGRY, REDL, None, None],
-                     [None, None, None, BLUL, None, None, None, None, None, None, REDL, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, HAPY, HAPY, None, None, None, None, None, None],
-                     [None, None, None, None, None, HAPY, None, None, HAPY, None, None, None, None, None],
-                     [None, None, None, None, HAPY, None, PINK, PINK, None, HAPY, None, None, None, None],
-                     [None, None, None, None, None, HAPY, None, None, HAPY, None, None, None, None, None],
-                     [None, None, None, None, None, None, HAPY, HAPY, None, None, None, None, None, None]]
-
-        self.icons = [SCORE, LIFE, SAFETY, SCORE, LENGTHEN]
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, REDL, None, None, None, None, None, None, BLUL, None, None, None),
+            (None, None, REDL, RGRY, REDL, None, None, None, None, BLUL, LGRY, BLUL, None, None),
+            (None, REDL, None, MUL4, None, REDL, None, None, BLUL, None, MUL4, None, BLUL, None),
+            (None, None, REDL, None, REDL, None, None, None, None, BLUL, None, BLUL, None, None),
+            (None, None, None, REDL, None, None, BLUL, REDL, None, None, BLUL, None, None, None),
+            (None, None, None, None, None, BLUL, BBB_, CUP_, REDL, None, None, None, None, None),
+            (None, None, None, None, None, REDL, CUP_, FNM_, BLUL, None, None, None, None, None),
+            (None, None, None, BLUL, None, None, REDL, BLUL, None, None, REDL, None, None, None),
+            (None, None, BLUL, None, BLUL, None, None, None, None, REDL, None, REDL, None, None),
+            (None, BLUL, None, MUL4, None, BLUL, None, None, REDL, None, MUL4, None, REDL, None),
+            (None, None, BLUL, RGRY, BLUL, None, None, None, None, REDL, LGRY, REDL, None, None),
+            (None, None, None, BLUL, None, None, None, None, None, None, REDL, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, HAPY, HAPY, None, None, None, None, None, None),
+            (None, None, None, None, None, HAPY, None, None, HAPY, None, None, None, None, None),
+            (None, None, None, None, HAPY, None, PINK, PINK, None, HAPY, None, None, None, None),
+            (None, None, None, None, None, HAPY, None, None, HAPY, None, None, None, None, None),
+            (None, None, None, None, None, None, HAPY, HAPY, None, None, None, None, None, None))
+
+    icons = (SCORE, LIFE, SAFETY, SCORE, LENGTHEN)
 
 
 class Level7(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, None, None, None],
-                     [None, None, None, GREY, BLUL, BLUL, BLUL, GRNL, GRNL, GRNL, GREY, None, None, None],
-                     [None, None, None, GREY, BLUL, GREY, GREY, GREY, GREY, GRNL, GREY, None, None, None],
-                     [None, None, None, GREY, BLUL, GREY, None, None, GREY, GRNL, GREY, None, None, None],
-                     [None, None, None, GREY, GRNL, GREY, None, None, GREY, BLUL, GREY, None, None, None],
-                     [None, None, None, GREY, GRNL, GREY, GREY, GREY, GREY, BLUL, GREY, None, None, None],
-                     [None, None, None, GREY, GRNL, GRNL, GRNL, BLUL, BLUL, BLUL, GREY, None, None, None],
-                     [None, None, None, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, None],
-                     [None, GREY, GRNL, GRNL, GRNL, GRNL, GRNL, BLUL, BLUL, BLUL, BLUL, BLUL, GREY, None],
-                     [None, GREY, GRNL, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, BLUL, GREY, None],
-                     [None, GREY, GRNL, GREY, None, None, None, None, None, None, GREY, BLUL, GREY, None],
-                     [None, GREY, BLUL, GREY, None, None, None, None, None, None, GREY, GRNL, GREY, None],
-                     [None, GREY, BLUL, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GRNL, GREY, None],
-                     [None, GREY, BLUL, BLUL, BLUL, BLUL, BLUL, GRNL, GRNL, GRNL, GRNL, GRNL, GREY, None],
-                     [None, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, None]]
-
-        self.icons = [SPEED, MAGNET, ADVANCE, SLOW, INVINCIBLE, SPLIT]
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, None, None, None),
+            (None, None, None, GREY, BLUL, BLUL, BLUL, GRNL, GRNL, GRNL, GREY, None, None, None),
+            (None, None, None, GREY, BLUL, GREY, GREY, GREY, GREY, GRNL, GREY, None, None, None),
+            (None, None, None, GREY, BLUL, GREY, None, None, GREY, GRNL, GREY, None, None, None),
+            (None, None, None, GREY, GRNL, GREY, None, None, GREY, BLUL, GREY, None, None, None),
+            (None, None, None, GREY, GRNL, GREY, GREY, GREY, GREY, BLUL, GREY, None, None, None),
+            (None, None, None, GREY, GRNL, GRNL, GRNL, BLUL, BLUL, BLUL, GREY, None, None, None),
+            (None, None, None, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, None),
+            (None, GREY, GRNL, GRNL, GRNL, GRNL, GRNL, BLUL, BLUL, BLUL, BLUL, BLUL, GREY, None),
+            (None, GREY, GRNL, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, BLUL, GREY, None),
+            (None, GREY, GRNL, GREY, None, None, None, None, None, None, GREY, BLUL, GREY, None),
+            (None, GREY, BLUL, GREY, None, None, None, None, None, None, GREY, GRNL, GREY, None),
+            (None, GREY, BLUL, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GRNL, GREY, None),
+            (None, GREY, BLUL, BLUL, BLUL, BLUL, BLUL, GRNL, GRNL, GRNL, GRNL, GRNL, GREY, None),
+            (None, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, None))
+
+    icons = (SPEED, MAGNET, ADVANCE, SLOW, INVINCIBLE, SPLIT)
 
 
 class Level8(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, MUL2, MUL2, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, REDB, REDB, None, None, None, None, None, None],
-                     [RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [GREY, GRN_, GREY, GRN_, GREY, GRN_, GREY, GREY, GRN_, GREY, GRN_, GREY, GRN_, GREY],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, RGRY, RGRY, None, None, None, None, None, None, LGRY, LGRY, None, None],
-                     [None, None, RGRY, RGRY, None, None, None, None, None, None, LGRY, LGRY, None, None]]
-
-        self.icons = [SAFETY, SHORTEN, SPLIT, LENGTHEN, LIFE, SPEED, SPLIT, SHORTEN, SCORE]
+    grid = ((None, None, None, None, None, None, MUL2, MUL2, None, None, None, None, None, None),
+            (None, None, None, None, None, None, REDB, REDB, None, None, None, None, None, None),
+            (RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (GREY, GRN_, GREY, GRN_, GREY, GRN_, GREY, GREY, GRN_, GREY, GRN_, GREY, GRN_, GREY),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, RGRY, RGRY, None, None, None, None, None, None, LGRY, LGRY, None, None),
+            (None, None, RGRY, RGRY, None, None, None, None, None, None, LGRY, LGRY, None, None))
+
+    icons = (SAFETY, SHORTEN, SPLIT, LENGTHEN, LIFE, SPEED, SPLIT, SHORTEN, SCORE)
 
 
 class Level9(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, AQUA, AQUA, None, None, None, None, None, None, AQUA, AQUA, None, None],
-                     [None, GREY, RED_, RED_, AQUA, None, None, None, None, AQUA, RED_, RED_, GREY, None],
-                     [None, GREY, RED_, RED_, AQUA, None, None, None, None, AQUA, RED_, RED_, GREY, None],
-                     [None, None, GREY, RED_, RED_, AQUA, None, None, AQUA, RED_, RED_, GREY, None, None],
-                     [None, None, None, GREY, RED_, RED_, AQUA, AQUA, RED_, RED_, GREY, None, None, None],
-                     [None, None, None, None, GREY, RED_, RED_, RED_, RED_, GREY, None, None, None, None],
-                     [None, None, None, None, None, GREY, RED_, RED_, GREY, None, None, None, None, None],
-                     [None, None, None, None, None, None, REDB, REDB, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, REDB, REDB, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, REDB, REDB, None, None, None, None, None, None],
-                     [None, None, None, None, None, GREY, RED_, RED_, GREY, None, None, None, None, None],
-                     [None, None, None, None, GREY, RED_, RED_, RED_, RED_, GREY, None, None, None, None],
-                     [None, None, None, GREY, RED_, RED_, AQUA, AQUA, RED_, RED_, GREY, None, None, None],
-                     [None, None, GREY, RED_, RED_, AQUA, None, None, AQUA, RED_, RED_, GREY, None, None],
-                     [None, GREY, RED_, RED_, AQUA, None, None, None, None, AQUA, RED_, RED_, GREY, None],
-                     [None, GREY, RED_, RED_, AQUA, None, None, None, None, AQUA, RED_, RED_, GREY, None],
-                     [None, None, AQUA, AQUA, None, None, None, None, None, None, AQUA, AQUA, None, None]]
-
-        self.icons = [LIFE, LENGTHEN, SHOOT, SPLIT, SPEED, SAFETY, SHOOT, LENGTHEN, SCORE, SLOW]
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, AQUA, AQUA, None, None, None, None, None, None, AQUA, AQUA, None, None),
+            (None, GREY, RED_, RED_, AQUA, None, None, None, None, AQUA, RED_, RED_, GREY, None),
+            (None, GREY, RED_, RED_, AQUA, None, None, None, None, AQUA, RED_, RED_, GREY, None),
+            (None, None, GREY, RED_, RED_, AQUA, None, None, AQUA, RED_, RED_, GREY, None, None),
+            (None, None, None, GREY, RED_, RED_, AQUA, AQUA, RED_, RED_, GREY, None, None, None),
+            (None, None, None, None, GREY, RED_, RED_, RED_, RED_, GREY, None, None, None, None),
+            (None, None, None, None, None, GREY, RED_, RED_, GREY, None, None, None, None, None),
+            (None, None, None, None, None, None, REDB, REDB, None, None, None, None, None, None),
+            (None, None, None, None, None, None, REDB, REDB, None, None, None, None, None, None),
+            (None, None, None, None, None, None, REDB, REDB, None, None, None, None, None, None),
+            (None, None, None, None, None, GREY, RED_, RED_, GREY, None, None, None, None, None),
+            (None, None, None, None, GREY, RED_, RED_, RED_, RED_, GREY, None, None, None, None),
+            (None, None, None, GREY, RED_, RED_, AQUA, AQUA, RED_, RED_, GREY, None, None, None),
+            (None, None, GREY, RED_, RED_, AQUA, None, None, AQUA, RED_, RED_, GREY, None, None),
+            (None, GREY, RED_, RED_, AQUA, None, None, None, None, AQUA, RED_, RED_, GREY, None),
+            (None, GREY, RED_, RED_, AQUA, None, None, None, None, AQUA, RED_, RED_, GREY, None),
+            (None, None, AQUA, AQUA, None, None, None, None, None, None, AQUA, AQUA, None, None))
+
+    icons = (LIFE, LENGTHEN, SHOOT, SPLIT, SPEED, SAFETY, SHOOT, LENGTHEN, SCORE, SLOW)
 
 
 class Level10(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, HAPY, HAPY, None, None, None, None, None, None],
-                     [None, None, None, None, None, HAPY, None, None, HAPY, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE],
-                     [None, RED_, None, RED_, None, RED_, None, None, RED_, None, RED_, None, RED_, None],
-                     [None, None, None, None, None, None, PINK, UK__, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, KNYA, PINK, None, None, None, None, None, None],
-                     [BLUE, None, BLUE, None, BLUE, None, BLUE, BLUE, None, BLUE, None, BLUE, None, BLUE],
-                     [RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, SAD_, None, None, SAD_, None, None, None, None, None],
-                     [None, None, None, None, None, None, SAD_, SAD_, None, None, None, None, None, None]]
-
-        self.icons = [INVINCIBLE, LENGTHEN, SCORE, SAFETY, SHORTEN, SPEED, SHOOT]
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, HAPY, HAPY, None, None, None, None, None, None),
+            (None, None, None, None, None, HAPY, None, None, HAPY, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE, BLUE),
+            (None, RED_, None, RED_, None, RED_, None, None, RED_, None, RED_, None, RED_, None),
+            (None, None, None, None, None, None, PINK, UK__, None, None, None, None, None, None),
+            (None, None, None, None, None, None, KNYA, PINK, None, None, None, None, None, None),
+            (BLUE, None, BLUE, None, BLUE, None, BLUE, BLUE, None, BLUE, None, BLUE, None, BLUE),
+            (RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_, RED_),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, SAD_, None, None, SAD_, None, None, None, None, None),
+            (None, None, None, None, None, None, SAD_, SAD_, None, None, None, None, None, None))
+
+    icons = (INVINCIBLE, LENGTHEN, SCORE, SAFETY, SHORTEN, SPEED, SHOOT)
 
 
 class Level11(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, HAPY, SAD_, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [GREY, None, GREY, None, GREY, None, GREY, None, GREY, None, GREY, None, GREY, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [BLOK, PINK, BLOK, PINK, BLOK, PINK, BLOK, PINK, BLOK, PINK, BLOK, PINK, BLOK, PINK],
-                     [BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None],
-                     [BLOK, BLUL, BLOK, REDL, BLOK, BLUL, BLOK, REDL, BLOK, BLUL, BLOK, REDL, BLOK, BLUL],
-                     [BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None],
-                     [BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None],
-                     [BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None],
-                     [BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None],
-                     [BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None],
-                     [BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None]]
-
-        self.icons = [LENGTHEN, MAGNET, SAFETY, SLOW, MAGNET, LENGTHEN, LIFE, LIFE]
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, HAPY, SAD_, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (GREY, None, GREY, None, GREY, None, GREY, None, GREY, None, GREY, None, GREY, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (BLOK, PINK, BLOK, PINK, BLOK, PINK, BLOK, PINK, BLOK, PINK, BLOK, PINK, BLOK, PINK),
+            (BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None),
+            (BLOK, BLUL, BLOK, REDL, BLOK, BLUL, BLOK, REDL, BLOK, BLUL, BLOK, REDL, BLOK, BLUL),
+            (BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None),
+            (BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None),
+            (BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None),
+            (BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None),
+            (BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None),
+            (BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None, BLOK, None))
+
+    icons = (LENGTHEN, MAGNET, SAFETY, SLOW, MAGNET, LENGTHEN, LIFE, LIFE)
 
 
 class Level12(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, REDB, None, BONB, KNYA, None, REDB, None, None, None, None],
-                     [AQUA, None, None, PINK, None, None, UK__, BONO, None, None, PINK, None, None, AQUA],
-                     [None, None, REDB, None, None, None, BONN, KNYA, None, None, None, REDB, None, None],
-                     [AQUA, None, None, PINK, None, None, UK__, BONU, None, None, PINK, None, None, AQUA],
-                     [None, None, None, None, RGRY, None, BONS, KNYA, None, LGRY, None, None, None, None],
-                     [AQUA, None, None, None, RGRY, None, None, None, None, LGRY, None, None, None, AQUA],
-                     [None, None, None, None, MUL4, RGRY, MUL4, MUL4, LGRY, MUL4, None, None, None, None],
-                     [AQUA, None, None, None, None, None, None, None, None, None, None, None, None, AQUA],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [BLUE, BLUE, None, None, None, None, None, None, None, None, None, None, BLUE, BLUE],
-                     [BLUE, BLUE, None, None, None, MUL2, None, None, MUL2, None, None, None, BLUE, BLUE]]
-
-        self.icons = [SLOW, SCORE, SPEED, SPLIT, LENGTHEN, LENGTHEN, LIFE]
+    grid = ((None, None, None, None, REDB, None, BONB, KNYA, None, REDB, None, None, None, None),
+            (AQUA, None, None, PINK, None, None, UK__, BONO, None, None, PINK, None, None, AQUA),
+            (None, None, REDB, None, None, None, BONN, KNYA, None, None, None, REDB, None, None),
+            (AQUA, None, None, PINK, None, None, UK__, BONU, None, None, PINK, None, None, AQUA),
+            (None, None, None, None, RGRY, None, BONS, KNYA, None, LGRY, None, None, None, None),
+            (AQUA, None, None, None, RGRY, None, None, None, None, LGRY, None, None, None, AQUA),
+            (None, None, None, None, MUL4, RGRY, MUL4, MUL4, LGRY, MUL4, None, None, None, None),
+            (AQUA, None, None, None, None, None, None, None, None, None, None, None, None, AQUA),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (BLUE, BLUE, None, None, None, None, None, None, None, None, None, None, BLUE, BLUE),
+            (BLUE, BLUE, None, None, None, MUL2, None, None, MUL2, None, None, None, BLUE, BLUE))
+
+    icons = (SLOW, SCORE, SPEED, SPLIT, LENGTHEN, LENGTHEN, LIFE)
 
 
 class Level13(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, GREY, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, GREY, None, None, None, GRYL, GRYL, None, None, None, None, None, None],
-                     [None, None, NWAL, None, None, GRYL, GRYL, GRYL, GRYL, None, None, None, None, None],
-                     [None, None, NWAL, None, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, None, None, None, None],
-                     [None, None, NWAL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, None, None, None],
-                     [None, None, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, None, None],
-                     [None, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, None],
-                     [None, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, NWAL, None],
-                     [None, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, NWAL, None],
-                     [None, NWAL, RED_, RED_, RED_, RWAL, RWAL, RWAL, NWAL, RED_, RED_, RED_, NWAL, None],
-                     [None, NWAL, RED_, HAPY, RED_, RWAL, RWAL, RWAL, NWAL, RED_, HAPY, RED_, NWAL, None],
-                     [None, NWAL, RED_, RED_, RED_, RWAL, RWAL, RWAL, NWAL, RED_, RED_, RED_, NWAL, None],
-                     [None, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, NWAL, None],
-                     [None, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, NWAL, None],
-                     [None, RWAL, RWAL, RWAL, RWAL, NWAL, GRN_, GRN_, RWAL, RWAL, RWAL, RWAL, NWAL, None],
-                     [None, RWAL, RWAL, RWAL, RWAL, NWAL, GRN_, GRN_, RWAL, RWAL, RWAL, RWAL, NWAL, None],
-                     [None, RWAL, RWAL, RWAL, RWAL, NWAL, BLOK, BLOK, RWAL, RWAL, RWAL, RWAL, NWAL, None],
-                     [None, RWAL, RWAL, RWAL, RWAL, NWAL, GRN_, GRN_, RWAL, RWAL, RWAL, RWAL, NWAL, None],
-                     [None, RWAL, RWAL, RWAL, RWAL, NWAL, GRN_, GRN_, RWAL, RWAL, RWAL, RWAL, NWAL, None]]
-
-        self.icons = [LENGTHEN, SCORE, INVINCIBLE, SPLIT, LENGTHEN, SHORTEN, LENGTHEN, SHORTEN, LIFE,
-                      SPLIT, SPEED]
+    grid = ((None, GREY, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, GREY, None, None, None, GRYL, GRYL, None, None, None, None, None, None),
+            (None, None, NWAL, None, None, GRYL, GRYL, GRYL, GRYL, None, None, None, None, None),
+            (None, None, NWAL, None, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, None, None, None, None),
+            (None, None, NWAL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, None, None, None),
+            (None, None, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, None, None),
+            (None, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, GRYL, None),
+            (None, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, NWAL, None),
+            (None, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, NWAL, None),
+            (None, NWAL, RED_, RED_, RED_, RWAL, RWAL, RWAL, NWAL, RED_, RED_, RED_, NWAL, None),
+            (None, NWAL, RED_, HAPY, RED_, RWAL, RWAL, RWAL, NWAL, RED_, HAPY, RED_, NWAL, None),
+            (None, NWAL, RED_, RED_, RED_, RWAL, RWAL, RWAL, NWAL, RED_, RED_, RED_, NWAL, None),
+            (None, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, NWAL, None),
+            (None, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, NWAL, None),
+            (None, RWAL, RWAL, RWAL, RWAL, NWAL, GRN_, GRN_, RWAL, RWAL, RWAL, RWAL, NWAL, None),
+            (None, RWAL, RWAL, RWAL, RWAL, NWAL, GRN_, GRN_, RWAL, RWAL, RWAL, RWAL, NWAL, None),
+            (None, RWAL, RWAL, RWAL, RWAL, NWAL, BLOK, BLOK, RWAL, RWAL, RWAL, RWAL, NWAL, None),
+            (None, RWAL, RWAL, RWAL, RWAL, NWAL, GRN_, GRN_, RWAL, RWAL, RWAL, RWAL, NWAL, None),
+            (None, RWAL, RWAL, RWAL, RWAL, NWAL, GRN_, GRN_, RWAL, RWAL, RWAL, RWAL, NWAL, None))
+
+    icons = (LENGTHEN, SCORE, INVINCIBLE, SPLIT, LENGTHEN, SHORTEN, LENGTHEN, SHORTEN, LIFE,
+             SPLIT, SPEED)
 
 
 class Level14(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, REDL, None],
-                     [None, None, None, None, None, None, REDL, None, None, BLUE, None, REDL, GREY, REDL],
-                     [None, None, REDL, None, None, REDL, BONO, REDL, None, BLUE, None, None, REDL, None],
-                     [None, REDL, BONB, REDL, None, None, REDL, None, None, None, None, None, None, None],
-                     [None, None, REDL, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, REDL, None, None, None, None],
-                     [None, None, None, None, GRN_, GRN_, None, None, REDL, BONU, REDL, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, REDL, None, None, None, None],
-                     [None, None, None, None, REDL, None, None, None, None, None, None, None, None, None],
-                     [HAPY, HAPY, None, REDL, BONN, REDL, None, None, None, None, None, None, None, None],
-                     [None, SAD_, SAD_, None, REDL, None, None, None, GRN_, GRN_, None, None, REDL, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, REDL, BONS, REDL],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, REDL, None],
-                     [None, None, None, REDB, PINK, None, None, REDL, None, None, None, None, None, None],
-                     [None, REDL, None, None, None, None, REDL, GRYL, REDL, None, None, None, None, None],
-                     [REDL, GREY, REDL, None, None, None, None, REDL, None, None, None, None, None, None],
-                     [None, REDL, None, None, HAPY, None, None, None, None, None, SAD_, None, None, None],
-                     [None, None, None, None, SAD_, HAPY, SAD_, None, None, None, SAD_, HAPY, SAD_, None],
-                     [None, None, None, None, None, HAPY, None, None, None, None, None, HAPY, None, None]]
-
-        self.icons = [LENGTHEN, SCORE, ADVANCE, LENGTHEN, INVINCIBLE, LIFE, SPEED, SPLIT]
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, REDL, None),
+            (None, None, None, None, None, None, REDL, None, None, BLUE, None, REDL, GREY, REDL),
+            (None, None, REDL, None, None, REDL, BONO, REDL, None, BLUE, None, None, REDL, None),
+            (None, REDL, BONB, REDL, None, None, REDL, None, None, None, None, None, None, None),
+            (None, None, REDL, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, REDL, None, None, None, None),
+            (None, None, None, None, GRN_, GRN_, None, None, REDL, BONU, REDL, None, None, None),
+            (None, None, None, None, None, None, None, None, None, REDL, None, None, None, None),
+            (None, None, None, None, REDL, None, None, None, None, None, None, None, None, None),
+            (HAPY, HAPY, None, REDL, BONN, REDL, None, None, None, None, None, None, None, None),
+            (None, SAD_, SAD_, None, REDL, None, None, None, GRN_, GRN_, None, None, REDL, None),
+            (None, None, None, None, None, None, None, None, None, None, None, REDL, BONS, REDL),
+            (None, None, None, None, None, None, None, None, None, None, None, None, REDL, None),
+            (None, None, None, REDB, PINK, None, None, REDL, None, None, None, None, None, None),
+            (None, REDL, None, None, None, None, REDL, GRYL, REDL, None, None, None, None, None),
+            (REDL, GREY, REDL, None, None, None, None, REDL, None, None, None, None, None, None),
+            (None, REDL, None, None, HAPY, None, None, None, None, None, SAD_, None, None, None),
+            (None, None, None, None, SAD_, HAPY, SAD_, None, None, None, SAD_, HAPY, SAD_, None),
+            (None, None, None, None, None, HAPY, None, None, None, None, None, HAPY, None, None))
+
+    icons = (LENGTHEN, SCORE, ADVANCE, LENGTHEN, INVINCIBLE, LIFE, SPEED, SPLIT)
 
 
 class Level15(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, AQUL, None, None, None, None, None, None, AQUL, None, None, None],
-                     [None, None, REDL, NWAL, REDL, None, None, None, None, REDL, NWAL, REDL, None, None],
-                     [None, BLUL, REDL, CUP_, REDL, AQUL, AQUL, AQUL, AQUL, REDL, CUP_, REDL, BLUL, None],
-                     [BLUL, NWAL, REDL, NWAL, REDL, None, CUP_, CUP_, None, REDL, NWAL, REDL, NWAL, BLUL],
-                     [BLUL, RWAL, NWAL, BLUL, None, NWAL, CUP_, CUP_, NWAL, None, BLUL, RWAL, NWAL, BLUL],
-                     [AQUL, RWAL, NWAL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, RWAL, NWAL, AQUL],
-                     [REDL, RWAL, NWAL, GRNL, None, NWAL, CUP_, CUP_, NWAL, None, GRNL, RWAL, NWAL, REDL],
-                     [REDL, NWAL, BLUL, NWAL, BLUL, None, CUP_, CUP_, None, BLUL, NWAL, BLUL, NWAL, REDL],
-                     [None, REDL, BLUL, CUP_, BLUL, GRNL, GRNL, GRNL, GRNL, BLUL, CUP_, BLUL, REDL, None],
-                     [None, None, BLUL, NWAL, BLUL, None, None, None, None, BLUL, NWAL, BLUL, None, None],
-                     [None, None, None, GRNL, None, None, None, None, None, None, GRNL, None, None, None]]
-
-        self.icons = [LENGTHEN, SHOOT, SPLIT, SAFETY, SHORTEN, LENGTHEN, INVINCIBLE, SCORE, MAGNET]
+    grid = ((None, None, None, AQUL, None, None, None, None, None, None, AQUL, None, None, None),
+            (None, None, REDL, NWAL, REDL, None, None, None, None, REDL, NWAL, REDL, None, None),
+            (None, BLUL, REDL, CUP_, REDL, AQUL, AQUL, AQUL, AQUL, REDL, CUP_, REDL, BLUL, None),
+            (BLUL, NWAL, REDL, NWAL, REDL, None, CUP_, CUP_, None, REDL, NWAL, REDL, NWAL, BLUL),
+            (BLUL, RWAL, NWAL, BLUL, None, NWAL, CUP_, CUP_, NWAL, None, BLUL, RWAL, NWAL, BLUL),
+            (AQUL, RWAL, NWAL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, REDL, RWAL, NWAL, AQUL),
+            (REDL, RWAL, NWAL, GRNL, None, NWAL, CUP_, CUP_, NWAL, None, GRNL, RWAL, NWAL, REDL),
+            (REDL, NWAL, BLUL, NWAL, BLUL, None, CUP_, CUP_, None, BLUL, NWAL, BLUL, NWAL, REDL),
+            (None, REDL, BLUL, CUP_, BLUL, GRNL, GRNL, GRNL, GRNL, BLUL, CUP_, BLUL, REDL, None),
+            (None, None, BLUL, NWAL, BLUL, None, None, None, None, BLUL, NWAL, BLUL, None, None),
+            (None, None, None, GRNL, None, None, None, None, None, None, GRNL, None, None, None))
+
+    icons = (LENGTHEN, SHOOT, SPLIT, SAFETY, SHORTEN, LENGTHEN, INVINCIBLE, SCORE, MAGNET)
 
 
 class Level16(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, RWAL, NWAL, RED_, RED_, RWAL, NWAL, None, None, None, None],
-                     [None, UK__, UK__, UK__, REDB, None, REDB, REDB, None, REDB, KNYA, KNYA, KNYA, None],
-                     [REDB, None, None, None, CUP_, CUP_, BBB_, FNM_, CUP_, CUP_, None, None, None, REDB],
-                     [None, None, None, None, None, GREY, None, None, GREY, None, None, None, None, None],
-                     [None, None, None, GREY, GREY, RED_, None, None, BLUE, GREY, GREY, None, None, None],
-                     [None, None, GREY, None, None, None, BLUE, RED_, None, None, None, GREY, None, None],
-                     [None, None, GREY, None, None, None, RED_, BLUE, None, None, None, GREY, None, None],
-                     [None, None, GREY, None, None, GRN_, None, None, GRN_, None, None, GREY, None, None],
-                     [None, None, BONB, BONO, BONN, BONU, BONS, LGRY, LGRY, LGRY, LGRY, LGRY, None, None],
-                     [None, MUL4, None, None, None, None, None, None, None, None, None, None, MUL4, None],
-                     [MUL4, None, None, None, None, None, None, None, None, None, None, None, None, MUL4],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, MUL2, MUL1, MUL1, MUL2, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, NWAL]]
-
-        self.icons = [LENGTHEN, SHOOT, SAFETY, MAGNET, ADVANCE, LIFE, SCORE, SHORTEN, SPEED, SLOW]
+    grid = ((None, None, None, None, RWAL, NWAL, RED_, RED_, RWAL, NWAL, None, None, None, None),
+            (None, UK__, UK__, UK__, REDB, None, REDB, REDB, None, REDB, KNYA, KNYA, KNYA, None),
+            (REDB, None, None, None, CUP_, CUP_, BBB_, FNM_, CUP_, CUP_, None, None, None, REDB),
+            (None, None, None, None, None, GREY, None, None, GREY, None, None, None, None, None),
+            (None, None, None, GREY, GREY, RED_, None, None, BLUE, GREY, GREY, None, None, None),
+            (None, None, GREY, None, None, None, BLUE, RED_, None, None, None, GREY, None, None),
+            (None, None, GREY, None, None, None, RED_, BLUE, None, None, None, GREY, None, None),
+            (None, None, GREY, None, None, GRN_, None, None, GRN_, None, None, GREY, None, None),
+            (None, None, BONB, BONO, BONN, BONU, BONS, LGRY, LGRY, LGRY, LGRY, LGRY, None, None),
+            (None, MUL4, None, None, None, None, None, None, None, None, None, None, MUL4, None),
+            (MUL4, None, None, None, None, None, None, None, None, None, None, None, None, MUL4),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, MUL2, MUL1, MUL1, MUL2, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, NWAL))
+
+    icons = (LENGTHEN, SHOOT, SAFETY, MAGNET, ADVANCE, LIFE, SCORE, SHORTEN, SPEED, SLOW)
 
 
 class Level17(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, HAPY, HAPY, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, BLUE, BLUE, None, None, None, None, None, None],
-                     [None, None, None, None, KNYA, KNYA, None, None, UK__, UK__, None, None, None, None],
-                     [None, None, None, None, REDL, REDL, None, None, REDL, REDL, None, None, None, None],
-                     [None, None, BLUE, BLUE, None, None, None, None, None, None, BLUE, BLUE, None, None],
-                     [None, None, BLUE, BLUE, None, None, None, None, None, None, BLUE, BLUE, None, None],
-                     [None, None, None, None, GRNL, GRNL, None, None, GRNL, GRNL, None, None, None, None],
-                     [None, None, None, None, GRNL, BLOK, None, None, BLOK, GRNL, None, None, None, None],
-                     [None, None, None, None, None, None, AQUA, AQUA, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, AQUA, AQUA, None, None, None, None, None, None],
-                     [None, None, None, None, GRNL, BLOK, None, None, BLOK, GRNL, None, None, None, None],
-                     [None, None, None, None, GRNL, GRNL, None, None, GRNL, GRNL, None, None, None, None],
-                     [None, None, BLUE, BLUE, None, None, None, None, None, None, BLUE, BLUE, None, None],
-                     [None, None, BLUE, BLUE, None, None, None, None, None, None, BLUE, BLUE, None, None],
-                     [GREY, RGRY, None, None, REDL, REDL, None, None, REDL, REDL, None, None, LGRY, GREY],
-                     [RGRY, GREY, None, None, CUP_, FNM_, None, None, BBB_, CUP_, None, None, GREY, LGRY]]
-
-        self.icons = [INVINCIBLE, SPEED, SCORE, SHOOT, SAFETY, LENGTHEN, MAGNET, SLOW]
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, HAPY, HAPY, None, None, None, None, None, None),
+            (None, None, None, None, None, None, BLUE, BLUE, None, None, None, None, None, None),
+            (None, None, None, None, KNYA, KNYA, None, None, UK__, UK__, None, None, None, None),
+            (None, None, None, None, REDL, REDL, None, None, REDL, REDL, None, None, None, None),
+            (None, None, BLUE, BLUE, None, None, None, None, None, None, BLUE, BLUE, None, None),
+            (None, None, BLUE, BLUE, None, None, None, None, None, None, BLUE, BLUE, None, None),
+            (None, None, None, None, GRNL, GRNL, None, None, GRNL, GRNL, None, None, None, None),
+            (None, None, None, None, GRNL, BLOK, None, None, BLOK, GRNL, None, None, None, None),
+            (None, None, None, None, None, None, AQUA, AQUA, None, None, None, None, None, None),
+            (None, None, None, None, None, None, AQUA, AQUA, None, None, None, None, None, None),
+            (None, None, None, None, GRNL, BLOK, None, None, BLOK, GRNL, None, None, None, None),
+            (None, None, None, None, GRNL, GRNL, None, None, GRNL, GRNL, None, None, None, None),
+            (None, None, BLUE, BLUE, None, None, None, None, None, None, BLUE, BLUE, None, None),
+            (None, None, BLUE, BLUE, None, None, None, None, None, None, BLUE, BLUE, None, None),
+            (GREY, RGRY, None, None, REDL, REDL, None, None, REDL, REDL, None, None, LGRY, GREY),
+            (RGRY, GREY, None, None, CUP_, FNM_, None, None, BBB_, CUP_, None, None, GREY, LGRY))
+
+    icons = (INVINCIBLE, SPEED, SCORE, SHOOT, SAFETY, LENGTHEN, MAGNET, SLOW)
 
 
 class Level18(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, REDL, None, None, None, None, REDL, None, None, None, None],
-                     [None, None, None, REDL, GRNL, None, None, None, None, GRNL, REDL, None, None, None],
-                     [None, None, None, GRNL, GRNL, None, None, None, None, GRNL, GRNL, None, None, None],
-                     [None, None, None, GRNL, BLUL, None, None, None, None, BLUL, GRNL, None, None, None],
-                     [None, None, None, BLUL, AQUL, None, BLUL, BLUL, None, AQUL, BLUL, None, None, None],
-                     [None, None, None, AQUL, AQUL, BLUL, RED_, RED_, BLUL, AQUL, AQUL, None, None, None],
-                     [None, None, None, BLUL, AQUL, None, BLUL, BLUL, None, AQUL, BLUL, None, None, None],
-                     [None, None, None, GRNL, BLUL, None, None, None, None, BLUL, GRNL, None, None, None],
-                     [None, None, None, GRNL, GRNL, None, None, None, None, GRNL, GRNL, None, None, None],
-                     [None, None, None, REDL, GRNL, None, None, None, None, GRNL, REDL, None, None, None],
-                     [BLOK, None, None, None, REDL, None, None, None, None, REDL, None, None, None, BLOK],
-                     [None, MUL4, None, None, None, None, None, None, None, None, None, None, MUL4, None],
-                     [None, None, BLOK, None, None, None, None, None, None, None, None, BLOK, None, None],
-                     [None, None, None, BLOK, None, None, None, None, None, None, BLOK, None, None, None],
-                     [None, None, None, None, BLOK, None, None, None, None, BLOK, None, None, None, None],
-                     [None, None, None, None, None, BLOK, BLOK, BLOK, BLOK, None, None, None, None, None],
-                     [None, None, None, None, None, BLOK, RED_, RED_, BLOK, None, None, None, None, None],
-                     [None, None, None, None, None, BLOK, MUL4, MUL4, BLOK, None, None, None, None, None]]
-
-        self.icons = [SLOW, MAGNET, LIFE, LENGTHEN, SPEED, SPEED, SCORE, SAFETY, SAFETY, LIFE]
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, REDL, None, None, None, None, REDL, None, None, None, None),
+            (None, None, None, REDL, GRNL, None, None, None, None, GRNL, REDL, None, None, None),
+            (None, None, None, GRNL, GRNL, None, None, None, None, GRNL, GRNL, None, None, None),
+            (None, None, None, GRNL, BLUL, None, None, None, None, BLUL, GRNL, None, None, None),
+            (None, None, None, BLUL, AQUL, None, BLUL, BLUL, None, AQUL, BLUL, None, None, None),
+            (None, None, None, AQUL, AQUL, BLUL, RED_, RED_, BLUL, AQUL, AQUL, None, None, None),
+            (None, None, None, BLUL, AQUL, None, BLUL, BLUL, None, AQUL, BLUL, None, None, None),
+            (None, None, None, GRNL, BLUL, None, None, None, None, BLUL, GRNL, None, None, None),
+            (None, None, None, GRNL, GRNL, None, None, None, None, GRNL, GRNL, None, None, None),
+            (None, None, None, REDL, GRNL, None, None, None, None, GRNL, REDL, None, None, None),
+            (BLOK, None, None, None, REDL, None, None, None, None, REDL, None, None, None, BLOK),
+            (None, MUL4, None, None, None, None, None, None, None, None, None, None, MUL4, None),
+            (None, None, BLOK, None, None, None, None, None, None, None, None, BLOK, None, None),
+            (None, None, None, BLOK, None, None, None, None, None, None, BLOK, None, None, None),
+            (None, None, None, None, BLOK, None, None, None, None, BLOK, None, None, None, None),
+            (None, None, None, None, None, BLOK, BLOK, BLOK, BLOK, None, None, None, None, None),
+            (None, None, None, None, None, BLOK, RED_, RED_, BLOK, None, None, None, None, None),
+            (None, None, None, None, None, BLOK, MUL4, MUL4, BLOK, None, None, None, None, None))
+
+    icons = (SLOW, MAGNET, LIFE, LENGTHEN, SPEED, SPEED, SCORE, SAFETY, SAFETY, LIFE)
 
 
 class Level19(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[REDL, GRYL, None, None, None, None, None, None, None, None, None, None, GRYL, REDL],
-                     [None, REDL, BLUL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, BLUL, REDL, None],
-                     [None, None, REDL, BLUL, None, None, None, None, None, None, BLUL, REDL, None, None],
-                     [None, None, None, REDL, BLUL, None, None, None, None, BLUL, REDL, None, None, None],
-                     [None, None, None, None, REDL, PINK, None, None, PINK, REDL, None, None, None, None],
-                     [None, None, None, None, None, REDL, BLUL, BLUL, REDL, None, None, None, None, None],
-                     [None, None, None, None, None, GRYL, UK__, KNYA, GRYL, None, None, None, None, None],
-                     [None, None, None, None, None, GRYL, KNYA, UK__, GRYL, None, None, None, None, None],
-                     [None, None, None, None, None, REDL, BLUL, BLUL, REDL, None, None, None, None, None],
-                     [None, None, None, None, REDL, PINK, None, None, PINK, REDL, None, None, None, None],
-                     [None, None, None, REDL, BLUL, None, None, None, None, BLUL, REDL, None, None, None],
-                     [None, None, REDL, BLUL, None, None, None, None, None, None, BLUL, REDL, None, None],
-                     [None, REDL, BLUL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, BLUL, REDL, None],
-                     [REDL, GRYL, None, None, None, None, None, None, None, None, None, None, GRYL, REDL]]
-
-        self.icons = [SPLIT, INVINCIBLE, ADVANCE, LIFE, SCORE, SHORTEN, SPEED, SLOW]
+    grid = ((REDL, GRYL, None, None, None, None, None, None, None, None, None, None, GRYL, REDL),
+            (None, REDL, BLUL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, BLUL, REDL, None),
+            (None, None, REDL, BLUL, None, None, None, None, None, None, BLUL, REDL, None, None),
+            (None, None, None, REDL, BLUL, None, None, None, None, BLUL, REDL, None, None, None),
+            (None, None, None, None, REDL, PINK, None, None, PINK, REDL, None, None, None, None),
+            (None, None, None, None, None, REDL, BLUL, BLUL, REDL, None, None, None, None, None),
+            (None, None, None, None, None, GRYL, UK__, KNYA, GRYL, None, None, None, None, None),
+            (None, None, None, None, None, GRYL, KNYA, UK__, GRYL, None, None, None, None, None),
+            (None, None, None, None, None, REDL, BLUL, BLUL, REDL, None, None, None, None, None),
+            (None, None, None, None, REDL, PINK, None, None, PINK, REDL, None, None, None, None),
+            (None, None, None, REDL, BLUL, None, None, None, None, BLUL, REDL, None, None, None),
+            (None, None, REDL, BLUL, None, None, None, None, None, None, BLUL, REDL, None, None),
+            (None, REDL, BLUL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, GRNL, BLUL, REDL, None),
+            (REDL, GRYL, None, None, None, None, None, None, None, None, None, None, GRYL, REDL))
+
+    icons = (SPLIT, INVINCIBLE, ADVANCE, LIFE, SCORE, SHORTEN, SPEED, SLOW)
 
 
 class Level20(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[SAD_, SAD_, None, None, CUP_, None, None, None, None, CUP_, None, None, SAD_, SAD_],
-                     [SAD_, None, None, CUP_, CUP_, CUP_, None, None, CUP_, CUP_, CUP_, None, None, SAD_],
-                     [None, None, None, None, CUP_, None, None, None, None, CUP_, None, None, None, None],
-                     [None, None, None, None, None, MUL4, MUL4, MUL4, MUL4, None, None, None, None, None],
-                     [None, None, None, None, None, MUL4, PINK, PINK, MUL4, None, None, None, None, None],
-                     [None, None, BBB_, None, None, MUL4, RED_, RED_, MUL4, None, None, FNM_, None, None],
-                     [None, BBB_, REDB, BBB_, None, MUL4, RED_, RED_, MUL4, None, FNM_, REDB, FNM_, None],
-                     [None, BBB_, REDB, BBB_, None, MUL4, RED_, RED_, MUL4, None, FNM_, REDB, FNM_, None],
-                     [None, None, BBB_, None, None, MUL4, RED_, RED_, MUL4, None, None, FNM_, None, None],
-                     [None, None, None, None, None, MUL4, PINK, PINK, MUL4, None, None, None, None, None],
-                     [None, None, None, None, None, MUL4, MUL4, MUL4, MUL4, None, None, None, None, None],
-                     [None, None, None, None, CUP_, None, None, None, None, CUP_, None, None, None, None],
-                     [SAD_, None, None, CUP_, CUP_, CUP_, None, None, CUP_, CUP_, CUP_, None, None, SAD_],
-                     [SAD_, SAD_, None, None, CUP_, None, None, None, None, CUP_, None, None, SAD_, SAD_]]
-
-        self.icons = [LENGTHEN, INVINCIBLE, SPLIT, SHOOT, LENGTHEN, SHORTEN, MAGNET, SHOOT]
+    grid = ((SAD_, SAD_, None, None, CUP_, None, None, None, None, CUP_, None, None, SAD_, SAD_),
+            (SAD_, None, None, CUP_, CUP_, CUP_, None, None, CUP_, CUP_, CUP_, None, None, SAD_),
+            (None, None, None, None, CUP_, None, None, None, None, CUP_, None, None, None, None),
+            (None, None, None, None, None, MUL4, MUL4, MUL4, MUL4, None, None, None, None, None),
+            (None, None, None, None, None, MUL4, PINK, PINK, MUL4, None, None, None, None, None),
+            (None, None, BBB_, None, None, MUL4, RED_, RED_, MUL4, None, None, FNM_, None, None),
+            (None, BBB_, REDB, BBB_, None, MUL4, RED_, RED_, MUL4, None, FNM_, REDB, FNM_, None),
+            (None, BBB_, REDB, BBB_, None, MUL4, RED_, RED_, MUL4, None, FNM_, REDB, FNM_, None),
+            (None, None, BBB_, None, None, MUL4, RED_, RED_, MUL4, None, None, FNM_, None, None),
+            (None, None, None, None, None, MUL4, PINK, PINK, MUL4, None, None, None, None, None),
+            (None, None, None, None, None, MUL4, MUL4, MUL4, MUL4, None, None, None, None, None),
+            (None, None, None, None, CUP_, None, None, None, None, CUP_, None, None, None, None),
+            (SAD_, None, None, CUP_, CUP_, CUP_, None, None, CUP_, CUP_, CUP_, None, None, SAD_),
+            (SAD_, SAD_, None, None, CUP_, None, None, None, None, CUP_, None, None, SAD_, SAD_))
+
+    icons = (LENGTHEN, INVINCIBLE, SPLIT, SHOOT, LENGTHEN, SHORTEN, MAGNET, SHOOT)
 
 
 class Level21(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, HAPY, None, None, None, None, HAPY, HAPY, None, None, None, None, HAPY, None],
-                     [None, SAD_, REDL, None, None, None, KNYA, REDL, None, None, None, REDL, SAD_, None],
-                     [None, None, KNYA, REDL, None, None, REDL, UK__, None, None, REDL, UK__, None, None],
-                     [None, None, None, REDL, REDL, None, KNYA, REDL, None, REDL, REDL, None, None, None],
-                     [None, None, None, None, KNYA, REDL, REDL, UK__, REDL, UK__, None, None, None, None],
-                     [None, None, None, None, None, REDL, None, None, REDL, None, None, None, None, None],
-                     [HAPY, REDL, KNYA, REDL, KNYA, None, PINK, PINK, None, UK__, REDL, UK__, REDL, HAPY],
-                     [SAD_, KNYA, REDL, KNYA, REDL, None, PINK, PINK, None, REDL, UK__, REDL, UK__, SAD_],
-                     [None, None, None, None, None, REDL, None, None, REDL, None, None, None, None, None],
-                     [None, None, None, None, KNYA, REDL, REDL, UK__, REDL, UK__, None, None, None, None],
-                     [None, None, None, REDL, REDL, None, KNYA, REDL, None, REDL, REDL, None, None, None],
-                     [None, None, KNYA, REDL, None, None, REDL, UK__, None, None, REDL, UK__, None, None],
-                     [None, HAPY, REDL, None, None, None, KNYA, REDL, None, None, None, REDL, HAPY, None],
-                     [None, SAD_, None, None, None, None, SAD_, SAD_, None, None, None, None, SAD_, None]]
-
-        self.icons = [LIFE, SHOOT, SPLIT, SLOW, INVINCIBLE, LENGTHEN, SPEED, SCORE, SHORTEN]
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, HAPY, None, None, None, None, HAPY, HAPY, None, None, None, None, HAPY, None),
+            (None, SAD_, REDL, None, None, None, KNYA, REDL, None, None, None, REDL, SAD_, None),
+            (None, None, KNYA, REDL, None, None, REDL, UK__, None, None, REDL, UK__, None, None),
+            (None, None, None, REDL, REDL, None, KNYA, REDL, None, REDL, REDL, None, None, None),
+            (None, None, None, None, KNYA, REDL, REDL, UK__, REDL, UK__, None, None, None, None),
+            (None, None, None, None, None, REDL, None, None, REDL, None, None, None, None, None),
+            (HAPY, REDL, KNYA, REDL, KNYA, None, PINK, PINK, None, UK__, REDL, UK__, REDL, HAPY),
+            (SAD_, KNYA, REDL, KNYA, REDL, None, PINK, PINK, None, REDL, UK__, REDL, UK__, SAD_),
+            (None, None, None, None, None, REDL, None, None, REDL, None, None, None, None, None),
+            (None, None, None, None, KNYA, REDL, REDL, UK__, REDL, UK__, None, None, None, None),
+            (None, None, None, REDL, REDL, None, KNYA, REDL, None, REDL, REDL, None, None, None),
+            (None, None, KNYA, REDL, None, None, REDL, UK__, None, None, REDL, UK__, None, None),
+            (None, HAPY, REDL, None, None, None, KNYA, REDL, None, None, None, REDL, HAPY, None),
+            (None, SAD_, None, None, None, None, SAD_, SAD_, None, None, None, None, SAD_, None))
+
+    icons = (LIFE, SHOOT, SPLIT, SLOW, INVINCIBLE, LENGTHEN, SPEED, SCORE, SHORTEN)
 
 
 class Level22(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[REDB, None, None, REDB, None, GRN_, None, None, GRN_, None, REDB, None, None, REDB],
-                     [REDB, REDB, REDB, REDB, None, GRN_, GRN_, GRN_, GRN_, None, REDB, REDB, REDB, REDB],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, None, None, None],
-                     [GRN_, GRN_, None, AQUA, None, None, None, None, None, None, AQUA, None, GRN_, GRN_],
-                     [None, GRN_, None, RED_, None, None, None, None, None, None, RED_, None, GRN_, None],
-                     [None, GRN_, None, None, None, RED_, None, None, RED_, None, None, None, GRN_, None],
-                     [None, GRN_, None, None, None, AQUA, AQUA, AQUA, AQUA, None, None, None, GRN_, None],
-                     [None, GRN_, None, None, None, RED_, None, None, RED_, None, None, None, GRN_, None],
-                     [None, GRN_, None, RED_, None, None, None, None, None, None, RED_, None, GRN_, None],
-                     [GRN_, GRN_, None, AQUA, None, None, None, None, None, None, AQUA, None, GRN_, GRN_],
-                     [None, None, None, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [REDB, REDB, REDB, REDB, None, GRN_, GRN_, GRN_, GRN_, None, REDB, REDB, REDB, REDB],
-                     [REDB, None, None, REDB, None, GRN_, None, None, GRN_, None, REDB, None, None, REDB]]
-
-        self.icons = [LENGTHEN, LENGTHEN, SAFETY, SLOW, SPEED, ADVANCE, SCORE, SHORTEN, SHOOT]
+    grid = ((REDB, None, None, REDB, None, GRN_, None, None, GRN_, None, REDB, None, None, REDB),
+            (REDB, REDB, REDB, REDB, None, GRN_, GRN_, GRN_, GRN_, None, REDB, REDB, REDB, REDB),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, None, None, None),
+            (GRN_, GRN_, None, AQUA, None, None, None, None, None, None, AQUA, None, GRN_, GRN_),
+            (None, GRN_, None, RED_, None, None, None, None, None, None, RED_, None, GRN_, None),
+            (None, GRN_, None, None, None, RED_, None, None, RED_, None, None, None, GRN_, None),
+            (None, GRN_, None, None, None, AQUA, AQUA, AQUA, AQUA, None, None, None, GRN_, None),
+            (None, GRN_, None, None, None, RED_, None, None, RED_, None, None, None, GRN_, None),
+            (None, GRN_, None, RED_, None, None, None, None, None, None, RED_, None, GRN_, None),
+            (GRN_, GRN_, None, AQUA, None, None, None, None, None, None, AQUA, None, GRN_, GRN_),
+            (None, None, None, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, AQUA, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (REDB, REDB, REDB, REDB, None, GRN_, GRN_, GRN_, GRN_, None, REDB, REDB, REDB, REDB),
+            (REDB, None, None, REDB, None, GRN_, None, None, GRN_, None, REDB, None, None, REDB))
+
+    icons = (LENGTHEN, LENGTHEN, SAFETY, SLOW, SPEED, ADVANCE, SCORE, SHORTEN, SHOOT)
 
 
 class Level23(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, MUL4, MUL4, None, None, None, None, None, None],
-                     [None, None, None, None, None, GREY, REDL, REDL, GREY, None, None, None, None, None],
-                     [None, None, None, None, GREY, BLUL, CUP_, CUP_, BLUL, GREY, None, None, None, None],
-                     [None, None, None, GREY, BLUL, CUP_, CUP_, CUP_, CUP_, BLUL, GREY, None, None, None],
-                     [None, None, GREY, GRNL, GRNL, BBB_, BBB_, BBB_, BBB_, GRNL, GRNL, GREY, None, None],
-                     [NWAL, BONS, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, NWAL, GREY, NWAL],
-                     [None, None, BONU, GRNL, GRNL, FNM_, FNM_, FNM_, FNM_, GRNL, GRNL, GREY, None, None],
-                     [None, None, None, BONN, BLUL, CUP_, CUP_, CUP_, CUP_, BLUL, GREY, None, None, None],
-                     [None, None, None, None, BONO, BLUL, CUP_, CUP_, BLUL, GREY, None, None, None, None],
-                     [None, None, None, None, None, BONB, REDL, REDL, GREY, None, None, None, None, None],
-                     [None, None, None, None, None, None, MUL4, MUL4, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, GRN_, None, GRN_, None, None, None, None, GRN_, None, GRN_, None, None],
-                     [None, None, None, GRN_, None, None, None, None, None, None, GRN_, None, None, None],
-                     [None, None, GRN_, None, GRN_, None, None, None, None, GRN_, None, GRN_, None, None],
-                     [None, GRN_, None, GRN_, None, GRN_, None, None, GRN_, None, GRN_, None, GRN_, None],
-                     [PINK, None, GRN_, None, GRN_, None, PINK, PINK, None, GRN_, None, GRN_, None, PINK]]
-
-        self.icons = [SHOOT, LENGTHEN, SCORE, SPLIT, INVINCIBLE, SPEED, SHORTEN, SHORTEN, LIFE]
+    grid = ((None, None, None, None, None, None, MUL4, MUL4, None, None, None, None, None, None),
+            (None, None, None, None, None, GREY, REDL, REDL, GREY, None, None, None, None, None),
+            (None, None, None, None, GREY, BLUL, CUP_, CUP_, BLUL, GREY, None, None, None, None),
+            (None, None, None, GREY, BLUL, CUP_, CUP_, CUP_, CUP_, BLUL, GREY, None, None, None),
+            (None, None, GREY, GRNL, GRNL, BBB_, BBB_, BBB_, BBB_, GRNL, GRNL, GREY, None, None),
+            (NWAL, BONS, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, RWAL, NWAL, GREY, NWAL),
+            (None, None, BONU, GRNL, GRNL, FNM_, FNM_, FNM_, FNM_, GRNL, GRNL, GREY, None, None),
+            (None, None, None, BONN, BLUL, CUP_, CUP_, CUP_, CUP_, BLUL, GREY, None, None, None),
+            (None, None, None, None, BONO, BLUL, CUP_, CUP_, BLUL, GREY, None, None, None, None),
+            (None, None, None, None, None, BONB, REDL, REDL, GREY, None, None, None, None, None),
+            (None, None, None, None, None, None, MUL4, MUL4, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, GRN_, None, GRN_, None, None, None, None, GRN_, None, GRN_, None, None),
+            (None, None, None, GRN_, None, None, None, None, None, None, GRN_, None, None, None),
+            (None, None, GRN_, None, GRN_, None, None, None, None, GRN_, None, GRN_, None, None),
+            (None, GRN_, None, GRN_, None, GRN_, None, None, GRN_, None, GRN_, None, GRN_, None),
+            (PINK, None, GRN_, None, GRN_, None, PINK, PINK, None, GRN_, None, GRN_, None, PINK))
+
+    icons = (SHOOT, LENGTHEN, SCORE, SPLIT, INVINCIBLE, SPEED, SHORTEN, SHORTEN, LIFE)
 
 
 class Level24(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[REDB, REDB, None, None, None, None, PINK, PINK, None, None, None, None, REDB, REDB],
-                     [REDB, None, None, None, None, AQUL, None, None, AQUL, None, None, None, None, REDB],
-                     [None, None, None, None, AQUL, GRNL, REDL, REDL, GRNL, AQUL, None, None, None, None],
-                     [None, None, None, None, None, AQUL, None, None, AQUL, None, None, None, None, None],
-                     [None, None, None, PINK, PINK, None, PINK, PINK, None, PINK, PINK, None, None, None],
-                     [None, None, AQUL, None, REDL, RGRY, None, None, LGRY, REDL, None, AQUL, None, None],
-                     [None, AQUL, None, REDL, None, None, AQUL, AQUL, None, None, REDL, None, AQUL, None],
-                     [PINK, PINK, REDL, GRNL, REDL, AQUL, BLOK, BLOK, AQUL, REDL, GRNL, REDL, PINK, PINK],
-                     [None, AQUL, None, REDL, None, None, AQUL, AQUL, None, None, REDL, None, AQUL, None],
-                     [None, None, AQUL, None, REDL, RGRY, None, None, LGRY, REDL, None, AQUL, None, None],
-                     [None, None, None, PINK, PINK, None, PINK, PINK, None, PINK, PINK, None, None, None],
-                     [None, None, None, None, None, AQUL, None, None, AQUL, None, None, None, None, None],
-                     [None, None, None, None, AQUL, GRNL, REDL, REDL, GRNL, AQUL, None, None, None, None],
-                     [REDB, None, None, None, None, AQUL, None, None, AQUL, None, None, None, None, REDB],
-                     [REDB, REDB, None, None, None, None, PINK, PINK, None, None, None, None, REDB, REDB]]
-
-        self.icons = [INVINCIBLE, SHOOT, SAFETY, SCORE, SPEED, SLOW, LENGTHEN, SHOOT, SHORTEN, SPEED,
-                      MAGNET, LIFE]
+    grid = ((REDB, REDB, None, None, None, None, PINK, PINK, None, None, None, None, REDB, REDB),
+            (REDB, None, None, None, None, AQUL, None, None, AQUL, None, None, None, None, REDB),
+            (None, None, None, None, AQUL, GRNL, REDL, REDL, GRNL, AQUL, None, None, None, None),
+            (None, None, None, None, None, AQUL, None, None, AQUL, None, None, None, None, None),
+            (None, None, None, PINK, PINK, None, PINK, PINK, None, PINK, PINK, None, None, None),
+            (None, None, AQUL, None, REDL, RGRY, None, None, LGRY, REDL, None, AQUL, None, None),
+            (None, AQUL, None, REDL, None, None, AQUL, AQUL, None, None, REDL, None, AQUL, None),
+            (PINK, PINK, REDL, GRNL, REDL, AQUL, BLOK, BLOK, AQUL, REDL, GRNL, REDL, PINK, PINK),
+            (None, AQUL, None, REDL, None, None, AQUL, AQUL, None, None, REDL, None, AQUL, None),
+            (None, None, AQUL, None, REDL, RGRY, None, None, LGRY, REDL, None, AQUL, None, None),
+            (None, None, None, PINK, PINK, None, PINK, PINK, None, PINK, PINK, None, None, None),
+            (None, None, None, None, None, AQUL, None, None, AQUL, None, None, None, None, None),
+            (None, None, None, None, AQUL, GRNL, REDL, REDL, GRNL, AQUL, None, None, None, None),
+            (REDB, None, None, None, None, AQUL, None, None, AQUL, None, None, None, None, REDB),
+            (REDB, REDB, None, None, None, None, PINK, PINK, None, None, None, None, REDB, REDB))
+
+    icons = (INVINCIBLE, SHOOT, SAFETY, SCORE, SPEED, SLOW, LENGTHEN, SHOOT, SHORTEN, SPEED,
+             MAGNET, LIFE)
 
 
 class Level25(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[REDL, PINK, None, None, None, HAPY, None, None, HAPY, None, None, None, PINK, REDL],
-                     [REDL, None, GREY, GREY, None, None, HAPY, HAPY, None, None, GREY, GREY, None, REDL],
-                     [None, None, None, None, GREY, HAPY, None, None, HAPY, GREY, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, REDL, None, None, GRNL, None, None, GRNL, None, None, BLUL, None, None],
-                     [None, REDL, CUP_, BLUL, None, None, GRNL, GRNL, None, None, BLUL, CUP_, REDL, None],
-                     [None, BLUL, CUP_, REDL, None, None, GRNL, GRNL, None, None, REDL, CUP_, BLUL, None],
-                     [None, None, REDL, None, None, GRNL, None, None, GRNL, None, None, BLUL, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, BLOK, BLOK, BLOK, BLOK, BLOK, BLOK, None, None, None, None],
-                     [None, None, None, BLOK, BLUL, REDL, BLUL, REDL, BLUL, REDL, BLOK, None, None, None],
-                     [None, None, BLOK, BLUL, REDL, BLUL, REDL, BLUL, REDL, BLUL, REDL, BLOK, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, PINK, PINK, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, PINK, PINK, None, None, None, None, None, None]]
-
-        self.icons = [LIFE, SPEED, LENGTHEN, INVINCIBLE, SPLIT, MAGNET, SCORE, SHORTEN, SLOW, ADVANCE]
+    grid = ((REDL, PINK, None, None, None, HAPY, None, None, HAPY, None, None, None, PINK, REDL),
+            (REDL, None, GREY, GREY, None, None, HAPY, HAPY, None, None, GREY, GREY, None, REDL),
+            (None, None, None, None, GREY, HAPY, None, None, HAPY, GREY, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, REDL, None, None, GRNL, None, None, GRNL, None, None, BLUL, None, None),
+            (None, REDL, CUP_, BLUL, None, None, GRNL, GRNL, None, None, BLUL, CUP_, REDL, None),
+            (None, BLUL, CUP_, REDL, None, None, GRNL, GRNL, None, None, REDL, CUP_, BLUL, None),
+            (None, None, REDL, None, None, GRNL, None, None, GRNL, None, None, BLUL, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, BLOK, BLOK, BLOK, BLOK, BLOK, BLOK, None, None, None, None),
+            (None, None, None, BLOK, BLUL, REDL, BLUL, REDL, BLUL, REDL, BLOK, None, None, None),
+            (None, None, BLOK, BLUL, REDL, BLUL, REDL, BLUL, REDL, BLUL, REDL, BLOK, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, PINK, PINK, None, None, None, None, None, None),
+            (None, None, None, None, None, None, PINK, PINK, None, None, None, None, None, None))
+
+    icons = (LIFE, SPEED, LENGTHEN, INVINCIBLE, SPLIT, MAGNET, SCORE, SHORTEN, SLOW, ADVANCE)
 
 
 class Level26(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, GRN_, None, GRN_, None, None, None, None, RED_, None, None, None, None, None],
-                     [RED_, None, None, None, RED_, None, None, GRN_, HAPY, GRN_, None, None, None, None],
-                     [RED_, None, None, None, RED_, None, None, None, RED_, None, None, None, GRN_, None],
-                     [None, RED_, None, RED_, None, None, None, None, None, None, None, RED_, None, None],
-                     [None, RED_, None, RED_, None, None, None, None, None, None, GRN_, None, None, None],
-                     [None, None, BBB_, None, None, None, None, None, None, RED_, None, None, None, SAD_],
-                     [None, None, CUP_, None, None, None, None, None, GRN_, None, None, None, SAD_, None],
-                     [None, None, BBB_, None, None, None, None, RED_, None, None, None, None, None, None],
-                     [GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY],
-                     [None, None, None, None, None, None, GRN_, None, None, None, None, FNM_, None, None],
-                     [None, HAPY, None, None, None, RED_, None, None, None, None, None, CUP_, None, None],
-                     [HAPY, None, None, None, GRN_, None, None, None, None, None, None, FNM_, None, None],
-                     [None, None, None, RED_, None, None, None, None, None, None, GRN_, None, GRN_, None],
-                     [None, None, GRN_, None, None, None, None, None, None, None, GRN_, None, GRN_, None],
-                     [None, RED_, None, None, None, GRN_, None, None, None, GRN_, None, None, None, GRN_],
-                     [None, None, None, None, RED_, SAD_, RED_, None, None, GRN_, None, None, None, GRN_],
-                     [None, None, None, None, None, GRN_, None, None, None, None, RED_, None, RED_, None]]
-
-        self.icons = [LENGTHEN, SHORTEN, SHORTEN, SPEED, SLOW, SCORE, SPLIT, SPEED, SAFETY]
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, GRN_, None, GRN_, None, None, None, None, RED_, None, None, None, None, None),
+            (RED_, None, None, None, RED_, None, None, GRN_, HAPY, GRN_, None, None, None, None),
+            (RED_, None, None, None, RED_, None, None, None, RED_, None, None, None, GRN_, None),
+            (None, RED_, None, RED_, None, None, None, None, None, None, None, RED_, None, None),
+            (None, RED_, None, RED_, None, None, None, None, None, None, GRN_, None, None, None),
+            (None, None, BBB_, None, None, None, None, None, None, RED_, None, None, None, SAD_),
+            (None, None, CUP_, None, None, None, None, None, GRN_, None, None, None, SAD_, None),
+            (None, None, BBB_, None, None, None, None, RED_, None, None, None, None, None, None),
+            (GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY, GREY),
+            (None, None, None, None, None, None, GRN_, None, None, None, None, FNM_, None, None),
+            (None, HAPY, None, None, None, RED_, None, None, None, None, None, CUP_, None, None),
+            (HAPY, None, None, None, GRN_, None, None, None, None, None, None, FNM_, None, None),
+            (None, None, None, RED_, None, None, None, None, None, None, GRN_, None, GRN_, None),
+            (None, None, GRN_, None, None, None, None, None, None, None, GRN_, None, GRN_, None),
+            (None, RED_, None, None, None, GRN_, None, None, None, GRN_, None, None, None, GRN_),
+            (None, None, None, None, RED_, SAD_, RED_, None, None, GRN_, None, None, None, GRN_),
+            (None, None, None, None, None, GRN_, None, None, None, None, RED_, None, RED_, None))
+
+    icons = (LENGTHEN, SHORTEN, SHORTEN, SPEED, SLOW, SCORE, SPLIT, SPEED, SAFETY)
 
 
 class Level27(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, RED_, RED_, AQUA, AQUA, None, None, None, None, None],
-                     [None, None, None, None, GRYL, None, None, None, None, GRYL, None, None, None, None],
-                     [None, None, None, BLUE, None, None, AQUA, RED_, None, None, GRN_, None, None, None],
-                     [None, None, None, BLUE, None, GRN_, None, None, BLUE, None, GRN_, None, None, None],
-                     [None, None, None, GRN_, None, BLUE, None, None, GRN_, None, BLUE, None, None, None],
-                     [None, None, None, GRN_, None, None, RED_, AQUA, None, None, BLUE, None, None, None],
-                     [None, None, None, None, GRYL, None, None, None, None, GRYL, None, None, None, None],
-                     [None, None, None, None, None, AQUA, AQUA, RED_, RED_, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [RGRY, GRN_, REDB, GRN_, REDB, GRN_, REDB, REDB, GRN_, REDB, GRN_, REDB, GRN_, LGRY],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [RGRY, None, None, GRN_, PINK, GRN_, PINK, PINK, GRN_, PINK, GRN_, None, None, LGRY],
-                     [None, None, HAPY, None, None, None, None, None, None, None, None, HAPY, None, None],
-                     [RGRY, None, None, None, None, GRN_, REDB, REDB, GRN_, None, None, None, None, LGRY],
-                     [None, None, HAPY, None, CUP_, None, None, None, None, CUP_, None, HAPY, None, None],
-                     [BLOK, BLOK, BLOK, BLOK, BLOK, BLOK, MUL4, MUL4, BLOK, BLOK, BLOK, BLOK, BLOK, BLOK],
-                     [BLOK, BLOK, BLOK, BLOK, BLOK, BLOK, MUL4, MUL4, BLOK, BLOK, BLOK, BLOK, BLOK, BLOK]]
-
-        self.icons = [MAGNET, LIFE, SAFETY, LENGTHEN, MAGNET, LENGTHEN, SPEED, SHORTEN, SCORE, ADVANCE,
-                      SPLIT, SLOW, LIFE]
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, RED_, RED_, AQUA, AQUA, None, None, None, None, None),
+            (None, None, None, None, GRYL, None, None, None, None, GRYL, None, None, None, None),
+            (None, None, None, BLUE, None, None, AQUA, RED_, None, None, GRN_, None, None, None),
+            (None, None, None, BLUE, None, GRN_, None, None, BLUE, None, GRN_, None, None, None),
+            (None, None, None, GRN_, None, BLUE, None, None, GRN_, None, BLUE, None, None, None),
+            (None, None, None, GRN_, None, None, RED_, AQUA, None, None, BLUE, None, None, None),
+            (None, None, None, None, GRYL, None, None, None, None, GRYL, None, None, None, None),
+            (None, None, None, None, None, AQUA, AQUA, RED_, RED_, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (RGRY, GRN_, REDB, GRN_, REDB, GRN_, REDB, REDB, GRN_, REDB, GRN_, REDB, GRN_, LGRY),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (RGRY, None, None, GRN_, PINK, GRN_, PINK, PINK, GRN_, PINK, GRN_, None, None, LGRY),
+            (None, None, HAPY, None, None, None, None, None, None, None, None, HAPY, None, None),
+            (RGRY, None, None, None, None, GRN_, REDB, REDB, GRN_, None, None, None, None, LGRY),
+            (None, None, HAPY, None, CUP_, None, None, None, None, CUP_, None, HAPY, None, None),
+            (BLOK, BLOK, BLOK, BLOK, BLOK, BLOK, MUL4, MUL4, BLOK, BLOK, BLOK, BLOK, BLOK, BLOK),
+            (BLOK, BLOK, BLOK, BLOK, BLOK, BLOK, MUL4, MUL4, BLOK, BLOK, BLOK, BLOK, BLOK, BLOK))
+
+    icons = (MAGNET, LIFE, SAFETY, LENGTHEN, MAGNET, LENGTHEN, SPEED, SHORTEN, SCORE, ADVANCE,
+             SPLIT, SLOW, LIFE)
 
 
 class Level28(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, RGRY, None, None, None, MUL4, None, None, MUL4, None, None, None, LGRY, None],
-                     [BLUL, None, REDL, RGRY, MUL4, None, None, None, None, MUL4, LGRY, REDL, None, BLUL],
-                     [None, RGRY, None, MUL4, None, None, None, None, None, None, MUL4, None, LGRY, None],
-                     [BLUL, None, REDL, MUL4, None, None, None, None, None, None, MUL4, REDL, None, BLUL],
-                     [None, RGRY, None, MUL4, None, None, None, None, None, None, MUL4, None, LGRY, None],
-                     [BLUL, None, REDL, MUL4, None, None, None, None, None, None, MUL4, REDL, None, BLUL],
-                     [None, RGRY, None, MUL4, None, None, None, None, None, None, MUL4, None, LGRY, None],
-                     [BLUL, None, REDL, MUL4, None, None, HAPY, HAPY, None, None, MUL4, REDL, None, BLUL],
-                     [None, RGRY, None, MUL4, None, None, SAD_, SAD_, None, None, MUL4, None, LGRY, None],
-                     [BLUL, None, REDL, MUL4, None, None, None, None, None, None, MUL4, REDL, None, BLUL],
-                     [None, RGRY, None, MUL4, None, None, None, None, None, None, MUL4, None, LGRY, None],
-                     [BLUL, None, REDL, MUL4, None, None, None, None, None, None, MUL4, REDL, None, BLUL],
-                     [None, RGRY, None, MUL4, None, None, None, None, None, None, MUL4, None, LGRY, None],
-                     [BLUL, None, REDL, MUL4, None, None, None, None, None, None, MUL4, REDL, None, BLUL],
-                     [None, RGRY, None, MUL4, None, None, None, None, None, None, MUL4, None, LGRY, None],
-                     [BLUL, None, REDL, RGRY, MUL4, None, None, None, None, MUL4, LGRY, REDL, None, BLUL],
-                     [REDB, REDB, REDB, REDB, REDB, MUL4, None, None, MUL4, REDB, REDB, REDB, REDB, REDB]]
-
-        self.icons = [SHOOT, INVINCIBLE, SCORE, SPLIT, SPEED, LIFE, SHOOT, SCORE, LENGTHEN, SHORTEN,
-                      SPEED, SHORTEN]
+    grid = ((None, RGRY, None, None, None, MUL4, None, None, MUL4, None, None, None, LGRY, None),
+            (BLUL, None, REDL, RGRY, MUL4, None, None, None, None, MUL4, LGRY, REDL, None, BLUL),
+            (None, RGRY, None, MUL4, None, None, None, None, None, None, MUL4, None, LGRY, None),
+            (BLUL, None, REDL, MUL4, None, None, None, None, None, None, MUL4, REDL, None, BLUL),
+            (None, RGRY, None, MUL4, None, None, None, None, None, None, MUL4, None, LGRY, None),
+            (BLUL, None, REDL, MUL4, None, None, None, None, None, None, MUL4, REDL, None, BLUL),
+            (None, RGRY, None, MUL4, None, None, None, None, None, None, MUL4, None, LGRY, None),
+            (BLUL, None, REDL, MUL4, None, None, HAPY, HAPY, None, None, MUL4, REDL, None, BLUL),
+            (None, RGRY, None, MUL4, None, None, SAD_, SAD_, None, None, MUL4, None, LGRY, None),
+            (BLUL, None, REDL, MUL4, None, None, None, None, None, None, MUL4, REDL, None, BLUL),
+            (None, RGRY, None, MUL4, None, None, None, None, None, None, MUL4, None, LGRY, None),
+            (BLUL, None, REDL, MUL4, None, None, None, None, None, None, MUL4, REDL, None, BLUL),
+            (None, RGRY, None, MUL4, None, None, None, None, None, None, MUL4, None, LGRY, None),
+            (BLUL, None, REDL, MUL4, None, None, None, None, None, None, MUL4, REDL, None, BLUL),
+            (None, RGRY, None, MUL4, None, None, None, None, None, None, MUL4, None, LGRY, None),
+            (BLUL, None, REDL, RGRY, MUL4, None, None, None, None, MUL4, LGRY, REDL, None, BLUL),
+            (REDB, REDB, REDB, REDB, REDB, MUL4, None, None, MUL4, REDB, REDB, REDB, REDB, REDB))
+
+    icons = (SHOOT, INVINCIBLE, SCORE, SPLIT, SPEED, LIFE, SHOOT, SCORE, LENGTHEN, SHORTEN,
+             SPEED, SHORTEN)
 
 
 class Level29(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, BONO, REDL, REDL, BLUL, None, None, None, None, BONN, REDL, REDL, BLUL, None],
-                     [None, REDL, None, None, REDL, None, BLUE, BLUE, None, REDL, None, None, REDL, None],
-                     [None, REDL, RWAL, NWAL, REDL, None, BLUE, None, None, REDL, RWAL, NWAL, REDL, None],
-                     [None, REDL, None, None, REDL, None, BLUE, None, None, REDL, None, None, REDL, None],
-                     [None, BLUL, REDL, REDL, BLUL, None, None, None, None, BLUL, REDL, REDL, BLUL, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, None, None, BONS, REDL, REDL, AQUL, None, None, None, None, None],
-                     [None, None, BLUE, None, None, REDL, None, None, REDL, None, BLUE, BLUE, None, None],
-                     [None, None, BLUE, BLUE, None, REDL, None, None, REDL, None, None, BLUE, None, None],
-                     [None, None, None, None, None, REDL, None, None, REDL, None, None, None, None, None],
-                     [None, None, None, None, None, AQUL, REDL, REDL, AQUL, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, BONB, REDL, REDL, GRNL, None, None, None, None, BONU, REDL, REDL, GRNL, None],
-                     [None, REDL, None, None, REDL, None, None, BLUE, None, REDL, None, None, REDL, None],
-                     [None, REDL, RWAL, NWAL, REDL, None, None, BLUE, None, REDL, RWAL, NWAL, REDL, None],
-                     [None, REDL, None, None, REDL, None, BLUE, BLUE, None, REDL, None, None, REDL, None],
-                     [None, GRNL, REDL, REDL, GRNL, None, None, None, None, GRNL, REDL, REDL, GRNL, None]]
-
-        self.icons = [INVINCIBLE, SPEED, MAGNET, LENGTHEN, SPLIT, LIFE, SHORTEN, SCORE, SPLIT]
+    grid = ((None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, BONO, REDL, REDL, BLUL, None, None, None, None, BONN, REDL, REDL, BLUL, None),
+            (None, REDL, None, None, REDL, None, BLUE, BLUE, None, REDL, None, None, REDL, None),
+            (None, REDL, RWAL, NWAL, REDL, None, BLUE, None, None, REDL, RWAL, NWAL, REDL, None),
+            (None, REDL, None, None, REDL, None, BLUE, None, None, REDL, None, None, REDL, None),
+            (None, BLUL, REDL, REDL, BLUL, None, None, None, None, BLUL, REDL, REDL, BLUL, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, None, None, BONS, REDL, REDL, AQUL, None, None, None, None, None),
+            (None, None, BLUE, None, None, REDL, None, None, REDL, None, BLUE, BLUE, None, None),
+            (None, None, BLUE, BLUE, None, REDL, None, None, REDL, None, None, BLUE, None, None),
+            (None, None, None, None, None, REDL, None, None, REDL, None, None, None, None, None),
+            (None, None, None, None, None, AQUL, REDL, REDL, AQUL, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, BONB, REDL, REDL, GRNL, None, None, None, None, BONU, REDL, REDL, GRNL, None),
+            (None, REDL, None, None, REDL, None, None, BLUE, None, REDL, None, None, REDL, None),
+            (None, REDL, RWAL, NWAL, REDL, None, None, BLUE, None, REDL, RWAL, NWAL, REDL, None),
+            (None, REDL, None, None, REDL, None, BLUE, BLUE, None, REDL, None, None, REDL, None),
+            (None, GRNL, REDL, REDL, GRNL, None, None, None, None, GRNL, REDL, REDL, GRNL, None))
+
+    icons = (INVINCIBLE, SPEED, MAGNET, LENGTHEN, SPLIT, LIFE, SHORTEN, SCORE, SPLIT)
 
 
 class Level30(Level):
-    def populate_grid_and_icons(self):
-        self.grid = [[REDL, None, None, None, None, None, REDL, REDL, None, None, None, None, None, REDL],
-                     [CUP_, REDL, AQUL, AQUL, AQUL, REDL, BLUL, GRNL, REDL, AQUL, AQUL, AQUL, REDL, CUP_],
-                     [BBB_, AQUL, RGRY, RGRY, RGRY, AQUL, GRNL, BLUL, AQUL, LGRY, LGRY, LGRY, AQUL, FNM_],
-                     [CUP_, FNM_, REDL, AQUL, REDL, None, BLUL, GRNL, None, REDL, AQUL, REDL, BBB_, CUP_],
-                     [AQUL, REDL, AQUL, CUP_, AQUL, None, GRNL, BLUL, None, AQUL, CUP_, AQUL, REDL, AQUL],
-                     [None, AQUL, None, REDL, None, None, BLUL, GRNL, None, None, REDL, None, AQUL, None],
-                     [REDL, None, None, None, REDL, AQUL, AQUL, AQUL, AQUL, REDL, None, None, None, REDL],
-                     [None, None, None, None, None, REDL, GRNL, BLUL, REDL, None, None, None, None, None],
-                     [None, None, None, None, None, None, REDL, REDL, None, None, None, None, None, None],
-                     [None, None, None, None, None, None, None, None, None, None, None, None, None, None],
-                     [None, None, None, MUL4, MUL4, None, None, None, None, MUL4, MUL4, None, None, None],
-                     [None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None],
-                     [None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None],
-                     [None, None, None, None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None],
-                     [None, None, None, None, MUL4, None, None, None, MUL4, None, None, MUL4, None, None],
-                     [None, None, None, None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None],
-                     [None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None],
-                     [None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None],
-                     [None, None, None, MUL4, MUL4, None, None, None, None, MUL4, MUL4, None, None, None]]
-
-        self.icons = [SHORTEN, LENGTHEN, SCORE, SCORE, SHOOT, SHOOT, SPEED, SAFETY, SHORTEN, INVINCIBLE,
-                      SPEED, LENGTHEN, SPEED, LIFE]
+    grid = ((REDL, None, None, None, None, None, REDL, REDL, None, None, None, None, None, REDL),
+            (CUP_, REDL, AQUL, AQUL, AQUL, REDL, BLUL, GRNL, REDL, AQUL, AQUL, AQUL, REDL, CUP_),
+            (BBB_, AQUL, RGRY, RGRY, RGRY, AQUL, GRNL, BLUL, AQUL, LGRY, LGRY, LGRY, AQUL, FNM_),
+            (CUP_, FNM_, REDL, AQUL, REDL, None, BLUL, GRNL, None, REDL, AQUL, REDL, BBB_, CUP_),
+            (AQUL, REDL, AQUL, CUP_, AQUL, None, GRNL, BLUL, None, AQUL, CUP_, AQUL, REDL, AQUL),
+            (None, AQUL, None, REDL, None, None, BLUL, GRNL, None, None, REDL, None, AQUL, None),
+            (REDL, None, None, None, REDL, AQUL, AQUL, AQUL, AQUL, REDL, None, None, None, REDL),
+            (None, None, None, None, None, REDL, GRNL, BLUL, REDL, None, None, None, None, None),
+            (None, None, None, None, None, None, REDL, REDL, None, None, None, None, None, None),
+            (None, None, None, None, None, None, None, None, None, None, None, None, None, None),
+            (None, None, None, MUL4, MUL4, None, None, None, None, MUL4, MUL4, None, None, None),
+            (None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None),
+            (None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None),
+            (None, None, None, None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None),
+            (None, None, None, None, MUL4, None, None, None, MUL4, None, None, MUL4, None, None),
+            (None, None, None, None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None),
+            (None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None),
+            (None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None, MUL4, None, None),
+            (None, None, None, MUL4, MUL4, None, None, None, None, MUL4, MUL4, None, None, None))
+
+    icons = (SHORTEN, LENGTHEN, SCORE, SCORE, SHOOT, SHOOT, SPEED, SAFETY, SHORTEN, INVINCIBLE,
+             SPEED, LENGTHEN, SPEED, LIFE)
+
+
+# All levels in the order they are played. Level n is LEVEL_TYPES[n - 1]
+LEVEL_TYPES = (Level1, Level2, Level3, Level4, Level5, Level6, Level7, Level8, Level9, Level10,
+               Level11, Level12, Level13, Level14, Level15, Level16, Level17, Level18, Level19, Level20,
+               Level21, Level22, Level23, Level24, Level25, Level26, Level27, Level28, Level29, Level30)
 
 
 # +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -1499,22 +1580,26 @@ class BouncingIntroView(arcade.View):
         super().__init__()
 
         self.view = view
+        self.is_level_intro = isinstance(view, Level)  # Otherwise the view is the game intro
 
         self.bottom = -SCREEN_HEIGHT
+        self.viewport_bottom = None  # Bottom the viewport was last set to
         self.change_y = 2
         self.bounce_count = 0
         self.elapsed_time = 0
 
         # Sounds
-        self.bounce_sound_1 = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/bounce_1.wav")
-        self.bounce_sound_2 = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/bounce_2.wav")
-        self.level_intro_whoosh_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/whoosh_2.wav")
+        self.bounce_sound_1 = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/bounce_1.wav")
+        self.bounce_sound_2 = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/bounce_2.wav")
+        self.level_intro_whoosh_sound = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/whoosh_2.wav")
 
         # Only load the level intro voice in a level because in GameIntroView,
         # level number is 0
-        if isinstance(self.view, Level):
-            self.level_intro_voice = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/level_"
-                                                  f"{self.view.window.level_number}_voice.wav")
+        if self.is_level_intro:
+            self.level_intro_voice = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/level_"
+                                                      f"{self.view.window.level_number}_voice.wav")
+            self.level_info_text = TextSprite(f"Level {self.view.window.level_number:02}", SCREEN_WIDTH / 2,
+                                              -SCREEN_HEIGHT / 2, LEVEL_INFO_TEXT)
 
         self.first_whoosh_sound_played = False
         self.second_whoosh_sound_played = False
@@ -1529,8 +1614,7 @@ class BouncingIntroView(arcade.View):
         self.elapsed_time += delta_time
 
         # Pause for a while before bouncing in a level view
-        if isinstance(self.view, GameIntroView) or isinstance(self.view, Level) and \
-                self.elapsed_time > PAUSE_TIME + TRANSITION_TIME * 2:
+        if not self.is_level_intro or self.elapsed_time > PAUSE_TIME + TRANSITION_TIME * 2:
             self.bottom += self.change_y
             self.change_y += GRAVITY
 
@@ -1547,17 +1631,19 @@ class BouncingIntroView(arcade.View):
                 else:
                     self.bounce_sound_1.play(volume=NORMAL_VOLUME)
 
-        arcade.set_viewport(0, SCREEN_WIDTH, self.bottom, self.bottom + SCREEN_HEIGHT)
+        # The screen stays still while the level info is shown, so only move the viewport when it changes
+        if self.bottom != self.viewport_bottom:
+            arcade.set_viewport(0, SCREEN_WIDTH, self.bottom, self.bottom + SCREEN_HEIGHT)
+            self.viewport_bottom = self.bottom
 
     def on_draw(self):
         self.view.on_draw()
 
         # Only draw this when we are in a level
-        if isinstance(self.view, Level) and TRANSITION_TIME <= self.elapsed_time < PAUSE_TIME + TRANSITION_TIME:
+        if self.is_level_intro and TRANSITION_TIME <= self.elapsed_time < PAUSE_TIME + TRANSITION_TIME:
             arcade.draw_scaled_texture_rectangle(SCREEN_WIDTH / 2, -SCREEN_HEIGHT / 2,
                                                  self.view.level_info_boundary)
-            arcade.draw_text(f"Level {self.view.window.level_number:02}", SCREEN_WIDTH / 2,
-                             -SCREEN_HEIGHT / 2, **LEVEL_INFO_TEXT)
+            self.level_info_text.draw()
 
             # Play the first whoosh sound and voice as we start displaying the level info text
             if not self.first_whoosh_sound_played:
@@ -1566,7 +1652,7 @@ class BouncingIntroView(arcade.View):
                 self.first_whoosh_sound_played = True
 
         # Play the second whoosh sound as we stop displaying level info text
-        elif isinstance(self.view, Level) and self.elapsed_time >= PAUSE_TIME + TRANSITION_TIME:
+        elif self.is_level_intro and self.elapsed_time >= PAUSE_TIME + TRANSITION_TIME:
             if not self.second_whoosh_sound_played:
                 self.level_intro_whoosh_sound.play(volume=NORMAL_VOLUME)
                 self.second_whoosh_sound_played = True
@@ -1584,7 +1670,7 @@ class LevelOutroView(arcade.View):
         self.level = level
         self.bottom = 0
         self.change_y = 2
-        self.level_up_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/level_up_sound.wav")
+        self.level_up_sound = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/level_up_sound.wav")
 
     def on_show(self):
         arcade.set_background_color(arcade.color.BLACK)
@@ -1600,14 +1686,15 @@ class LevelOutroView(arcade.View):
         # Once we move out of view, try and load the next level
         # (Screen height * 2 allows some pausing time before loading next level)
         if self.bottom >= SCREEN_HEIGHT * 2:
-            try:
-                level = eval(f"Level{self.level.window.level_number + 1}(self.window)")
+            # The current level number is the index of the next level
+            if self.level.window.level_number < len(LEVEL_TYPES):
+                level = LEVEL_TYPES[self.level.window.level_number](self.window)
                 self.window.show_view(level)
 
             # Next level does not exist
-            except NameError:
+            else:
                 # Check if we can get into the high scores list
-                if self.level.window.score > HIGH_SCORES[-1].score:
+                if self.level.window.score > LOWEST_HIGH_SCORE:
                     self.window.show_view(NameEntryView(self.window))
                 else:
                     self.window.show_view(HighScoreView(self.window))
@@ -1679,10 +1766,6 @@ class FullscreenView(arcade.View):
         """
         self.ball_list.on_update()
 
-        # Loop the background music
-        if self.background_music.get_stream_position() == 0:
-            self.background_music.play(volume=NORMAL_VOLUME)
-
     def on_draw(self):
         arcade.start_render()
 
@@ -1705,8 +1788,8 @@ class GameIntroView(FullscreenView):
         self.add_random_balls()
 
         self.elapsed_time = 0
-        self.background_music = arcade.Sound(f"{AUDIO_BASE_PATH}/background_music/game_intro_music.mp3",
-                                             streaming=True)
+        self.background_music = assets.load_background_music(f"{AUDIO_BASE_PATH}/background_music/"
+                                                             f"game_intro_music.mp3")
 
     def on_show(self):
         arcade.set_background_color(arcade.color.BLACK)
@@ -1743,9 +1826,16 @@ class MainMenuView(FullscreenView):
         self.options = ["New Game", "How To Play", "High Scores", "Quit"]
         self.brick_list.append(assets.MenuBrick(center_x=SCREEN_WIDTH / 2,
                                                 center_y=SCREEN_HEIGHT / 2))
+
+        # Heading and options are rendered once. Options are only rendered again when selected or deselected
+        self.text_list = arcade.SpriteList()
+        self.text_list.append(TextSprite("Main Menu", SCREEN_WIDTH / 2, SCREEN_HEIGHT - 250, MENU_TEXT_HEADING))
+        self.option_texts = [TextSprite(text, SCREEN_WIDTH / 2, SCREEN_HEIGHT - 350 - index * 85, MENU_TEXT_NORMAL)
+                             for index, text in enumerate(self.options)]
+        self.text_list.extend(self.option_texts)
         self.add_random_balls()
-        self.background_music = arcade.Sound(f"{AUDIO_BASE_PATH}/background_music/main_menu_music.mp3",
-                                             streaming=True)
+        self.background_music = assets.load_background_music(f"{AUDIO_BASE_PATH}/background_music/"
+                                                             f"main_menu_music.mp3")
 
     def on_update(self, delta_time: float):
         """
@@ -1756,38 +1846,33 @@ class MainMenuView(FullscreenView):
 
         # If we have paused for enough time, display a random demo level
         if self.elapsed_time > DEMO_LEVEL_TIME / 2:
-            level_number = random.randrange(1, 31)  # Include level 30 TODO: Generalize this (not 30, 31, etc)
-            level = eval(f"Level{level_number}(self.window, is_demo_level=True)")
+            level = random.choice(LEVEL_TYPES)(self.window, is_demo_level=True)
             self.window.show_view(level)
             WHOOSH_SOUND.play(volume=NORMAL_VOLUME)
 
     def on_draw(self):
         super().on_draw()
 
-        # Draw main menu heading
-        arcade.draw_text("Main Menu", SCREEN_WIDTH / 2, SCREEN_HEIGHT - 250, **MENU_TEXT_HEADING)
-
         # Selection options
-        for index, text in enumerate(self.options):
+        for index, option_text in enumerate(self.option_texts):
             if index == self.selected:
                 style = MENU_TEXT_SELECTED
             else:
                 style = MENU_TEXT_NORMAL
 
-            arcade.draw_text(text, SCREEN_WIDTH / 2, SCREEN_HEIGHT - 350 - index * 85, **style)
+            option_text.update_text(option_text.text, style)
+
+        # Main menu heading and options
+        self.text_list.draw()
 
     def on_key_press(self, symbol: int, modifiers: int):
         if symbol == arcade.key.DOWN:
             SCROLL_SOUND.play(volume=NORMAL_VOLUME)
-            self.selected += 1
-            if self.selected >= len(self.options):
-                self.selected = 0
+            self.selected = (self.selected + 1) % len(self.options)
 
         elif symbol == arcade.key.UP:
             SCROLL_SOUND.play(volume=NORMAL_VOLUME)
-            self.selected -= 1
-            if self.selected < 0:
-                self.selected = len(self.options) - 1
+            self.selected = (self.selected - 1) % len(self.options)
 
         elif symbol == arcade.key.ENTER:
             ENTER_SOUND.play(volume=NORMAL_VOLUME)
@@ -1833,10 +1918,29 @@ class HighScoreView(FullscreenView):
         self.high_scores_brick.top = self.boundary.inner_top - self.leader_board_brick.height - spacing * 2
         self.brick_list.append(self.high_scores_brick)
 
+        # The leader board does not change while it is shown, so all of its text is rendered once
+        left = self.high_scores_brick.left
+        right = self.high_scores_brick.right
+        top = self.high_scores_brick.top
+        self.text_list = arcade.SpriteList()
+        self.text_list.append(TextSprite("Leader Board", SCREEN_WIDTH / 2, self.leader_board_brick.center_y,
+                                         LEADER_BOARD_HEADING))
+        self.text_list.append(TextSprite("Name", left + 160, top - 40, HIGH_SCORES_HEADING))
+        self.text_list.append(TextSprite("Level", right - 320, top - 40, HIGH_SCORES_HEADING))
+        self.text_list.append(TextSprite("Score", right - 120, top - 40, HIGH_SCORES_HEADING))
+
+        # Use index for positioning text
+        for index, entry in enumerate(HIGH_SCORES):
+            y = top - 90 - 40 * index
+            self.text_list.append(TextSprite(f"{index + 1}", left + 60, y, HIGH_SCORES_NUMBERS))
+            self.text_list.append(TextSprite(entry.name, left + 110, y, HIGH_SCORES_NAMES))
+            self.text_list.append(TextSprite(entry.level, right - 300, y, HIGH_SCORES_NUMBERS))
+            self.text_list.append(TextSprite(f"{entry.score:,}", right - 60, y, HIGH_SCORES_NUMBERS))
+
         self.add_random_balls()
-        self.new_high_score_voice = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/high_score_voice.wav")
-        self.background_music = arcade.Sound(f"{AUDIO_BASE_PATH}/background_music/high_scores_music.mp3",
-                                             streaming=True)
+        self.new_high_score_voice = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/high_score_voice.wav")
+        self.background_music = assets.load_background_music(f"{AUDIO_BASE_PATH}/background_music/"
+                                                             f"high_scores_music.mp3")
 
     def on_show(self):
         arcade.set_background_color(arcade.color.BLACK)
@@ -1848,26 +1952,7 @@ class HighScoreView(FullscreenView):
 
     def on_draw(self):
         super().on_draw()
-
-        arcade.draw_text("Leader Board", SCREEN_WIDTH / 2, self.leader_board_brick.center_y,
-                         **LEADER_BOARD_HEADING)
-        arcade.draw_text("Name", self.high_scores_brick.left + 160, self.high_scores_brick.top - 40,
-                         **HIGH_SCORES_HEADING)
-        arcade.draw_text("Level", self.high_scores_brick.right - 320, self.high_scores_brick.top - 40,
-                         **HIGH_SCORES_HEADING)
-        arcade.draw_text("Score", self.high_scores_brick.right - 120, self.high_scores_brick.top - 40,
-                         **HIGH_SCORES_HEADING)
-
-        # Use index for positioning text
-        for index, entry in enumerate(HIGH_SCORES):
-            arcade.draw_text(f"{index + 1}", self.high_scores_brick.left + 60,
-                             self.high_scores_brick.top - 90 - 40 * index, **HIGH_SCORES_NUMBERS)
-            arcade.draw_text(entry.name, self.high_scores_brick.left + 110,
-                             self.high_scores_brick.top - 90 - 40 * index, **HIGH_SCORES_NAMES)
-            arcade.draw_text(entry.level, self.high_scores_brick.right - 300,
-                             self.high_scores_brick.top - 90 - 40 * index, **HIGH_SCORES_NUMBERS)
-            arcade.draw_text(f"{entry.score:,}", self.high_scores_brick.right - 60,
-                             self.high_scores_brick.top - 90 - 40 * index, **HIGH_SCORES_NUMBERS)
+        self.text_list.draw()
 
     def on_key_press(self, symbol: int, modifiers: int):
         # Enter or Escape
@@ -1905,7 +1990,7 @@ class NameEntryView(arcade.View):
         self.border_list = arcade.SpriteList(is_static=True)
         self.border_list.append(arcade.Sprite(f"{IMAGES_BASE_PATH}/boundaries/confirmation_dialogue_boundary.png",
                                               center_x=SCREEN_WIDTH / 2, center_y=SCREEN_HEIGHT / 2))
-        self.invalid_name_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/invalid_name_tone.wav")
+        self.invalid_name_sound = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/invalid_name_tone.wav")
 
     def on_show(self):
         arcade.set_background_color(arcade.color.BLACK)
@@ -1927,7 +2012,7 @@ class NameEntryView(arcade.View):
             self.name_entry_box._focused = True
 
     def on_key_press(self, symbol: int, modifiers: int):
-        global HIGH_SCORES
+        global HIGH_SCORES, LOWEST_HIGH_SCORE
 
         # Enter
         if symbol == arcade.key.ENTER:
@@ -1937,14 +2022,13 @@ class NameEntryView(arcade.View):
             if 1 <= len(name) <= 15:
                 ENTER_SOUND.play(volume=NORMAL_VOLUME)
 
-                # Append a new entry in the high scores file
-                with open(HIGH_SCORES_FILE, mode="a") as high_scores_file:
-                    high_scores_file.write(f"{name},{self.window.level_number},{self.window.score},"
-                                           f"{time.asctime()}\n")
+                # Add a new entry in the high scores database
+                high_scores.add_high_score(HIGH_SCORES_CONNECTION, name, self.window.level_number, self.window.score)
 
                 # Remove the input box and reset the high scores list
                 self.ui_manager.purge_ui_elements()
-                HIGH_SCORES = get_high_scores()
+                HIGH_SCORES = high_scores.get_high_scores(HIGH_SCORES_CONNECTION)
+                LOWEST_HIGH_SCORE = HIGH_SCORES[-1].score
 
                 # If we have a new high score, play the high score voice
                 high_score_view = HighScoreView(self.window, new_high_score=True) if \
@@ -1975,10 +2059,11 @@ class HowToPlayView(arcade.View):
         self.view = view
 
         self.page = 0
+        self.pages = (self.draw_page_0, self.draw_page_1, self.draw_page_2, self.draw_page_3)
         self.boundary = FullscreenBoundary()
-        self.invalid_page_sound = arcade.Sound(f"{AUDIO_BASE_PATH}/sounds/no_next_item_tone.wav")
-        self.background_music = arcade.Sound(f"{AUDIO_BASE_PATH}/background_music/how_to_play_music.mp3",
-                                             streaming=True)
+        self.invalid_page_sound = assets.get_sound(f"{AUDIO_BASE_PATH}/sounds/no_next_item_tone.wav")
+        self.background_music = assets.load_background_music(f"{AUDIO_BASE_PATH}/background_music/"
+                                                             f"how_to_play_music.mp3")
 
         self.center_x = SCREEN_WIDTH / 2
         self.line_width = 40  # Pixels from one line to another
@@ -2032,6 +2117,77 @@ class HowToPlayView(arcade.View):
         for index, IconType in enumerate([LIFE, SAFETY, ADVANCE, SPEED, SLOW, INVINCIBLE]):
             self.icon_list_2.append(IconType(center_x=200, center_y=SCREEN_HEIGHT - 170 - index * 100))
 
+        # The text on the pages never changes, so it is rendered once and each page draws its own list
+        back_text = TextSprite("<Back", 200, 100, HOW_TO_PLAY_NEXT_BACK)
+        next_text = TextSprite("Next>", SCREEN_WIDTH - 200, 100, HOW_TO_PLAY_NEXT_BACK)
+        self.text_list_0 = arcade.SpriteList()
+        self.text_list_1 = arcade.SpriteList()
+        self.text_list_2 = arcade.SpriteList()
+        self.text_list_3 = arcade.SpriteList()
+
+        # Instructions page
+        self.text_list_0.append(TextSprite("Instructions", self.center_x, SCREEN_HEIGHT - 100, MENU_TEXT_HEADING))
+        self.text_list_0.append(TextSprite(
+            "1. Break all the bricks to advance to the next level.\n    Bonus score of "
+            "100 is added for every life.\n\n2. Move the paddle using the left and right "
+            "arrow keys\n    to prevent the ball from falling. If the ball falls, you\n    "
+            "lose a life.\n\n3. Control the direction of the ball based on which side\n    "
+            "it lands on the paddle. If it lands on the left, it will\n    bounce to the left "
+            "and vice versa. Also, the ball\n    increases speed when it bounces farther away "
+            "from the\n    centre of the paddle.\n\n4. Collect icons that fall from the bricks "
+            "to give your\n    paddle special powers. However, if you lose a life,\n    your "
+            "paddle loses any special powers that it had.", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2,
+            {**HOW_TO_PLAY_TEXT, "width": 1200}))
+        self.text_list_0.append(next_text)
+
+        # Bricks page
+        self.text_list_1.append(TextSprite("Bricks", self.center_x, SCREEN_HEIGHT - 100, MENU_TEXT_HEADING))
+        self.text_list_1.append(TextSprite(
+            "These are normal bricks. The top\nrow score 100 each, the rest 150.",
+            SCREEN_WIDTH - 500, SCREEN_HEIGHT - 215, {**HOW_TO_PLAY_TEXT, "width": 750}))
+        self.text_list_1.append(TextSprite(
+            "Some bricks need to be hit more than\nonce to destroy them. Each hit earns\nyou "
+            "200 points.", SCREEN_WIDTH - 550, SCREEN_HEIGHT - 330, {**HOW_TO_PLAY_TEXT, "width": 800}))
+        self.text_list_1.append(TextSprite(
+            "The ones with the pretty pictures\nare worth 250 points each.",
+            SCREEN_WIDTH - 500, SCREEN_HEIGHT - 455, {**HOW_TO_PLAY_TEXT, "width": 750}))
+        self.text_list_1.append(TextSprite("This type only gives you 50 points per hit.", 710, SCREEN_HEIGHT - 530,
+                                           HOW_TO_PLAY_TEXT))
+        self.text_list_1.append(TextSprite("No amount of battering can break this block.", 740, SCREEN_HEIGHT - 590,
+                                           HOW_TO_PLAY_TEXT))
+        self.text_list_1.append(TextSprite(
+            "Collect these in the right order\nand earn 5,000 points! Otherwise,\nonly "
+            "2,000 extra.", SCREEN_WIDTH - 500, 180, {**HOW_TO_PLAY_TEXT, "width": 750}))
+        self.text_list_1.append(back_text)
+        self.text_list_1.append(next_text)
+
+        # First icons page
+        self.text_list_2.append(TextSprite("Icons", self.center_x, SCREEN_HEIGHT - 90, MENU_TEXT_HEADING))
+        self.text_list_2.append(TextSprite(
+            "This icon increases the size of your paddle, allowing\nyou to reach balls "
+            "faster.\n\nIf you are unfortunate enough to catch this icon,\nyour paddle "
+            "will shrink in size.\n\nCollect this icon to get 5,000 bonus points added\nto "
+            "your score!\n\nThis icon allows you to complete a level faster by\nshooting the "
+            "bricks. Press SPACE to shoot.\n\nThis icon splits into 2 the next three "
+            "balls that hit\nyour paddle.\n\nIf you manage to capture this icon, your paddle "
+            "will\nbecome magnetic, allowing you to reposition the ball.\nPress SPACE to "
+            "release.", SCREEN_WIDTH / 2 + 50, SCREEN_HEIGHT / 2, {**HOW_TO_PLAY_TEXT, "width": 1100}))
+        self.text_list_2.append(back_text)
+        self.text_list_2.append(next_text)
+
+        # Second icons page
+        self.text_list_3.append(TextSprite("Icons", self.center_x, SCREEN_HEIGHT - 90, MENU_TEXT_HEADING))
+        self.text_list_3.append(TextSprite(
+            "A very useful icon to catch. This adds you an extra\nlife in the game.\n\nThis "
+            "icon gives you a safety barrier that prevents\nthe ball from falling - but only "
+            "once.\n\nIf the current level is too tricky for you, catch this\nicon to advance "
+            "to the next level.\n\nAll the balls will speed up if you are unfortunate\nenough to "
+            "catch this icon.\n\nThis helpful icon slows down all the balls to a more\nmanageable "
+            "speed.\n\nThis cool icon makes the ball invincible for the next\n3 hits, allowing it "
+            "to pass straight through the\nbricks - but only breakable ones.",
+            SCREEN_WIDTH / 2 + 50, SCREEN_HEIGHT / 2, {**HOW_TO_PLAY_TEXT, "width": 1100}))
+        self.text_list_3.append(back_text)
+
     def on_show(self):
         arcade.set_background_color(arcade.color.BLACK)
         self.background_music.play(volume=NORMAL_VOLUME)
@@ -2044,99 +2200,47 @@ class HowToPlayView(arcade.View):
         """
         Draws the Instructions page
         """
-        arcade.draw_text("Instructions", self.center_x, SCREEN_HEIGHT - 100, **MENU_TEXT_HEADING)
-        arcade.draw_text("1. Break all the bricks to advance to the next level.\n    Bonus score of "
-                         "100 is added for every life.\n\n2. Move the paddle using the left and right "
-                         "arrow keys\n    to prevent the ball from falling. If the ball falls, you\n    "
-                         "lose a life.\n\n3. Control the direction of the ball based on which side\n    "
-                         "it lands on the paddle. If it lands on the left, it will\n    bounce to the left "
-                         "and vice versa. Also, the ball\n    increases speed when it bounces farther away "
-                         "from the\n    centre of the paddle.\n\n4. Collect icons that fall from the bricks "
-                         "to give your\n    paddle special powers. However, if you lose a life,\n    your "
-                         "paddle loses any special powers that it had.", SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2,
-                         **HOW_TO_PLAY_TEXT, width=1200)
-        arcade.draw_text("Next>", SCREEN_WIDTH - 200, 100, **HOW_TO_PLAY_NEXT_BACK)
+        self.text_list_0.draw()
 
     def draw_page_1(self):
         """
         Draws the Bricks page
         """
-        arcade.draw_text("Bricks", self.center_x, SCREEN_HEIGHT - 100, **MENU_TEXT_HEADING)
         self.brick_list.draw()
-
-        arcade.draw_text("These are normal bricks. The top\nrow score 100 each, the rest 150.",
-                         SCREEN_WIDTH - 500, SCREEN_HEIGHT - 215, **HOW_TO_PLAY_TEXT, width=750)
-        arcade.draw_text("Some bricks need to be hit more than\nonce to destroy them. Each hit earns\nyou "
-                         "200 points.", SCREEN_WIDTH - 550, SCREEN_HEIGHT - 330, **HOW_TO_PLAY_TEXT,
-                         width=800)
-        arcade.draw_text("The ones with the pretty pictures\nare worth 250 points each.",
-                         SCREEN_WIDTH - 500, SCREEN_HEIGHT - 455, **HOW_TO_PLAY_TEXT, width=750)
-        arcade.draw_text("This type only gives you 50 points per hit.", 710, SCREEN_HEIGHT - 530,
-                         **HOW_TO_PLAY_TEXT)
-        arcade.draw_text("No amount of battering can break this block.", 740, SCREEN_HEIGHT - 590,
-                         **HOW_TO_PLAY_TEXT)
-        arcade.draw_text("Collect these in the right order\nand earn 5,000 points! Otherwise,\nonly "
-                         "2,000 extra.", SCREEN_WIDTH - 500, 180, **HOW_TO_PLAY_TEXT, width=750)
-
-        arcade.draw_text("<Back", 200, 100, **HOW_TO_PLAY_NEXT_BACK)
-        arcade.draw_text("Next>", SCREEN_WIDTH - 200, 100, **HOW_TO_PLAY_NEXT_BACK)
+        self.text_list_1.draw()
 
     def draw_page_2(self):
         """
         Draws the first Icons page
         """
-        arcade.draw_text("Icons", self.center_x, SCREEN_HEIGHT - 90, **MENU_TEXT_HEADING)
-
-        self.icon_list_1.update_animation()
         self.icon_list_1.draw()
-        arcade.draw_text("This icon increases the size of your paddle, allowing\nyou to reach balls "
-                         "faster.\n\nIf you are unfortunate enough to catch this icon,\nyour paddle "
-                         "will shrink in size.\n\nCollect this icon to get 5,000 bonus points added\nto "
-                         "your score!\n\nThis icon allows you to complete a level faster by\nshooting the "
-                         "bricks. Press SPACE to shoot.\n\nThis icon splits into 2 the next three "
-                         "balls that hit\nyour paddle.\n\nIf you manage to capture this icon, your paddle "
-                         "will\nbecome magnetic, allowing you to reposition the ball.\nPress SPACE to "
-                         "release.", SCREEN_WIDTH / 2 + 50, SCREEN_HEIGHT / 2,
-                         **HOW_TO_PLAY_TEXT, width=1100)
-
-        arcade.draw_text("<Back", 200, 100, **HOW_TO_PLAY_NEXT_BACK)
-        arcade.draw_text("Next>", SCREEN_WIDTH - 200, 100, **HOW_TO_PLAY_NEXT_BACK)
+        self.text_list_2.draw()
 
     def draw_page_3(self):
         """
         Draws the second Icons page
         """
-        arcade.draw_text("Icons", self.center_x, SCREEN_HEIGHT - 90, **MENU_TEXT_HEADING)
-
-        self.icon_list_2.update_animation()
         self.icon_list_2.draw()
-        arcade.draw_text("A very useful icon to catch. This adds you an extra\nlife in the game.\n\nThis "
-                         "icon gives you a safety barrier that prevents\nthe ball from falling - but only "
-                         "once.\n\nIf the current level is too tricky for you, catch this\nicon to advance "
-                         "to the next level.\n\nAll the balls will speed up if you are unfortunate\nenough to "
-                         "catch this icon.\n\nThis helpful icon slows down all the balls to a more\nmanageable "
-                         "speed.\n\nThis cool icon makes the ball invincible for the next\n3 hits, allowing it "
-                         "to pass straight through the\nbricks - but only breakable ones.",
-                         SCREEN_WIDTH / 2 + 50, SCREEN_HEIGHT / 2, **HOW_TO_PLAY_TEXT, width=1100)
-
-        arcade.draw_text("<Back", 200, 100, **HOW_TO_PLAY_NEXT_BACK)
+        self.text_list_3.draw()
 
     def on_update(self, delta_time: float):
-        # Loop the background music
-        if self.background_music.get_stream_position() == 0:
-            self.background_music.play(volume=NORMAL_VOLUME)
+        # Only animate the icons on the page being shown
+        if self.page == 2:
+            self.icon_list_1.update_animation()
+        elif self.page == 3:
+            self.icon_list_2.update_animation()
 
     def on_draw(self):
         arcade.start_render()
 
         self.boundary.draw()  # Must be drawn first because of black background
-        eval(f"self.draw_page_{self.page}()")
+        self.pages[self.page]()
 
     def on_key_press(self, symbol: int, modifiers: int):
         # Right
         if symbol == arcade.key.RIGHT:
             # Check if there is a next page
-            if hasattr(self, f"draw_page_{self.page + 1}"):
+            if self.page + 1 < len(self.pages):
                 self.page += 1
                 SCROLL_SOUND.play(volume=NORMAL_VOLUME)
 
@@ -2147,7 +2251,7 @@ class HowToPlayView(arcade.View):
         # Left
         elif symbol == arcade.key.LEFT:
             # Check if there is a next page
-            if hasattr(self, f"draw_page_{self.page - 1}"):
+            if self.page > 0:
                 self.page -= 1
                 SCROLL_SOUND.play(volume=NORMAL_VOLUME)
 
@@ -2168,8 +2272,16 @@ class PauseMenuView(arcade.View):
         self.selected = 0
         self.options = ["Continue", "New Game", "How To Play", "Main Menu"]
         self.border = arcade.load_texture(f"{IMAGES_BASE_PATH}/boundaries/menu_boundary.png")
-        self.background_music = arcade.Sound(f"{AUDIO_BASE_PATH}/background_music/pause_menu_music.mp3",
-                                             streaming=True)
+
+        # Heading and options are rendered once. Options are only rendered again when selected or deselected
+        center_x = self.level.boundary.center_x
+        self.text_list = arcade.SpriteList()
+        self.text_list.append(TextSprite("Paused", center_x, SCREEN_HEIGHT - 250, MENU_TEXT_HEADING))
+        self.option_texts = [TextSprite(text, center_x, SCREEN_HEIGHT - 350 - index * 85, MENU_TEXT_NORMAL)
+                             for index, text in enumerate(self.options)]
+        self.text_list.extend(self.option_texts)
+        self.background_music = assets.load_background_music(f"{AUDIO_BASE_PATH}/background_music/"
+                                                             f"pause_menu_music.mp3")
 
     def on_show(self):
         arcade.set_background_color(arcade.color.BLACK)
@@ -2178,11 +2290,6 @@ class PauseMenuView(arcade.View):
     def on_hide_view(self):
         self.background_music.stop()
 
-    def on_update(self, delta_time: float):
-        # Loop the background music
-        if self.background_music.get_stream_position() == 0:
-            self.background_music.play(volume=NORMAL_VOLUME)
-
     def on_draw(self):
         # Level background
         self.level.on_draw()
@@ -2190,21 +2297,21 @@ class PauseMenuView(arcade.View):
         # Draws a dark filter on the level background
         arcade.draw_xywh_rectangle_filled(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT, (0, 0, 0, 100))
 
-        # Draws the border and heading
+        # Draws the border
         arcade.draw_scaled_texture_rectangle(self.level.boundary.center_x, self.level.boundary.center_y,
                                              self.border)
-        arcade.draw_text("Paused", self.level.boundary.center_x, SCREEN_HEIGHT - 250,
-                         **MENU_TEXT_HEADING)
 
         # Selection options
-        for index, text in enumerate(self.options):
+        for index, option_text in enumerate(self.option_texts):
             if index == self.selected:
                 style = MENU_TEXT_SELECTED
             else:
                 style = MENU_TEXT_NORMAL
 
-            arcade.draw_text(text, self.level.boundary.center_x, SCREEN_HEIGHT - 350 - index * 85,
-                             **style)
+            option_text.update_text(option_text.text, style)
+
+        # Heading and options
+        self.text_list.draw()
 
     def on_key_press(self, symbol: int, modifiers: int):
         # Escape
@@ -2215,16 +2322,12 @@ class PauseMenuView(arcade.View):
         # Down
         elif symbol == arcade.key.DOWN:
             SCROLL_SOUND.play(volume=NORMAL_VOLUME)
-            self.selected += 1
-            if self.selected >= len(self.options):
-                self.selected = 0
+            self.selected = (self.selected + 1) % len(self.options)
 
         # Up
         elif symbol == arcade.key.UP:
             SCROLL_SOUND.play(volume=NORMAL_VOLUME)
-            self.selected -= 1
-            if self.selected < 0:
-                self.selected = len(self.options) - 1
+            self.selected = (self.selected - 1) % len(self.options)
 
         # Enter
         elif symbol == arcade.key.ENTER:
@@ -2280,6 +2383,17 @@ class ConfirmationDialogueView(arcade.View, ABC):
         self.text2 = action_text + "?"
         self.text3 = "All progress will be lost!"
 
+        # Text is rendered once. Sub-classes may override the texts above, so on_draw updates the
+        # sprites with the current texts, which only renders them again if they have changed
+        self.text_sprites = [TextSprite(self.text1, self.center_x, self.center_y + 90, CONFIRMATION_DIALOGUE_TEXT),
+                             TextSprite(self.text2, self.center_x, self.center_y + 50, CONFIRMATION_DIALOGUE_TEXT),
+                             TextSprite(self.text3, self.center_x, self.center_y - 10, CONFIRMATION_DIALOGUE_TEXT)]
+        self.option_texts = [TextSprite(text, self.center_x - 150 + index * 300, self.center_y - 80, MENU_TEXT_NORMAL)
+                             for index, text in enumerate(self.options)]
+        self.text_list = arcade.SpriteList()
+        self.text_list.extend(self.text_sprites)
+        self.text_list.extend(self.option_texts)
+
     @abstractmethod
     def yes_command(self):
         """
@@ -2299,31 +2413,28 @@ class ConfirmationDialogueView(arcade.View, ABC):
 
         arcade.draw_scaled_texture_rectangle(self.center_x, self.center_y, self.border)
 
-        arcade.draw_text(self.text1, self.center_x, self.center_y + 90, **CONFIRMATION_DIALOGUE_TEXT)
-        arcade.draw_text(self.text2, self.center_x, self.center_y + 50, **CONFIRMATION_DIALOGUE_TEXT)
-        arcade.draw_text(self.text3, self.center_x, self.center_y - 10, **CONFIRMATION_DIALOGUE_TEXT)
+        for text_sprite, text in zip(self.text_sprites, (self.text1, self.text2, self.text3)):
+            text_sprite.update_text(text)
 
         # Selection options
-        for index, text in enumerate(self.options):
+        for index, option_text in enumerate(self.option_texts):
             if index == self.selected:
                 style = MENU_TEXT_SELECTED
             else:
                 style = MENU_TEXT_NORMAL
 
-            arcade.draw_text(text, self.center_x - 150 + index * 300, self.center_y - 80, **style)
+            option_text.update_text(option_text.text, style)
+
+        self.text_list.draw()
 
     def on_key_press(self, symbol: int, modifiers: int):
         if symbol == arcade.key.RIGHT:
             SCROLL_SOUND.play(volume=NORMAL_VOLUME)
-            self.selected += 1
-            if self.selected >= len(self.options):
-                self.selected = 0
+            self.selected = (self.selected + 1) % len(self.options)
 
         elif symbol == arcade.key.LEFT:
             SCROLL_SOUND.play(volume=NORMAL_VOLUME)
-            self.selected -= 1
-            if self.selected < 0:
-                self.selected = len(self.options) - 1
+            self.selected = (self.selected - 1) % len(self.options)
 
         elif symbol == arcade.key.ENTER:
             ENTER_SOUND.play(volume=NORMAL_VOLUME)
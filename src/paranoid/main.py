@@ -7,6 +7,7 @@ Start date: 10th Aug 2020
 """
 
 import arcade
+import paranoid.assets as assets
 import paranoid.levels as levels
 
 
@@ -15,10 +16,10 @@ class ParanoidGame(arcade.Window):
         super().__init__(fullscreen=True)
 
         # Initialize the game variables
-        self.score = 0
-        self.lives = 3
-        self.level_number = 0
-        self.display_score = 0
+        self.reset_game()
+
+        # Load all sprite textures and sounds up front rather than when each one is first used
+        assets.preload_assets()
 
         self.show_view(levels.GameIntroView(self))
         # self.show_view(levels.MainMenuView(self))
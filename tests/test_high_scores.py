@@ -0,0 +1,86 @@
+import sqlite3
+import tempfile
+import unittest
+
+from pathlib import Path
+
+from paranoid import high_scores
+
+
+class OpenHighScoresTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.database = Path(directory.name) / "high_scores.db"
+        self.old_file = Path(directory.name) / "high_scores.txt"
+
+    def open_high_scores(self):
+        connection = high_scores.open_high_scores(self.database, self.old_file)
+        self.addCleanup(connection.close)
+        return connection
+
+    def test_carries_old_scores_over(self):
+        self.old_file.write_text("name,level,score,datetime\n"
+                                 "Freddy,5,50000,Mon Aug 10 10:00:00 2020\n"
+                                 "A, B,3,20000,Tue Aug 11 10:00:00 2020\n")
+
+        entries = high_scores.get_high_scores(self.open_high_scores())
+
+        self.assertEqual(entries, [("Freddy", "5", 50000), ("A, B", "3", 20000)])
+
+    def test_skips_blank_and_malformed_lines(self):
+        self.old_file.write_text("name,level,score,datetime\n"
+                                 "Freddy,5,50000,Mon Aug 10 10:00:00 2020\n"
+                                 "\n"
+                                 "BBB,5\n"
+                                 "BBB,five,45000,Mon Aug 10 10:00:00 2020\n"
+                                 "BBB,4,40000,Mon Aug 10 10:00:00 2020\n"
+                                 "\n")
+
+        entries = high_scores.get_high_scores(self.open_high_scores())
+
+        self.assertEqual(entries, [("Freddy", "5", 50000), ("BBB", "4", 40000)])
+
+    def test_uses_default_scores_without_old_file(self):
+        entries = high_scores.get_high_scores(self.open_high_scores())
+
+        self.assertEqual(len(entries), 10)
+        self.assertEqual(entries[0].score, 50000)
+
+    def test_uses_default_scores_if_no_old_line_can_be_read(self):
+        self.old_file.write_text("name,level,score,datetime\n\n")
+
+        entries = high_scores.get_high_scores(self.open_high_scores())
+
+        self.assertEqual(len(entries), 10)
+
+    def test_failed_migration_keeps_nothing_and_runs_again(self):
+        # A byte that cannot be decoded makes reading the old file fail after the table is created
+        self.old_file.write_bytes(b"name,level,score,datetime\n\x81\n")
+        with self.assertRaises(UnicodeDecodeError):
+            high_scores.open_high_scores(self.database, self.old_file)
+
+        with sqlite3.connect(self.database) as connection:
+            tables = connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        self.assertEqual(tables, [])
+
+        self.old_file.write_text("name,level,score,datetime\nFreddy,5,50000,Mon Aug 10 10:00:00 2020\n")
+        entries = high_scores.get_high_scores(self.open_high_scores())
+
+        self.assertEqual(entries, [("Freddy", "5", 50000)])
+
+    def test_fills_database_left_with_empty_table(self):
+        with sqlite3.connect(self.database) as connection:
+            connection.execute("CREATE TABLE scores (name TEXT, level INTEGER, score INTEGER, datetime TEXT)")
+        connection.close()
+        self.old_file.write_text("name,level,score,datetime\nFreddy,5,50000,Mon Aug 10 10:00:00 2020\n")
+
+        entries = high_scores.get_high_scores(self.open_high_scores())
+
+        self.assertEqual(entries, [("Freddy", "5", 50000)])
+
+    def test_added_score_is_kept(self):
+        connection = self.open_high_scores()
+        high_scores.add_high_score(connection, "Player", 7, 60000)
+
+        self.assertEqual(high_scores.get_high_scores(connection)[0], ("Player", "7", 60000))